@@ -0,0 +1,97 @@
+"""
+Benchmark of the local filter_expression evaluator.
+
+Builds synthetic VDB inventory records and times one pass of each filter
+over all of them, plus the cost of compiling a filter before and after it
+is memoized. The records are generated from a fixed seed, so runs are
+comparable across changes.
+
+Usage::
+
+    python benchmarks/filters_benchmark.py [--records 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from dct_mcp_server.core.filters import _compile_canonical, compile_filter, parse_filter  # noqa: E402
+from dct_mcp_server.inventory.index import FieldSchema, InventoryRecord  # noqa: E402
+
+FILTERS = (
+    "status EQ 'RUNNING'",
+    "name CONTAINS 'prod'",
+    "size GT 500000 AND status NE 'FAILED'",
+    "engine_id IN ('eng-1', 'eng-3', 'eng-5')",
+    "creation_date GE '2024-06-01' AND (status EQ 'RUNNING' OR name CONTAINS 'dev')",
+    "tags.value EQ 'c'",
+)
+
+STATUSES = ("RUNNING", "STOPPED", "FAILED", "DISABLED")
+PREFIXES = ("prod", "dev", "qa", "uat")
+
+
+def make_records(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    schema = FieldSchema()
+    records = []
+    for i in range(count):
+        item = {
+            "id": f"vdb-{i}",
+            "name": f"{rng.choice(PREFIXES)}-db-{i}",
+            "status": rng.choice(STATUSES),
+            "size": rng.randrange(1_000_000),
+            "engine_id": f"eng-{rng.randrange(10)}",
+            "creation_date": f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}T00:00:00Z",
+            "tags": [{"key": "k", "value": rng.choice("abcdef")} for _ in range(rng.randrange(3))],
+        }
+        records.append(InventoryRecord(item, schema, "vdbs"))
+    return records
+
+
+def best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Passes per filter; the best is reported")
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    print(f"{args.records} inventory records, best of {args.repeat} passes per filter")
+    for expression in FILTERS:
+        predicate = compile_filter(expression)
+        matched = sum(1 for record in records if predicate(record))
+        seconds = best_of(args.repeat, lambda: [record for record in records if predicate(record)])
+        print(
+            f"  {expression:<82} {seconds * 1000:7.1f} ms "
+            f"({seconds / args.records * 1e9:6.0f} ns/record, {matched} matched)"
+        )
+
+    expression = FILTERS[-2]
+    parse_filter.cache_clear()
+    _compile_canonical.cache_clear()
+    started = time.perf_counter()
+    compile_filter(expression)
+    cold = time.perf_counter() - started
+    calls = 10_000
+    started = time.perf_counter()
+    for _ in range(calls):
+        compile_filter(expression)
+    warm = (time.perf_counter() - started) / calls
+    print(f"Compiling a filter: {cold * 1e6:.0f} us on the first call, {warm * 1e6:.2f} us memoized")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,12 @@ Configuration module for DCT MCP Server
 """
 
 import os
+from pathlib import Path
 from typing import Any, Dict
 
+# Default location for persisted state, next to the logs directory
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[3] / "cache"
+
 
 def get_dct_config() -> Dict[str, Any]:
     """Get DCT configuration from environment variables"""
@@ -16,6 +20,45 @@ def get_dct_config() -> Dict[str, Any]:
         "require_confirmation": os.getenv("DCT_REQUIRE_CONFIRMATION", "true").lower() == "true",
         "timeout": int(os.getenv("DCT_TIMEOUT", "30")),
         "max_retries": int(os.getenv("DCT_MAX_RETRIES", "3")),
+        "max_concurrency": int(os.getenv("DCT_MAX_CONCURRENCY", "8")),
+        "search_all_timeout": float(os.getenv("DCT_SEARCH_ALL_TIMEOUT", "30")),
+        "hedge_enabled": os.getenv("DCT_HEDGE_ENABLED", "true").lower() == "true",
+        "hedge_percentile": float(os.getenv("DCT_HEDGE_PERCENTILE", "95")),
+        "hedge_max_rate": float(os.getenv("DCT_HEDGE_MAX_RATE", "0.05")),
+        "paginate_max_items": int(os.getenv("DCT_PAGINATE_MAX_ITEMS", "1000")),
+        "paginate_max_bytes": int(os.getenv("DCT_PAGINATE_MAX_BYTES", "1048576")),
+        "page_target_seconds": float(os.getenv("DCT_PAGE_TARGET_SECONDS", "1.0")),
+        "page_target_bytes": int(os.getenv("DCT_PAGE_TARGET_BYTES", "262144")),
+        "page_size_min": int(os.getenv("DCT_PAGE_SIZE_MIN", "10")),
+        "page_size_max": int(os.getenv("DCT_PAGE_SIZE_MAX", "1000")),
+        "get_batch_window_ms": float(os.getenv("DCT_GET_BATCH_WINDOW_MS", "5")),
+        "get_batch_max": int(os.getenv("DCT_GET_BATCH_MAX", "100")),
+        "job_poll_min_interval": float(os.getenv("DCT_JOB_POLL_MIN_INTERVAL", "1")),
+        "job_poll_max_interval": float(os.getenv("DCT_JOB_POLL_MAX_INTERVAL", "15")),
+        "job_wait_timeout": float(os.getenv("DCT_JOB_WAIT_TIMEOUT", "300")),
+        "job_tracker_size": int(os.getenv("DCT_JOB_TRACKER_SIZE", "1000")),
+        "confirmation_ttl": float(os.getenv("DCT_CONFIRMATION_TTL", "300")),
+        "bulk_concurrency": int(os.getenv("DCT_BULK_CONCURRENCY", "8")),
+        "bulk_engine_concurrency": int(os.getenv("DCT_BULK_ENGINE_CONCURRENCY", "2")),
+        "group_refresh_timeout": float(os.getenv("DCT_GROUP_REFRESH_TIMEOUT", "3600")),
+        "sweep_rate": float(os.getenv("DCT_SWEEP_RATE", "2")),
+        "engine_max_jobs": int(os.getenv("DCT_ENGINE_MAX_JOBS", "4")),
+        "engine_queue_timeout": float(os.getenv("DCT_ENGINE_QUEUE_TIMEOUT", "300")),
+        "cache_dir": os.getenv("DCT_CACHE_DIR", str(DEFAULT_CACHE_DIR)),
+        "result_offload_bytes": int(os.getenv("DCT_RESULT_OFFLOAD_BYTES", "262144")),
+        "result_store_memory_mb": float(os.getenv("DCT_RESULT_STORE_MEMORY_MB", "64")),
+        "result_store_disk_mb": float(os.getenv("DCT_RESULT_STORE_DISK_MB", "1024")),
+        "result_ttl": float(os.getenv("DCT_RESULT_TTL", "1800")),
+        "inventory_enabled": os.getenv("DCT_INVENTORY_ENABLED", "true").lower() == "true",
+        "inventory_refresh_interval": float(os.getenv("DCT_INVENTORY_REFRESH_INTERVAL", "300")),
+        "inventory_persist": os.getenv("DCT_INVENTORY_PERSIST", "true").lower() == "true",
+        "inventory_full_sync_interval": float(
+            os.getenv("DCT_INVENTORY_FULL_SYNC_INTERVAL")
+            or os.getenv("DCT_INVENTORY_REFRESH_INTERVAL", "300")
+        ),
+        "name_resolution_enabled": os.getenv("DCT_NAME_RESOLUTION_ENABLED", "true").lower()
+        == "true",
+        "name_cache_ttl": float(os.getenv("DCT_NAME_CACHE_TTL", "300")),
         "log_level": os.getenv("DCT_LOG_LEVEL", "INFO").upper(),
         "is_local_telemetry_enabled": os.getenv("IS_LOCAL_TELEMETRY_ENABLED", "false").lower()
         == "true",
@@ -36,6 +79,98 @@ def get_dct_config() -> Dict[str, Any]:
             f"Must be one of: {', '.join(valid_log_levels)}"
         )
 
+    if config["max_concurrency"] < 1:
+        raise ValueError(
+            f"Invalid max concurrency: {config['max_concurrency']}. Must be at least 1."
+        )
+
+    # Validate hedging settings
+    if not 0 < config["hedge_percentile"] < 100:
+        raise ValueError(
+            f"Invalid hedge percentile: {config['hedge_percentile']}. "
+            "Must be between 0 and 100 (exclusive)."
+        )
+    if not 0 <= config["hedge_max_rate"] <= 1:
+        raise ValueError(
+            f"Invalid hedge max rate: {config['hedge_max_rate']}. "
+            "Must be between 0 and 1."
+        )
+
+    # Validate page size bounds
+    if not 0 < config["page_size_min"] <= config["page_size_max"]:
+        raise ValueError(
+            f"Invalid page size bounds: {config['page_size_min']}-{config['page_size_max']}. "
+            "DCT_PAGE_SIZE_MIN must be positive and not above DCT_PAGE_SIZE_MAX."
+        )
+
+    # Validate get batching settings
+    if config["get_batch_window_ms"] < 0:
+        raise ValueError(
+            f"Invalid get batch window: {config['get_batch_window_ms']}. Must not be negative."
+        )
+    if not 1 <= config["get_batch_max"] <= 1000:
+        raise ValueError(
+            f"Invalid get batch max: {config['get_batch_max']}. Must be between 1 and 1000."
+        )
+
+    # Validate job polling settings
+    if not 0 < config["job_poll_min_interval"] <= config["job_poll_max_interval"]:
+        raise ValueError(
+            f"Invalid job poll interval bounds: {config['job_poll_min_interval']}-"
+            f"{config['job_poll_max_interval']}. DCT_JOB_POLL_MIN_INTERVAL must be "
+            "positive and not above DCT_JOB_POLL_MAX_INTERVAL."
+        )
+    if config["job_wait_timeout"] <= 0:
+        raise ValueError(
+            f"Invalid job wait timeout: {config['job_wait_timeout']}. Must be positive."
+        )
+    if config["job_tracker_size"] < 1:
+        raise ValueError(
+            f"Invalid job tracker size: {config['job_tracker_size']}. Must be at least 1."
+        )
+
+    if config["confirmation_ttl"] <= 0:
+        raise ValueError(
+            f"Invalid confirmation TTL: {config['confirmation_ttl']}. Must be positive."
+        )
+
+    # Validate bulk operation settings
+    if config["bulk_concurrency"] < 1 or config["bulk_engine_concurrency"] < 1:
+        raise ValueError(
+            f"Invalid bulk concurrency: {config['bulk_concurrency']} overall, "
+            f"{config['bulk_engine_concurrency']} per engine. Both must be at least 1."
+        )
+    if config["group_refresh_timeout"] <= 0:
+        raise ValueError(
+            f"Invalid group refresh timeout: {config['group_refresh_timeout']}. Must be positive."
+        )
+    if config["sweep_rate"] <= 0:
+        raise ValueError(
+            f"Invalid sweep rate: {config['sweep_rate']}. Must be positive."
+        )
+    if config["engine_max_jobs"] < 0:
+        raise ValueError(
+            f"Invalid engine job limit: {config['engine_max_jobs']}. Must not be negative."
+        )
+    if config["engine_queue_timeout"] <= 0:
+        raise ValueError(
+            f"Invalid engine queue timeout: {config['engine_queue_timeout']}. Must be positive."
+        )
+
+    # Validate result store settings
+    if config["result_offload_bytes"] < 0:
+        raise ValueError(
+            f"Invalid result offload threshold: {config['result_offload_bytes']}. "
+            "Must not be negative."
+        )
+    if config["result_store_memory_mb"] < 0 or config["result_store_disk_mb"] < 0:
+        raise ValueError(
+            "Invalid result store budget: DCT_RESULT_STORE_MEMORY_MB and "
+            "DCT_RESULT_STORE_DISK_MB must not be negative."
+        )
+    if config["result_ttl"] <= 0:
+        raise ValueError(f"Invalid result TTL: {config['result_ttl']}. Must be positive.")
+
     return config
 
 
@@ -53,6 +188,41 @@ def print_config_help():
     print("  DCT_REQUIRE_CONFIRMATION  Require confirmation for destructive operations (default: true)")
     print("  DCT_TIMEOUT               Request timeout in seconds (default: 30)")
     print("  DCT_MAX_RETRIES           Maximum retry attempts (default: 3)")
+    print("  DCT_MAX_CONCURRENCY       Maximum concurrent requests to DCT (default: 8)")
+    print("  DCT_SEARCH_ALL_TIMEOUT    Timeout in seconds for each entity of a search_all (default: 30)")
+    print("  DCT_HEDGE_ENABLED         Hedge slow idempotent reads with a duplicate request (default: true)")
+    print("  DCT_HEDGE_PERCENTILE      Latency percentile after which a read is hedged (default: 95)")
+    print("  DCT_HEDGE_MAX_RATE        Maximum fraction of reads that may be hedged (default: 0.05)")
+    print("  DCT_PAGINATE_MAX_ITEMS    Hard item cap for all_pages searches (default: 1000)")
+    print("  DCT_PAGINATE_MAX_BYTES    Hard byte cap for all_pages searches (default: 1048576)")
+    print("  DCT_PAGE_TARGET_SECONDS   Target time per search page for adaptive page sizing (default: 1.0)")
+    print("  DCT_PAGE_TARGET_BYTES     Target bytes per search page for adaptive page sizing (default: 262144)")
+    print("  DCT_PAGE_SIZE_MIN         Smallest adaptive page size (default: 10)")
+    print("  DCT_PAGE_SIZE_MAX         Largest adaptive page size (default: 1000)")
+    print("  DCT_INVENTORY_ENABLED     Keep an in-memory inventory of VDBs, dSources, environments and engines (default: true)")
+    print("  DCT_INVENTORY_REFRESH_INTERVAL  Seconds between inventory refreshes (default: 300)")
+    print("  DCT_INVENTORY_PERSIST     Persist the inventory in SQLite under DCT_CACHE_DIR (default: true)")
+    print("  DCT_INVENTORY_FULL_SYNC_INTERVAL  Seconds between full inventory resyncs; refreshes in between only fetch new objects, and freshness counts from the last full resync (default: DCT_INVENTORY_REFRESH_INTERVAL)")
+    print("  DCT_NAME_RESOLUTION_ENABLED  Accept names for vdbId, dsourceId, environmentId and snapshotId (default: true)")
+    print("  DCT_NAME_CACHE_TTL        Seconds resolved names are cached (default: 300)")
+    print("  DCT_GET_BATCH_WINDOW_MS   Window in ms for batching concurrent gets by ID; 0 disables (default: 5)")
+    print("  DCT_GET_BATCH_MAX         Maximum IDs per batched get (default: 100)")
+    print("  DCT_JOB_POLL_MIN_INTERVAL  Shortest interval in seconds between job polls (default: 1)")
+    print("  DCT_JOB_POLL_MAX_INTERVAL  Longest interval in seconds between job polls (default: 15)")
+    print("  DCT_JOB_WAIT_TIMEOUT      Default seconds a job wait blocks before returning (default: 300)")
+    print("  DCT_JOB_TRACKER_SIZE      Finished jobs started by this server kept in memory (default: 1000)")
+    print("  DCT_CONFIRMATION_TTL      Seconds a confirmation token stays valid (default: 300)")
+    print("  DCT_BULK_CONCURRENCY      Objects a bulk operation acts on at once (default: 8)")
+    print("  DCT_BULK_ENGINE_CONCURRENCY  Objects a bulk operation acts on at once per engine (default: 2)")
+    print("  DCT_GROUP_REFRESH_TIMEOUT  Seconds a group refresh waits for its jobs; unfinished ones are reported as pending (default: 3600)")
+    print("  DCT_SWEEP_RATE            Snapshot deletions a retention sweep starts per second (default: 2)")
+    print("  DCT_ENGINE_MAX_JOBS       Jobs this server runs at once per engine, 0 for no limit (default: 4)")
+    print("  DCT_ENGINE_QUEUE_TIMEOUT  Seconds a call waits for a busy engine before it is returned unsent (default: 300)")
+    print("  DCT_CACHE_DIR             Directory for persisted server state (default: <project>/cache)")
+    print("  DCT_RESULT_OFFLOAD_BYTES  Search results larger than this are offloaded to MCP resources; 0 disables (default: 262144)")
+    print("  DCT_RESULT_STORE_MEMORY_MB  Memory for offloaded results before they spill to disk (default: 64)")
+    print("  DCT_RESULT_STORE_DISK_MB  Disk space for spilled results under DCT_CACHE_DIR (default: 1024)")
+    print("  DCT_RESULT_TTL            Seconds offloaded results stay readable (default: 1800)")
     print(
         "  DCT_LOG_LEVEL             Logging level (default: INFO, options: DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
@@ -0,0 +1,351 @@
+"""
+Streaming aggregation of search results.
+
+Items are fed to an accumulator page by page and only per-group counts,
+sums, minimums and maximums, quantile sketches, or the top k items, are
+kept, so memory grows with the number of groups or with k rather than with
+the number of objects searched.
+"""
+
+import heapq
+import itertools
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dct_mcp_server.core.sketch import DDSketch
+
+METRICS = ("sum", "min", "max")
+
+
+class AggregateConfig:
+    """Configuration constants for aggregation."""
+
+    MAX_GROUPS = 1000  # Items of further groups are only counted as "other"
+    MAX_FIELDS = 20  # Fields per group_by or metric
+    MAX_TOP_K = 1000  # Largest k for top_k selection
+
+
+def _getter(path: str) -> Callable[[Any], Any]:
+    """Read a dotted path from a dict or an inventory record."""
+    head, *rest = path.split(".")
+    if not rest:
+        return lambda item: item.get(head)
+
+    def get(item: Any) -> Any:
+        value = item.get(head)
+        for part in rest:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    return get
+
+
+def _hashable(value: Any) -> Any:
+    # Tagged with the type, as True, 1 and 1.0 hash alike but are different groups
+    if isinstance(value, (list, dict)):
+        return type(value), json.dumps(value, sort_keys=True, default=str)
+    return type(value), value
+
+
+def _fields(spec: Dict[str, Any], name: str) -> Tuple[str, ...]:
+    value = spec.get(name) or ()
+    if isinstance(value, str):
+        value = (value,)
+    if not isinstance(value, (list, tuple)) or not all(
+        isinstance(field, str) and field for field in value
+    ):
+        raise ValueError(f"aggregate.{name} must be a list of field names.")
+    if len(value) > AggregateConfig.MAX_FIELDS:
+        raise ValueError(
+            f"aggregate.{name} has more than {AggregateConfig.MAX_FIELDS} fields."
+        )
+    return tuple(dict.fromkeys(value))
+
+
+class _Group:
+    __slots__ = ("key", "count", "sum", "min", "max")
+
+    def __init__(self, key: Dict[str, Any]):
+        self.key = key
+        self.count = 0
+        self.sum: Dict[str, float] = {}
+        self.min: Dict[str, Any] = {}
+        self.max: Dict[str, Any] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        group: Dict[str, Any] = {"key": self.key, "count": self.count}
+        for metric in METRICS:
+            values = getattr(self, metric)
+            if values:
+                group[metric] = values
+        return group
+
+
+class Aggregator:
+    """Accumulates group_by counts and sum/min/max over streamed items.
+
+    ``spec`` is the tool's ``aggregate`` argument, e.g.
+    ``{"group_by": ["engine_id", "status"], "sum": ["size"], "max": ["size"]}``.
+    ``sum`` only adds numbers; ``min`` and ``max`` also compare strings such
+    as timestamps. Raises ValueError for an invalid spec.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        if not isinstance(spec, dict):
+            raise ValueError("aggregate must be an object with group_by, sum, min or max.")
+        unknown = set(spec) - {"group_by", *METRICS}
+        if unknown:
+            raise ValueError(
+                f"Unknown aggregate keys: {', '.join(sorted(unknown))}. "
+                "Use group_by, sum, min and max."
+            )
+        self.group_by = _fields(spec, "group_by")
+        self.metrics = {metric: _fields(spec, metric) for metric in METRICS}
+        self._key_getters = [_getter(field) for field in self.group_by]
+        self._metric_getters = {
+            metric: [(field, _getter(field)) for field in fields]
+            for metric, fields in self.metrics.items()
+        }
+        self._groups: Dict[Tuple[Any, ...], _Group] = {}
+        self.total = 0
+        self.other = 0
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Fold a page of items into the aggregate."""
+        key_getters = self._key_getters
+        sums = self._metric_getters["sum"]
+        mins = self._metric_getters["min"]
+        maxs = self._metric_getters["max"]
+        groups = self._groups
+        for item in items:
+            self.total += 1
+            values = tuple(get(item) for get in key_getters)
+            key = tuple(_hashable(value) for value in values)
+            group = groups.get(key)
+            if group is None:
+                if len(groups) >= AggregateConfig.MAX_GROUPS:
+                    self.other += 1
+                    continue
+                group = groups[key] = _Group(dict(zip(self.group_by, values)))
+            group.count += 1
+            for field, get in sums:
+                value = get(item)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    group.sum[field] = group.sum.get(field, 0) + value
+            for field, get in mins:
+                _fold(group.min, field, get(item), min)
+            for field, get in maxs:
+                _fold(group.max, field, get(item), max)
+
+    def result(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the groups, largest first, with the scan metadata."""
+        groups: List[Dict[str, Any]] = sorted(
+            (group.to_dict() for group in self._groups.values()),
+            key=lambda group: -group["count"],
+        )
+        return {
+            "group_by": list(self.group_by),
+            "groups": groups,
+            "group_count": len(groups),
+            "total_count": self.total,
+            "other_count": self.other,
+            "groups_truncated": self.other > 0,
+            "response_metadata": metadata or {},
+        }
+
+
+def _fold(extremes: Dict[str, Any], field: str, value: Any, pick: Callable) -> None:
+    if value is None or isinstance(value, (bool, dict, list)):
+        return
+    current = extremes.get(field)
+    if current is None:
+        extremes[field] = value
+    elif isinstance(value, str) == isinstance(current, str):
+        # Values of another kind than the first one seen are ignored
+        extremes[field] = pick(current, value)
+
+
+class QuantileAggregator:
+    """Estimates per-group quantiles of a value derived from streamed items.
+
+    ``spec`` is e.g. ``{"group_by": ["type"], "quantiles": [0.5, 0.95]}``
+    and ``value`` returns the number to summarize for an item, or None to
+    skip it. Each group keeps one DDSketch, so memory does not grow with
+    the number of items; the overall figures merge the group sketches.
+    Raises ValueError for an invalid spec.
+    """
+
+    DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, spec: Dict[str, Any], value: Callable[[Any], Optional[float]]):
+        if not isinstance(spec, dict):
+            raise ValueError("aggregate must be an object with group_by and quantiles.")
+        unknown = set(spec) - {"group_by", "quantiles"}
+        if unknown:
+            raise ValueError(
+                f"Unknown aggregate keys: {', '.join(sorted(unknown))}. Use group_by and quantiles."
+            )
+        quantiles = spec.get("quantiles", self.DEFAULT_QUANTILES)
+        if (
+            not isinstance(quantiles, (list, tuple))
+            or not quantiles
+            or len(quantiles) > AggregateConfig.MAX_FIELDS
+            or not all(
+                isinstance(q, (int, float)) and not isinstance(q, bool) and 0 <= q <= 1
+                for q in quantiles
+            )
+        ):
+            raise ValueError(
+                f"aggregate.quantiles must be a list of up to {AggregateConfig.MAX_FIELDS} "
+                "numbers between 0 and 1."
+            )
+        self.group_by = _fields(spec, "group_by")
+        self.quantiles = tuple(sorted(set(quantiles)))
+        self._value = value
+        self._key_getters = [_getter(field) for field in self.group_by]
+        self._groups: Dict[Tuple[Any, ...], Tuple[Dict[str, Any], DDSketch]] = {}
+        self.total = 0
+        self.skipped = 0
+        self.other = 0
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Fold a page of items into the sketches."""
+        key_getters = self._key_getters
+        groups = self._groups
+        for item in items:
+            self.total += 1
+            value = self._value(item)
+            if value is None:
+                self.skipped += 1
+                continue
+            values = tuple(get(item) for get in key_getters)
+            key = tuple(_hashable(value) for value in values)
+            group = groups.get(key)
+            if group is None:
+                if len(groups) >= AggregateConfig.MAX_GROUPS:
+                    self.other += 1
+                    continue
+                group = groups[key] = (dict(zip(self.group_by, values)), DDSketch())
+            group[1].add(value)
+
+    def _summarize(self, sketch: DDSketch) -> Dict[str, Any]:
+        return {
+            "count": sketch.count,
+            "min": round(sketch.min, 3),
+            "max": round(sketch.max, 3),
+            "mean": round(sketch.sum / sketch.count, 3),
+            "quantiles": {
+                f"p{q * 100:g}": round(sketch.quantile(q), 3) for q in self.quantiles
+            },
+        }
+
+    def result(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the per-group and overall quantiles, largest group first."""
+        overall = DDSketch()
+        groups = []
+        for key, sketch in self._groups.values():
+            overall.merge(sketch)
+            groups.append({"key": key, **self._summarize(sketch)})
+        groups.sort(key=lambda group: -group["count"])
+        return {
+            "group_by": list(self.group_by),
+            "groups": groups,
+            "overall": self._summarize(overall) if overall.count else None,
+            "group_count": len(groups),
+            "total_count": self.total,
+            "skipped_count": self.skipped,
+            "other_count": self.other,
+            "groups_truncated": self.other > 0,
+            "relative_accuracy": overall.relative_accuracy,
+            "response_metadata": metadata or {},
+        }
+
+
+class _Descending:
+    """Inverts the ordering of a key, so a min-heap keeps the smallest keys."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+
+class TopK:
+    """Keeps the k items with the largest or smallest value of a field.
+
+    ``spec`` is the tool's ``top_k`` argument, e.g. ``{"k": 10, "by":
+    "-size"}``; ``by`` follows DCT sort syntax, a ``-`` prefix selecting the
+    largest values. A heap of at most k entries is kept, the weakest on top,
+    so each item costs O(log k). Items without a value for the field, or
+    with a value of another kind than the first one seen, are skipped.
+    Raises ValueError for an invalid spec.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        if not isinstance(spec, dict):
+            raise ValueError('top_k must be an object like {"k": 10, "by": "-size"}.')
+        unknown = set(spec) - {"k", "by"}
+        if unknown:
+            raise ValueError(f"Unknown top_k keys: {', '.join(sorted(unknown))}. Use k and by.")
+        k, by = spec.get("k"), spec.get("by")
+        if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= AggregateConfig.MAX_TOP_K:
+            raise ValueError(f"top_k.k must be between 1 and {AggregateConfig.MAX_TOP_K}.")
+        if not isinstance(by, str) or not by.lstrip("-"):
+            raise ValueError('top_k.by must be a field name, prefixed with "-" for the largest values.')
+        self.k = k
+        self.by = by
+        self.largest = by.startswith("-")
+        self._get = _getter(by.lstrip("-"))
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._sequence = itertools.count()
+        self._is_text: Optional[bool] = None
+        self.scanned = 0
+        self.skipped = 0
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Offer a page of items to the selection."""
+        heap, get, k = self._heap, self._get, self.k
+        for item in items:
+            self.scanned += 1
+            value = get(item)
+            if value is None or isinstance(value, (bool, dict, list)):
+                self.skipped += 1
+                continue
+            is_text = isinstance(value, str)
+            if self._is_text is None:
+                self._is_text = is_text
+            elif is_text != self._is_text:
+                self.skipped += 1
+                continue
+            # Later items lose ties, so the earliest of equal items are kept
+            entry = (
+                value if self.largest else _Descending(value),
+                -next(self._sequence),
+                item,
+            )
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap[0] < entry:
+                heapq.heapreplace(heap, entry)
+
+    def result(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the selected items, best first, as a search result."""
+        ranked = sorted(self._heap, reverse=True)
+        items = [item.to_dict() if hasattr(item, "to_dict") else item for _, _, item in ranked]
+        return {
+            "items": items,
+            "response_metadata": {
+                **(metadata or {}),
+                "top_k": self.k,
+                "by": self.by,
+                "skipped": self.skipped,
+            },
+        }
@@ -0,0 +1,189 @@
+"""
+Bulk execution of one operation over many DCT objects.
+
+Targets are selected by IDs (or names) or by a filter expression, then the
+operation runs for each of them concurrently, bounded by a global limit and
+by a limit per engine, so a bulk call neither floods DCT nor piles every
+job onto one engine. Every target gets its own outcome; one failure never
+stops the others.
+"""
+
+import asyncio
+import contextlib
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+class BulkConfig:
+    """Configuration constants for bulk operations."""
+
+    MAX_TARGETS = 500  # Objects one bulk call may act on
+    TARGET_FIELDS = ("id", "name", "engine_id")  # Fields of a target kept in plans and outcomes
+
+
+def path_param(endpoint: str) -> str:
+    """Return the name of the single path parameter of an endpoint template."""
+    params = _PATH_PARAM.findall(endpoint)
+    if len(params) != 1:
+        raise ValueError(f"{endpoint} does not act on a single object.")
+    return params[0]
+
+
+class _Pacer:
+    """Spaces out the starts of actions to at most ``rate`` per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _target(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: obj.get(field) for field in BulkConfig.TARGET_FIELDS}
+
+
+async def select_targets(
+    client,
+    endpoint: str,
+    ids: Optional[List[str]] = None,
+    filter_expression: Optional[str] = None,
+    resolve: Optional[Callable[[str, Dict[str, str]], Awaitable[Dict[str, str]]]] = None,
+) -> List[Dict[str, Any]]:
+    """Return the objects a bulk operation on ``endpoint`` acts on.
+
+    With ``ids`` every given ID or name (resolved through ``resolve``) is
+    looked up; ones that cannot be found stay in the list with an ``error``
+    so they are reported as failed. Otherwise every object matching
+    ``filter_expression`` is a target; the matches are streamed rather than
+    collected, so only ``BulkConfig.MAX_TARGETS`` bounds them. Raises
+    ValueError when neither is given or when there are more targets.
+    """
+    collection = endpoint.strip("/").split("/")[0]
+    param = path_param(endpoint)
+    if ids:
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > BulkConfig.MAX_TARGETS:
+            raise ValueError(f"A bulk operation accepts at most {BulkConfig.MAX_TARGETS} targets.")
+
+        async def to_id(value: str) -> str:
+            if resolve is None:
+                return value
+            return (await resolve(endpoint, {param: value}))[param]
+
+        resolved = await asyncio.gather(*(to_id(value) for value in ids), return_exceptions=True)
+        found = await client.search_by_ids(
+            collection, [object_id for object_id in resolved if isinstance(object_id, str)]
+        )
+        targets = []
+        for value, object_id in zip(ids, resolved):
+            if isinstance(object_id, Exception):
+                targets.append({"id": value, "error": str(object_id)})
+            elif object_id not in found:
+                targets.append({"id": object_id, "error": f"{collection} '{value}' was not found."})
+            else:
+                targets.append(_target(found[object_id]))
+        return targets
+
+    if not filter_expression:
+        raise ValueError("A bulk operation needs ids or a filter_expression.")
+    targets: List[Dict[str, Any]] = []
+    await client.scan_search(
+        f"/{collection}/search",
+        lambda items: targets.extend(_target(item) for item in items),
+        json_body={"filter_expression": filter_expression},
+        max_items=BulkConfig.MAX_TARGETS + 1,
+    )
+    if len(targets) > BulkConfig.MAX_TARGETS:
+        raise ValueError(
+            f"filter_expression matches more than {BulkConfig.MAX_TARGETS} {collection}; narrow it down."
+        )
+    return targets
+
+
+def bulk_plan(
+    operation: str, endpoint: str, targets: List[Dict[str, Any]], token: str, expires_in: float
+) -> Dict[str, Any]:
+    """Describe a bulk operation awaiting confirmation with ``token``."""
+    runnable = [target for target in targets if "error" not in target]
+    return {
+        "requires_confirmation": True,
+        "operation": operation,
+        "endpoint": endpoint,
+        "targets": runnable,
+        "target_count": len(runnable),
+        "unresolved": [target for target in targets if "error" in target],
+        "confirmation_token": token,
+        "expires_in_seconds": expires_in,
+        "message": (
+            f"This operation '{operation}' is destructive and would run on {len(runnable)} "
+            "objects. Please review the targets and call again with confirmation_token "
+            "to run it on exactly these targets."
+        ),
+    }
+
+
+async def run_bulk(
+    operation: str,
+    targets: List[Dict[str, Any]],
+    action: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    concurrency: int,
+    engine_concurrency: int,
+    rate: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run ``action`` for every target and collect the outcomes.
+
+    At most ``concurrency`` actions run at once, and at most
+    ``engine_concurrency`` on the same engine; with ``rate`` at most that
+    many actions start per second. ``action`` returns the
+    fields to add to a target's outcome; an exception marks only that
+    target as failed. Outcomes keep the order of the targets.
+    """
+    overall = asyncio.Semaphore(concurrency)
+    engines: Dict[Any, asyncio.Semaphore] = {}
+    pacer = _Pacer(rate) if rate else None
+
+    async def run(target: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in target:
+            return {**target, "status": "failed"}
+        engine_id = target.get("engine_id")
+        per_engine = (
+            engines.setdefault(engine_id, asyncio.Semaphore(engine_concurrency))
+            if engine_id is not None
+            else contextlib.nullcontext()
+        )
+        # Queue on the engine first, so a busy engine does not hold global slots
+        async with per_engine, overall:
+            try:
+                if pacer is not None:
+                    await pacer.wait()
+                return {**target, "status": "succeeded", **(await action(target))}
+            except Exception as e:
+                logger.warning(f"Bulk {operation} failed for {target.get('id')}: {e}")
+                return {**target, "status": "failed", "error": str(e)}
+
+    outcomes = await asyncio.gather(*(run(target) for target in targets))
+    failed = sum(outcome["status"] == "failed" for outcome in outcomes)
+    return {
+        "operation": operation,
+        "items": outcomes,
+        "total": len(outcomes),
+        "succeeded": len(outcomes) - failed,
+        "failed": failed,
+        "partial_failure": 0 < failed < len(outcomes),
+        "job_ids": [outcome["job_id"] for outcome in outcomes if outcome.get("job_id")],
+    }
@@ -0,0 +1,106 @@
+"""
+Plan-then-commit confirmation of destructive operations.
+
+When confirmation is required, the first call of a destructive operation
+validates its arguments, resolves names and stores the prepared requests
+here under a short-lived token. Calling again with the token runs exactly
+what was reviewed, without validating or resolving anything again. A token
+covers one request or a whole bulk operation, can be committed once, and
+only through the tool and operation it was issued for.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConfirmationConfig:
+    """Configuration constants for confirmation tokens."""
+
+    TOKEN_BYTES = 12  # Random bytes per token, 16 URL-safe characters
+    MAX_PLANS = 1000  # Pending plans kept; the oldest are dropped beyond this
+
+
+class _Plan:
+    __slots__ = ("tool", "operation", "prepared", "expires_at")
+
+    def __init__(self, tool: str, operation: str, prepared: Dict[str, Any], expires_at: float):
+        self.tool = tool
+        self.operation = operation
+        self.prepared = prepared
+        self.expires_at = expires_at
+
+
+class ConfirmationStore:
+    """Pending plans of destructive operations, keyed by confirmation token."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._plans: "OrderedDict[str, _Plan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, tool: str, operation: str, prepared: Dict[str, Any]) -> Tuple[str, float]:
+        """Store the prepared requests of a tool's operation and return their token and lifetime in seconds."""
+        token = secrets.token_urlsafe(ConfirmationConfig.TOKEN_BYTES)
+        with self._lock:
+            self._expire()
+            self._plans[token] = _Plan(tool, operation, prepared, time.monotonic() + self.ttl)
+            while len(self._plans) > ConfirmationConfig.MAX_PLANS:
+                self._plans.popitem(last=False)
+        return token, self.ttl
+
+    def take(self, token: str, tool: str, operation: str) -> Dict[str, Any]:
+        """Remove and return the prepared requests of a token.
+
+        Raises ValueError for unknown, expired or already committed tokens,
+        and for tokens issued for another tool or operation; these stay
+        pending.
+        """
+        with self._lock:
+            self._expire()
+            plan = self._plans.get(token)
+            if plan is None:
+                raise ValueError(
+                    "Confirmation token is unknown, expired or already used. "
+                    "Call the operation again without it to get a new one."
+                )
+            if plan.tool != tool:
+                raise ValueError(
+                    f"Confirmation token was issued for {plan.tool}, not {tool}."
+                )
+            if plan.operation != operation:
+                raise ValueError(
+                    f"Confirmation token was issued for '{plan.operation}', not '{operation}'."
+                )
+            del self._plans[token]
+        logger.info(f"Committing confirmed plan for {tool} '{operation}'")
+        return plan.prepared
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for token in [t for t, plan in self._plans.items() if plan.expires_at <= now]:
+            del self._plans[token]
+
+
+# Global instance
+_confirmation_store: Optional[ConfirmationStore] = None
+
+
+# Public API
+def start_confirmation_store(ttl: float) -> ConfirmationStore:
+    """Create the global confirmation store"""
+    global _confirmation_store
+    if _confirmation_store is None:
+        _confirmation_store = ConfirmationStore(ttl)
+    return _confirmation_store
+
+
+def get_confirmation_store() -> Optional[ConfirmationStore]:
+    """Get the global confirmation store (returns None if not started)"""
+    return _confirmation_store
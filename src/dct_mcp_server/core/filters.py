@@ -0,0 +1,391 @@
+"""
+Local evaluator for DCT ``filter_expression`` syntax.
+
+Parses filters such as ``name CONTAINS 'prod' AND size GT 100`` into a small
+immutable syntax tree, renders that tree in a canonical form, and compiles it
+into a Python predicate over objects with a ``get`` method (dicts and
+inventory records). Parsing and compilation are memoized, and compilation is
+keyed by the canonical form so equivalent filters share one predicate.
+
+Supported grammar::
+
+    expression := term (OR term)*
+    term       := factor (AND factor)*
+    factor     := '(' expression ')' | field operator value
+    operator   := EQ | NE | LT | LE | GT | GE | CONTAINS | NOT_CONTAINS | IN | NOT_IN
+    value      := 'string' | number | true | false | null | '(' value (',' value)* ')'
+
+Dotted fields (``hosts.hostname``) traverse nested objects and match if any
+element of a traversed list matches. ``CONTAINS`` is case-insensitive.
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union
+
+
+class FilterSyntaxError(ValueError):
+    """Raised for filter expressions that cannot be parsed."""
+
+    def __init__(self, message: str, expression: str, position: int):
+        super().__init__(f"Invalid filter_expression at position {position}: {message}")
+        self.expression = expression
+        self.position = position
+
+
+COMPARISON_OPERATORS = ("EQ", "NE", "LT", "LE", "GT", "GE", "CONTAINS", "NOT_CONTAINS")
+LIST_OPERATORS = ("IN", "NOT_IN")
+LOGICAL_OPERATORS = ("AND", "OR")
+
+_TOKEN_NAMES = {"field": "a field name", "keyword": "an operator", "literal": "a value"}
+
+_TOKEN = re.compile(
+    r"""
+    (?:
+        (?P<string>'(?:[^']|'')*')
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?![\w.])
+      | (?P<word>[A-Za-z_][\w.]*)
+      | (?P<punct>[(),])
+    )
+    """,
+    re.VERBOSE,
+)
+
+
+class Comparison(NamedTuple):
+    field: str
+    operator: str
+    value: Any  # A tuple of literals for IN / NOT_IN
+
+
+class Logical(NamedTuple):
+    operator: str
+    operands: Tuple["Node", ...]
+
+
+Node = Union[Comparison, Logical]
+
+
+# Parsing
+
+
+def _tokenize(expression: str) -> List[Tuple[str, Any, int]]:
+    tokens = []
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        while expression[position].isspace():
+            position += 1
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            raise FilterSyntaxError(
+                f"unexpected character {expression[position:position + 1]!r}",
+                expression,
+                position,
+            )
+        kind = match.lastgroup
+        text = match.group(kind)
+        start = match.start()
+        if kind == "string":
+            tokens.append(("literal", text[1:-1].replace("''", "'"), start))
+        elif kind == "number":
+            tokens.append(("literal", float(text) if re.search(r"[.eE]", text) else int(text), start))
+        elif kind == "word":
+            upper = text.upper()
+            if upper in ("TRUE", "FALSE"):
+                tokens.append(("literal", upper == "TRUE", start))
+            elif upper == "NULL":
+                tokens.append(("literal", None, start))
+            elif upper in COMPARISON_OPERATORS + LIST_OPERATORS + LOGICAL_OPERATORS:
+                tokens.append(("keyword", upper, start))
+            else:
+                tokens.append(("field", text, start))
+        else:
+            tokens.append((text, text, start))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def error(self, message: str) -> FilterSyntaxError:
+        position = (
+            self.tokens[self.index][2] if self.index < len(self.tokens) else len(self.expression)
+        )
+        return FilterSyntaxError(message, self.expression, position)
+
+    def peek(self) -> Optional[Tuple[str, Any, int]]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def at(self, kind: str, value: Any = None) -> bool:
+        token = self.peek()
+        return token is not None and token[0] == kind and (value is None or token[1] == value)
+
+    def take(self, kind: str, value: Any = None) -> Any:
+        token = self.peek()
+        if not self.at(kind, value):
+            expected = value if value is not None else _TOKEN_NAMES.get(kind, kind)
+            found = "end of expression" if token is None else repr(token[1])
+            raise self.error(f"expected {expected}, found {found}")
+        self.index += 1
+        return token[1]
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise self.error("empty expression")
+        node = self.expression_()
+        if self.peek() is not None:
+            raise self.error(f"unexpected {self.peek()[1]!r}")
+        return node
+
+    def expression_(self) -> Node:
+        return self.logical("OR", self.term)
+
+    def term(self) -> Node:
+        return self.logical("AND", self.factor)
+
+    def logical(self, operator: str, operand: Callable[[], Node]) -> Node:
+        operands = [operand()]
+        while self.at("keyword", operator):
+            self.index += 1
+            operands.append(operand())
+        return operands[0] if len(operands) == 1 else Logical(operator, tuple(operands))
+
+    def factor(self) -> Node:
+        if self.at("("):
+            self.index += 1
+            node = self.expression_()
+            self.take(")")
+            return node
+        field = self.take("field")
+        if not self.at("keyword") or self.peek()[1] in LOGICAL_OPERATORS:
+            raise self.error(f"expected an operator after {field!r}")
+        operator = self.take("keyword")
+        if operator in LIST_OPERATORS:
+            self.take("(")
+            values = [self.take("literal")]
+            while self.at(","):
+                self.index += 1
+                values.append(self.take("literal"))
+            self.take(")")
+            return Comparison(field, operator, tuple(values))
+        value = self.take("literal")
+        if operator in ("CONTAINS", "NOT_CONTAINS") and not isinstance(value, str):
+            value = str(value)
+        return Comparison(field, operator, value)
+
+
+@lru_cache(maxsize=1024)
+def parse_filter(expression: str) -> Node:
+    """Parse a filter expression into its syntax tree."""
+    return _Parser(expression).parse()
+
+
+# Canonical form
+
+
+def format_literal(value: Any) -> str:
+    """Render a value as a filter expression literal."""
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return repr(value)
+
+
+def _sort_key(value: Any) -> Tuple[str, str]:
+    return (type(value).__name__, format_literal(value))
+
+
+def _render(node: Node, parent: Optional[str] = None) -> str:
+    if isinstance(node, Comparison):
+        if node.operator in LIST_OPERATORS:
+            values = ", ".join(format_literal(v) for v in node.value)
+            return f"{node.field} {node.operator} ({values})"
+        return f"{node.field} {node.operator} {format_literal(node.value)}"
+    text = f" {node.operator} ".join(_render(operand, node.operator) for operand in node.operands)
+    return f"({text})" if parent is not None else text
+
+
+def canonicalize(node: Node) -> Node:
+    """Return an equivalent tree in canonical form.
+
+    Nested AND/OR of the same kind are flattened, operands are deduplicated
+    and ordered, and IN lists are deduplicated and sorted.
+    """
+    if isinstance(node, Comparison):
+        if node.operator in LIST_OPERATORS:
+            values = tuple(sorted(set(node.value), key=_sort_key))
+            if len(values) == 1:  # Single-value lists are plain comparisons
+                return Comparison(node.field, "EQ" if node.operator == "IN" else "NE", values[0])
+            return Comparison(node.field, node.operator, values)
+        return node
+    operands = {}
+    for operand in node.operands:
+        operand = canonicalize(operand)
+        nested = (
+            operand.operands
+            if isinstance(operand, Logical) and operand.operator == node.operator
+            else (operand,)
+        )
+        for child in nested:
+            operands.setdefault(_render(child, node.operator), child)
+    ordered = tuple(operands[key] for key in sorted(operands))
+    return ordered[0] if len(ordered) == 1 else Logical(node.operator, ordered)
+
+
+@lru_cache(maxsize=1024)
+def normalize_filter(expression: str) -> str:
+    """Return the canonical text of a filter expression.
+
+    Equivalent filters that differ only in whitespace, keyword case, quoting,
+    operand order or IN list order normalize to the same string.
+    """
+    return _render(canonicalize(parse_filter(expression)))
+
+
+# Evaluation
+
+_ORDERING = {"LT": operator.lt, "LE": operator.le, "GT": operator.gt, "GE": operator.ge}
+
+
+def _values(obj: Any, path: Tuple[str, ...]) -> List[Any]:
+    """Return the non-null values at a dotted path, fanning out over lists."""
+    current = [obj.get(path[0])]
+    for part in path[1:]:
+        found = []
+        for value in current:
+            for item in value if isinstance(value, list) else (value,):
+                child = item.get(part) if isinstance(item, dict) else None
+                if child is not None:
+                    found.append(child)
+        current = found
+    values = []
+    for value in current:
+        if isinstance(value, list):
+            values.extend(v for v in value if v is not None)
+        elif value is not None:
+            values.append(value)
+    return values
+
+
+def _coerce(value: Any, literal: Any) -> Any:
+    """Convert a literal to the type of a field value for comparison."""
+    if isinstance(value, str):
+        return literal if isinstance(literal, str) or literal is None else format_literal(literal)
+    if isinstance(literal, str):
+        if isinstance(value, bool):
+            return {"true": True, "false": False}.get(literal.lower(), literal)
+        if isinstance(value, (int, float)):
+            try:
+                return float(literal)
+            except ValueError:
+                return literal
+    return literal
+
+
+def _value_test(op: str, literal: Any) -> Callable[[Any], bool]:
+    """Return the positive test of an operator on a single non-null value.
+
+    Negated operators reuse the test of their positive counterpart. Each test
+    has a fast path for values of the literal's own type.
+    """
+    if op in ("CONTAINS", "NOT_CONTAINS"):
+        needle = literal.lower()
+        return lambda value: needle in (value if value.__class__ is str else str(value)).lower()
+
+    if op in LIST_OPERATORS:
+        strings = frozenset(
+            v if isinstance(v, str) else format_literal(v) for v in literal if v is not None
+        )
+        return lambda value: value in strings if value.__class__ is str else any(
+            value == _coerce(value, v) for v in literal
+        )
+
+    kind = literal.__class__
+    if op in ("EQ", "NE"):
+        return lambda value: value == literal if value.__class__ is kind else value == _coerce(value, literal)
+
+    compare = _ORDERING[op]
+
+    def ordered(value: Any) -> bool:
+        if value.__class__ is kind:
+            return compare(value, literal)
+        try:
+            return compare(value, _coerce(value, literal))
+        except TypeError:
+            return False
+
+    return ordered
+
+
+def _all(predicates: Tuple[Callable[[Any], bool], ...]) -> Callable[[Any], bool]:
+    first, rest = predicates[0], predicates[1:]
+    if not rest:
+        return first
+    second = _all(rest)
+    return lambda obj: first(obj) and second(obj)
+
+
+def _any(predicates: Tuple[Callable[[Any], bool], ...]) -> Callable[[Any], bool]:
+    first, rest = predicates[0], predicates[1:]
+    if not rest:
+        return first
+    second = _any(rest)
+    return lambda obj: first(obj) or second(obj)
+
+
+def _compile_node(node: Node) -> Callable[[Any], bool]:
+    if isinstance(node, Logical):
+        predicates = tuple(_compile_node(operand) for operand in node.operands)
+        return _all(predicates) if node.operator == "AND" else _any(predicates)
+
+    field, op, literal = node
+    test = _value_test(op, literal)
+    # What the positive test yields for a missing or null field
+    if op in LIST_OPERATORS:
+        missing = None in literal
+    else:
+        missing = literal is None and op in ("EQ", "NE")
+
+    if "." not in field:
+        # Fast path for top-level fields
+        def matches(obj: Any) -> bool:
+            value = obj.get(field)
+            if value is None:
+                return missing
+            if value.__class__ is list:
+                values = [v for v in value if v is not None]
+                return any(map(test, values)) if values else missing
+            return test(value)
+
+    else:
+        path = tuple(field.split("."))
+
+        def matches(obj: Any) -> bool:
+            values = _values(obj, path)
+            return any(map(test, values)) if values else missing
+
+    if op in ("NE", "NOT_CONTAINS", "NOT_IN"):
+        return lambda obj: not matches(obj)
+    return matches
+
+
+@lru_cache(maxsize=512)
+def _compile_canonical(canonical: str) -> Callable[[Any], bool]:
+    return _compile_node(parse_filter(canonical))
+
+
+def compile_filter(expression: str) -> Callable[[Any], bool]:
+    """Compile a filter expression into a predicate over dict-like objects.
+
+    Raises FilterSyntaxError for invalid expressions.
+    """
+    return _compile_canonical(normalize_filter(expression))
@@ -0,0 +1,124 @@
+"""
+Field projection for tool results.
+
+Trims DCT objects down to the requested dotted field paths inside the server,
+so unneeded fields are never serialized or shipped to the client.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Named field sets per entity type. Entity names follow the DCT collection
+# path with dashes replaced by underscores (e.g. "vdb_groups").
+FIELD_PRESETS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "vdbs": {
+        "summary": ("id", "name", "status", "enabled", "database_type", "engine_id", "environment_id", "parent_id"),
+        "storage": ("id", "name", "engine_id", "size", "storage_size", "unvirtualized_space"),
+        "ids": ("id", "name", "engine_id", "environment_id", "parent_id", "parent_dsource_id"),
+    },
+    "dsources": {
+        "summary": ("id", "name", "status", "enabled", "database_type", "engine_id", "source_id"),
+        "storage": ("id", "name", "engine_id", "storage_size", "unvirtualized_space"),
+        "ids": ("id", "name", "engine_id", "source_id", "current_timeflow_id"),
+    },
+    "environments": {
+        "summary": ("id", "name", "enabled", "is_cluster", "is_windows_target", "engine_id", "hosts.hostname"),
+        "ids": ("id", "name", "engine_id", "hosts.id"),
+    },
+    "engines": {
+        "summary": ("id", "name", "hostname", "status", "version", "type"),
+        "storage": ("id", "name", "data_storage_capacity", "data_storage_used"),
+        "ids": ("id", "name", "hostname"),
+    },
+    "snapshots": {
+        "summary": ("id", "name", "timestamp", "dataset_id", "engine_id", "timeflow_id", "expiration", "retain_forever"),
+        "ids": ("id", "name", "dataset_id", "engine_id", "timeflow_id"),
+    },
+    "jobs": {
+        "summary": ("id", "type", "status", "target_id", "target_name", "start_time", "update_time", "percent_complete"),
+        "ids": ("id", "target_id", "engine_ids"),
+    },
+}
+
+# Presets available for every entity type without a specific definition
+DEFAULT_PRESETS: Dict[str, Tuple[str, ...]] = {
+    "summary": ("id", "name", "status"),
+    "ids": ("id", "name"),
+}
+
+
+def entity_name(endpoint: str) -> str:
+    """Return the entity type for an endpoint path or entity name."""
+    parts = endpoint.strip("/").replace("-", "_").split("/")
+    if parts[0] in ("management", "reporting") and len(parts) > 1:
+        return parts[1]
+    return parts[0]
+
+
+@lru_cache(maxsize=256)
+def compile_projection(fields: Tuple[str, ...], entity: str) -> Dict[str, Any]:
+    """Expand presets and build a field tree from dotted paths.
+
+    Leaves are ``None`` (keep the whole value); inner nodes are dicts of the
+    sub-fields to keep.
+    """
+    presets = {**DEFAULT_PRESETS, **FIELD_PRESETS.get(entity, {})}
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        for path in presets.get(field, (field,)):
+            node = tree
+            *parents, leaf = path.split(".")
+            for part in parents:
+                child = node.get(part, {})
+                if child is None:  # A parent path already keeps everything
+                    break
+                node = node.setdefault(part, child)
+            else:
+                node[leaf] = None
+    return tree
+
+
+def project(value: Any, tree: Dict[str, Any]) -> Any:
+    """Apply a compiled field tree to an object or a list of objects."""
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: value[key] if subtree is None else project(value[key], subtree)
+        for key, subtree in tree.items()
+        if key in value
+    }
+
+
+def project_result(
+    result: Any, fields: Optional[Iterable[str]], endpoint: str
+) -> Any:
+    """Project a DCT response to ``fields``.
+
+    Search responses keep their ``response_metadata`` and only their items
+    are projected; any other response is projected as a single object.
+    """
+    if not fields or not isinstance(result, dict):
+        return result
+    tree = compile_projection(tuple(fields), entity_name(endpoint))
+    if isinstance(result.get("items"), list):
+        return {**result, "items": project(result["items"], tree)}
+    return project(result, tree)
+
+
+def project_search_many(
+    result: Dict[str, Any], fields: Optional[Iterable[str]]
+) -> Dict[str, Any]:
+    """Project every successful entity result of a multi-entity search."""
+    if not fields:
+        return result
+    return {
+        **result,
+        "results": {
+            entity: entity_result
+            if "error" in entity_result
+            else project_result(entity_result, fields, entity)
+            for entity, entity_result in result["results"].items()
+        },
+    }
@@ -0,0 +1,323 @@
+"""
+Server-side store for oversized tool results.
+
+Search results larger than a size threshold are kept here instead of being
+returned inline. The tool returns a summary with a schema and a handle, and
+clients read slices of the items through MCP resources. Results are held in
+memory up to a budget, spilled to memory-mapped files beyond it, and evicted
+in LRU order or when their TTL expires.
+"""
+
+import json
+import mmap
+import threading
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResultStoreConfig:
+    """Configuration constants for the result store."""
+
+    SPILL_DIR = "results"
+    URI_PREFIX = "dct://results/"
+    PREVIEW_ITEMS = 3  # Items included inline in the summary
+    SCHEMA_SAMPLE = 200  # Items inspected to infer the schema
+    MAX_SLICE_ITEMS = 500  # Largest slice returned by one resource read
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+def infer_schema(items: List[Any]) -> Dict[str, str]:
+    """Map each top-level field of a sample of items to its JSON type(s)."""
+    types: Dict[str, set] = {}
+    for item in items[: ResultStoreConfig.SCHEMA_SAMPLE]:
+        if isinstance(item, dict):
+            for key, value in item.items():
+                types.setdefault(key, set()).add(_json_type(value))
+    return {key: "|".join(sorted(found)) for key, found in types.items()}
+
+
+class StoredResult:
+    """The items of one offloaded result, serialized back to back.
+
+    ``data`` holds the items' JSON joined by commas, either as bytes or as a
+    read-only mmap of a spill file. ``offsets[i]`` is where item ``i`` starts,
+    so any slice is one contiguous range of ``data``.
+    """
+
+    __slots__ = ("handle", "size", "offsets", "data", "path", "expires_at")
+
+    def __init__(self, handle: str, encoded: List[bytes], expires_at: float):
+        self.handle = handle
+        self.offsets = array("Q")
+        position = 0
+        for chunk in encoded:
+            self.offsets.append(position)
+            position += len(chunk) + 1
+        self.offsets.append(position)
+        self.data: Any = b",".join(encoded)
+        self.size = len(self.data)
+        self.path: Optional[Path] = None
+        self.expires_at = expires_at
+
+    @property
+    def count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def spilled(self) -> bool:
+        return self.path is not None
+
+    def slice(self, offset: int, limit: int) -> bytes:
+        """Return items ``offset`` to ``offset + limit`` as a JSON array."""
+        start = min(offset, self.count)
+        end = min(start + limit, self.count)
+        if start == end:
+            return b"[]"
+        return b"[" + self.data[self.offsets[start] : self.offsets[end] - 1] + b"]"
+
+    def spill(self, directory: Path) -> None:
+        path = directory / f"{self.handle}.json"
+        with open(path, "wb") as f:
+            f.write(self.data)
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.path = path
+
+    def discard(self) -> None:
+        if self.path is not None:
+            self.data.close()
+            self.path.unlink(missing_ok=True)
+        self.data = b""
+
+
+class ResultStore:
+    """Bounded LRU and TTL store of offloaded results.
+
+    Results stay in memory until ``max_memory_bytes`` is used; the least
+    recently used ones are then spilled to files in ``spill_dir``, and evicted
+    once ``max_disk_bytes`` is used too. Every result expires ``ttl`` seconds
+    after it was stored.
+    """
+
+    def __init__(
+        self,
+        spill_dir: Path,
+        threshold_bytes: int,
+        max_memory_bytes: int,
+        max_disk_bytes: int,
+        ttl: float,
+    ):
+        self.spill_dir = Path(spill_dir)
+        self.threshold_bytes = threshold_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._results: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        # Spill files outlive their TTL only if their process died; other
+        # processes sharing the directory keep younger ones
+        cutoff = time.time() - ttl
+        for stale in self.spill_dir.glob("*.json"):
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink(missing_ok=True)
+
+    # Offloading
+
+    def offload(self, result: Any, endpoint: str) -> Any:
+        """Store a search result above the threshold and return its summary.
+
+        Anything else, or a result too large for the store, is returned as is.
+        """
+        if not isinstance(result, dict) or not isinstance(result.get("items"), list):
+            return result
+        items = result["items"]
+        encoded = [json.dumps(item, separators=(",", ":")).encode() for item in items]
+        size = sum(len(chunk) for chunk in encoded)
+        if size <= self.threshold_bytes:
+            return result
+        if size > max(self.max_memory_bytes, self.max_disk_bytes):
+            logger.warning(f"Result of {endpoint} ({size} bytes) is too large to offload")
+            return result
+
+        stored = StoredResult(uuid.uuid4().hex, encoded, time.monotonic() + self.ttl)
+        with self._lock:
+            self._results[stored.handle] = stored
+            self.memory_bytes += stored.size
+            self._enforce_budgets()
+        logger.info(f"Offloaded {len(items)} items ({size} bytes) of {endpoint} as {stored.handle}")
+        return self.summary(stored.handle, items, stored.size, result.get("response_metadata"))
+
+    def offload_search_many(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Offload each oversized entity result of a multi-entity search."""
+        return {
+            **result,
+            "results": {
+                entity: self.offload(entity_result, entity)
+                for entity, entity_result in result["results"].items()
+            },
+        }
+
+    def summary(
+        self, handle: str, items: List[Any], size: int, metadata: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        uri = f"{ResultStoreConfig.URI_PREFIX}{handle}"
+        return {
+            "offloaded": True,
+            "handle": handle,
+            "resource_uri": uri,
+            "items_uri_template": f"{uri}/{{offset}}/{{limit}}",
+            "total_items": len(items),
+            "size_bytes": size,
+            "expires_in_seconds": self.ttl,
+            "schema": infer_schema(items),
+            "preview": items[: ResultStoreConfig.PREVIEW_ITEMS],
+            "response_metadata": metadata or {},
+            "message": (
+                f"The result has {len(items)} items and was too large to return inline. "
+                f"Read slices of up to {ResultStoreConfig.MAX_SLICE_ITEMS} items from "
+                f"{uri}/{{offset}}/{{limit}}."
+            ),
+        }
+
+    # Reads
+
+    def read(self, handle: str, offset: int, limit: int) -> str:
+        """Return a slice of a stored result as a JSON document.
+
+        Raises KeyError for unknown or expired handles.
+        """
+        if offset < 0 or limit < 1:
+            raise ValueError("offset must not be negative and limit must be positive.")
+        limit = min(limit, ResultStoreConfig.MAX_SLICE_ITEMS)
+        with self._lock:
+            stored = self._touch(handle)
+            items = stored.slice(offset, limit)
+            total = stored.count
+        end = min(offset + limit, total)
+        header = {
+            "handle": handle,
+            "offset": offset,
+            "total_items": total,
+            "next_offset": end if end < total else None,
+        }
+        # Splice the stored bytes in without decoding the items again
+        return json.dumps(header)[:-1] + ', "items": ' + items.decode() + "}"
+
+    def info(self, handle: str) -> Dict[str, Any]:
+        """Describe a stored result. Raises KeyError for unknown or expired handles."""
+        with self._lock:
+            stored = self._touch(handle)
+            return {
+                "handle": handle,
+                "total_items": stored.count,
+                "size_bytes": stored.size,
+                "spilled": stored.spilled,
+                "expires_in_seconds": round(max(0.0, stored.expires_at - time.monotonic()), 1),
+            }
+
+    def _touch(self, handle: str) -> StoredResult:
+        self._expire()
+        stored = self._results.get(handle)
+        if stored is None:
+            raise KeyError(f"Result '{handle}' does not exist or has expired.")
+        self._results.move_to_end(handle)
+        return stored
+
+    # Eviction
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for handle in [h for h, s in self._results.items() if s.expires_at <= now]:
+            self._evict(handle)
+
+    def _evict(self, handle: str) -> None:
+        stored = self._results.pop(handle)
+        if stored.spilled:
+            self.disk_bytes -= stored.size
+        else:
+            self.memory_bytes -= stored.size
+        stored.discard()
+        logger.debug(f"Evicted result {handle}")
+
+    def _enforce_budgets(self) -> None:
+        self._expire()
+        # Spill the least recently used in-memory results first
+        for handle, stored in list(self._results.items()):
+            if self.memory_bytes <= self.max_memory_bytes:
+                break
+            if stored.spilled:
+                continue
+            while self.disk_bytes + stored.size > self.max_disk_bytes:
+                victim = next((h for h, s in self._results.items() if s.spilled), None)
+                if victim is None:
+                    break
+                self._evict(victim)
+            if self.disk_bytes + stored.size > self.max_disk_bytes:
+                self._evict(handle)
+                continue
+            stored.spill(self.spill_dir)
+            self.memory_bytes -= stored.size
+            self.disk_bytes += stored.size
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in list(self._results):
+                self._evict(handle)
+
+
+# Global instance
+_result_store: Optional[ResultStore] = None
+
+
+# Public API
+def start_result_store(
+    spill_dir: Path,
+    threshold_bytes: int,
+    max_memory_bytes: int,
+    max_disk_bytes: int,
+    ttl: float,
+) -> ResultStore:
+    """Create the global result store"""
+    global _result_store
+    if _result_store is None:
+        _result_store = ResultStore(
+            spill_dir, threshold_bytes, max_memory_bytes, max_disk_bytes, ttl
+        )
+    return _result_store
+
+
+def stop_result_store() -> None:
+    """Drop the global result store and delete its spill files"""
+    global _result_store
+    if _result_store is not None:
+        _result_store.close()
+        _result_store = None
+
+
+def get_result_store() -> Optional[ResultStore]:
+    """Get the global result store (returns None if not started)"""
+    return _result_store
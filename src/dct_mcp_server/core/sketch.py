@@ -0,0 +1,101 @@
+"""
+Mergeable quantile sketch for streamed values.
+
+A DDSketch maps every positive value to a logarithmic bucket so that any
+quantile it reports is within a fixed relative error of the exact one. Its
+size depends on the spread of the values, not on how many were added, and
+two sketches with the same accuracy merge by adding their bucket counts.
+"""
+
+import math
+from typing import Dict, Optional
+
+
+class SketchConfig:
+    """Configuration constants for quantile sketches."""
+
+    RELATIVE_ACCURACY = 0.01  # Reported quantiles are within 1% of the exact value
+    MAX_BUCKETS = 2048  # Lowest buckets are merged beyond this many
+    MIN_VALUE = 1e-9  # Values at or below this are counted as zero
+
+
+class DDSketch:
+    """Quantile sketch with relative-error guarantees (Masson et al., 2019).
+
+    Negative values are counted as zero. Once more than ``max_buckets``
+    buckets are used, the lowest ones are merged, trading accuracy of the
+    lowest quantiles for bounded memory.
+    """
+
+    __slots__ = ("relative_accuracy", "max_buckets", "_gamma", "_log_gamma", "buckets",
+                 "zero_count", "count", "sum", "min", "max")
+
+    def __init__(
+        self,
+        relative_accuracy: float = SketchConfig.RELATIVE_ACCURACY,
+        max_buckets: int = SketchConfig.MAX_BUCKETS,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one value to the sketch."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= SketchConfig.MIN_VALUE:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: "DDSketch") -> None:
+        """Add the values of another sketch with the same accuracy."""
+        if other._gamma != self._gamma:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        keys = sorted(self.buckets)
+        excess = keys[: len(keys) - self.max_buckets + 1]
+        target = keys[len(excess)]
+        self.buckets[target] += sum(self.buckets.pop(key) for key in excess)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the estimated value at quantile ``q`` (0 to 1), or None if empty."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1.")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # The midpoint of the bucket in relative terms
+                value = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
@@ -0,0 +1,109 @@
+"""
+Micro-batching of get-by-id requests.
+
+Gets of the same collection issued within a short window are coalesced into
+one ``id IN (...)`` search, and the items are fanned back out to the waiting
+callers.
+"""
+
+import asyncio
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Collections whose search items have the same shape as their get response
+BATCHABLE_COLLECTIONS = (
+    "vdbs",
+    "dsources",
+    "snapshots",
+    "environments",
+    "bookmarks",
+    "vdb-groups",
+    "jobs",
+    "management/engines",
+)
+
+_GET_BY_ID = re.compile(
+    r"^/?(" + "|".join(re.escape(c) for c in BATCHABLE_COLLECTIONS) + r")/([^/]+)$"
+)
+
+
+def batchable_get(endpoint: str) -> Optional[Tuple[str, str]]:
+    """Return (collection, id) for a batchable get-by-id endpoint, else None."""
+    match = _GET_BY_ID.match(endpoint)
+    return (match.group(1), match.group(2)) if match else None
+
+
+def _consume(future: asyncio.Future) -> None:
+    # Mark exceptions as retrieved when every waiter has gone away
+    if not future.cancelled():
+        future.exception()
+
+
+class BatchLoader:
+    """Coalesces single-key loads into batched loads.
+
+    ``load_many`` receives the distinct keys collected during one window and
+    returns a mapping from key to value or to the exception for that key.
+    A batch is dispatched when the window elapses or ``max_batch`` keys are
+    pending, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        window: float,
+        max_batch: int,
+    ):
+        self._load_many = load_many
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def load(self, key: str) -> Any:
+        """Return the value for ``key`` once its batch completes."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            future.add_done_callback(_consume)
+            if len(self._pending) >= self.max_batch:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+        # Shielded so one caller giving up does not fail the others
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[str, asyncio.Future]) -> None:
+        logger.debug(f"Dispatching batch of {len(batch)} keys")
+        try:
+            results = await self._load_many(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if future.done():
+                continue
+            value = results.get(key)
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
@@ -6,14 +6,28 @@ import asyncio
 import contextlib
 import importlib.metadata
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from urllib.parse import urljoin
 
 import httpx
 
 from dct_mcp_server.config import get_dct_config
 from dct_mcp_server.core.exceptions import DCTClientError
+from dct_mcp_server.core.filters import format_literal
 from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.dct_client.batching import BatchLoader, batchable_get
+from dct_mcp_server.dct_client.hedging import (
+    HedgeBudget,
+    HedgingConfig,
+    LatencyTracker,
+    run_hedged,
+)
+from dct_mcp_server.dct_client.pagination import (
+    PageCollector,
+    PageSizeTuner,
+    SearchPage,
+)
 
 logger = get_logger(__name__)
 
@@ -28,6 +42,23 @@ class DCTAPIClient:
         self.verify_ssl = self.config["verify_ssl"]
         self.timeout = self.config["timeout"]
         self.max_retries = self.config["max_retries"]
+        self.hedge_enabled = self.config["hedge_enabled"]
+        self.hedge_percentile = self.config["hedge_percentile"]
+
+        # Latency history and hedge budget for idempotent reads
+        self._latency = LatencyTracker()
+        self._hedge_budget = HedgeBudget(self.config["hedge_max_rate"])
+
+        # Bounds the number of requests in flight against DCT at any time
+        self._limiter = asyncio.Semaphore(self.config["max_concurrency"])
+
+        # Per-endpoint page sizes learned from observed search responses
+        self._page_sizes = PageSizeTuner.from_config(self.config)
+
+        # Coalesces concurrent get-by-id requests per collection
+        self._get_batch_window = self.config["get_batch_window_ms"] / 1000
+        self._get_batch_max = self.config["get_batch_max"]
+        self._get_loaders: Dict[str, BatchLoader] = {}
 
         # Get project version for User-Agent
         try:
@@ -70,6 +101,65 @@ class DCTAPIClient:
             await self.close()
             raise DCTClientError(f"A connection error occurred: {e}") from e
 
+    @staticmethod
+    def _latency_key(method: str, endpoint: str) -> Optional[str]:
+        """Return the latency bucket for idempotent reads, None otherwise.
+
+        Searches are bucketed by path; GETs by their top-level collection so
+        that lookups of different IDs share one latency history.
+        """
+        path = endpoint.strip("/")
+        if method.upper() == "POST" and path.endswith("/search"):
+            return f"POST /{path}"
+        if method.upper() == "GET":
+            return f"GET /{path.split('/')[0]}"
+        return None
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send one request attempt, hedging idempotent reads when enabled"""
+
+        def request():
+            return client.request(
+                method=method,
+                url=url,
+                headers=self.headers,
+                json=json_data,
+                params=params,
+                timeout=self.timeout,
+            )
+
+        key = self._latency_key(method, endpoint) if self.hedge_enabled else None
+        if key is None:
+            return await request()
+
+        self._hedge_budget.deposit()
+        delay = self._latency.percentile(key, self.hedge_percentile)
+        if delay is None:
+            started = time.monotonic()
+            response = await request()
+            self._latency.record(key, time.monotonic() - started)
+            return response
+
+        # An error response loses to a slower success of the other attempt
+        response, elapsed, hedged = await run_hedged(
+            request,
+            max(delay, HedgingConfig.MIN_DELAY),
+            self._hedge_budget,
+            accept=lambda response: response.is_success,
+        )
+        self._latency.record(key, elapsed)
+        if hedged:
+            logger.debug(f"Hedged request to {endpoint} completed in {elapsed:.3f}s")
+        return response
+
     async def make_request(
         self,
         method: str,
@@ -80,30 +170,110 @@ class DCTAPIClient:
     ) -> Dict[str, Any]:
         """Make HTTP request to DCT API with retry logic"""
 
-        url = urljoin(f"{self.base_url}/dct/v3/", endpoint.lstrip("/"))
-
         # Use json parameter if provided, otherwise use data
         json_data = json if json is not None else data
 
+        if method.upper() == "GET" and not params and self._get_batch_window > 0:
+            target = batchable_get(endpoint)
+            if target is not None:
+                collection, object_id = target
+                return await self._get_loader(collection).load(object_id)
+
+        response = await self._execute(method, endpoint, json_data, params)
+        return self._parse_response(response)
+
+    def _get_loader(self, collection: str) -> BatchLoader:
+        """Return the get-by-id batcher of a collection"""
+        loader = self._get_loaders.get(collection)
+        if loader is None:
+            loader = self._get_loaders[collection] = BatchLoader(
+                lambda ids: self._get_many(collection, ids),
+                self._get_batch_window,
+                self._get_batch_max,
+            )
+        return loader
+
+    async def _get_many(self, collection: str, ids: List[str]) -> Dict[str, Any]:
+        """Fetch objects by ID with one ``id IN (...)`` search.
+
+        A single ID is fetched with a plain get. IDs the search does not
+        return are fetched individually, so callers see DCT's own error for
+        objects that do not exist.
+        """
+        found: Dict[str, Any] = {}
+        if len(ids) > 1:
+            try:
+                found = await self.search_by_ids(collection, ids)
+            except DCTClientError as e:
+                logger.warning(f"Batched get of {len(ids)} {collection} failed, fetching individually: {e}")
+
+        missing = [object_id for object_id in ids if object_id not in found]
+        if missing:
+            outcomes = await asyncio.gather(
+                *(self._get_one(collection, object_id) for object_id in missing),
+                return_exceptions=True,
+            )
+            found.update(zip(missing, outcomes))
+        return found
+
+    async def search_by_ids(self, collection: str, ids: List[str]) -> Dict[str, Any]:
+        """Fetch objects of a collection by ID with ``id IN (...)`` searches.
+
+        IDs are split into chunks of at most ``DCT_GET_BATCH_MAX`` that are
+        searched concurrently. Returns a mapping from ID to object; IDs that
+        do not exist are absent.
+        """
+        ids = list(dict.fromkeys(ids))
+        chunks = [
+            ids[i : i + self._get_batch_max] for i in range(0, len(ids), self._get_batch_max)
+        ]
+
+        async def search(chunk: List[str]) -> List[Dict[str, Any]]:
+            literals = ", ".join(format_literal(object_id) for object_id in chunk)
+            response = await self._execute(
+                "POST",
+                f"/{collection.strip('/')}/search",
+                {"filter_expression": f"id IN ({literals})"},
+                {"limit": len(chunk)},
+            )
+            return self._parse_response(response).get("items") or []
+
+        wanted = set(ids)
+        found: Dict[str, Any] = {}
+        for items in await asyncio.gather(*(search(chunk) for chunk in chunks)):
+            found.update((item.get("id"), item) for item in items if item.get("id") in wanted)
+        return found
+
+    async def _get_one(self, collection: str, object_id: str) -> Dict[str, Any]:
+        response = await self._execute("GET", f"/{collection}/{object_id}")
+        return self._parse_response(response)
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+        """Decode a DCT response body"""
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return response.json()
+        return {"response": response.text}
+
+    async def _execute(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send a request with retry logic and return the successful response"""
+
+        url = urljoin(f"{self.base_url}/dct/v3/", endpoint.lstrip("/"))
+
         for attempt in range(self.max_retries):
             try:
-                async with self._session() as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=self.headers,
-                        json=json_data,
-                        params=params,
-                        timeout=self.timeout,
+                async with self._session() as client, self._limiter:
+                    response = await self._send(
+                        client, method, url, endpoint, json_data, params
                     )
                     response.raise_for_status()
-
-                    if response.headers.get("content-type", "").startswith(
-                        "application/json"
-                    ):
-                        return response.json()
-                    else:
-                        return {"response": response.text}
+                    return response
 
             except httpx.HTTPStatusError as e:
                 error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
@@ -137,3 +307,227 @@ class DCTAPIClient:
 
         # If we get here, all attempts failed
         raise DCTClientError("All retry attempts failed")
+
+    async def fetch_page(
+        self,
+        endpoint: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> SearchPage:
+        """Fetch a single page of a DCT search endpoint.
+
+        Without an explicit ``limit`` the adaptive page size for the endpoint
+        is used; every page feeds the page size statistics.
+        """
+        if limit is None:
+            limit = self._page_sizes.page_size(endpoint)
+        params = {
+            k: v
+            for k, v in {"cursor": cursor, "limit": limit, "sort": sort}.items()
+            if v is not None
+        }
+        started = time.monotonic()
+        response = await self._execute("POST", endpoint, json_body or {}, params)
+        elapsed = time.monotonic() - started
+        page = SearchPage.from_response(
+            self._parse_response(response), len(response.content), elapsed
+        )
+        self._page_sizes.observe(endpoint, page, limit)
+        return page
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> AsyncIterator[SearchPage]:
+        """Yield the pages of a search, prefetching the next page.
+
+        While the consumer processes page N, page N+1 is already in flight.
+        At most one page is fetched ahead, so memory stays bounded no matter
+        how slowly the consumer runs. Without ``page_size`` every page uses
+        the current adaptive size for the endpoint.
+        """
+
+        def fetch(cursor):
+            return asyncio.ensure_future(
+                self.fetch_page(
+                    endpoint, json_body, cursor=cursor, limit=page_size, sort=sort
+                )
+            )
+
+        pending = fetch(None)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = fetch(page.next_cursor) if page.next_cursor else None
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with contextlib.suppress(BaseException):
+                    await pending
+
+    async def iter_search(
+        self,
+        endpoint: str,
+        filter_expression: Optional[str] = None,
+        page_size: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every item of a search, page by page with next-page prefetch"""
+        json_body = (
+            {"filter_expression": filter_expression} if filter_expression else {}
+        )
+        pages = self.iter_pages(endpoint, json_body, page_size=page_size, sort=sort)
+        try:
+            async for page in pages:
+                for item in page.items:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def scan_search(
+        self,
+        endpoint: str,
+        consume: Callable[[List[Dict[str, Any]]], None],
+        json_body: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Stream the pages of a search into ``consume`` without keeping them.
+
+        ``consume`` runs on each page's items while the next page is fetched.
+        Without ``max_items`` every page is read. Returns response_metadata
+        with the number of items and pages scanned.
+        """
+        if page_size is None and max_items is not None:
+            page_size = max(1, min(self._page_sizes.page_size(endpoint), max_items))
+        scanned = pages_read = 0
+        truncated = False
+        pages = self.iter_pages(endpoint, json_body, page_size=page_size, sort=sort)
+        try:
+            async for page in pages:
+                items = page.items
+                if max_items is not None and scanned + len(items) >= max_items:
+                    truncated = scanned + len(items) > max_items or bool(page.next_cursor)
+                    items = items[: max_items - scanned]
+                consume(items)
+                scanned += len(items)
+                pages_read += 1
+                if max_items is not None and scanned >= max_items:
+                    break
+        finally:
+            await pages.aclose()
+        return {"scanned": scanned, "pages": pages_read, "truncated": truncated}
+
+    async def collect_search(
+        self,
+        endpoint: str,
+        json_body: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Follow ``next_cursor`` and aggregate every page of a search.
+
+        The search starts at ``cursor`` when given, e.g. the ``next_cursor``
+        of an earlier truncated result. The result is bounded by
+        ``max_items`` (never above the configured hard cap) and by the
+        configured byte cap; ``response_metadata`` reports whether and why
+        the result was truncated.
+        """
+        item_cap = self.config["paginate_max_items"]
+        if max_items is not None:
+            item_cap = min(max(max_items, 0), item_cap)
+        byte_cap = self.config["paginate_max_bytes"]
+
+        collector = PageCollector(item_cap, byte_cap)
+        while not collector.full:
+            page = await self.fetch_page(
+                endpoint,
+                json_body,
+                cursor=cursor,
+                limit=min(
+                    page_size or self._page_sizes.page_size(endpoint),
+                    collector.remaining_items,
+                ),
+                sort=sort,
+            )
+            collector.add(page, cursor)
+            if not page.next_cursor:
+                break
+            cursor = page.next_cursor
+        return collector.result()
+
+    async def search_many(
+        self,
+        searches: Dict[str, str],
+        entities: Optional[List[str]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run several entity searches concurrently.
+
+        ``searches`` maps entity names to search endpoints; ``entities``
+        selects a subset. Every search runs under the client concurrency
+        limit with its own timeout, and a failing or slow entity is reported
+        in ``errors`` without affecting the others. ``cursor`` resumes the
+        search of a single selected entity.
+        """
+        if entities:
+            unknown = sorted(set(entities) - set(searches))
+            if unknown:
+                raise ValueError(
+                    f"Unknown entities: {', '.join(unknown)}. "
+                    f"Must be any of: {', '.join(sorted(searches))}"
+                )
+            searches = {k: v for k, v in searches.items() if k in entities}
+        if cursor is not None and len(searches) != 1:
+            raise ValueError(
+                "A cursor resumes the search of one entity; select it with entities=[...]."
+            )
+
+        timeout = self.config["search_all_timeout"]
+        params = {
+            k: v
+            for k, v in {"cursor": cursor, "limit": limit, "sort": sort}.items()
+            if v is not None
+        }
+
+        async def run(entity: str, endpoint: str):
+            if all_pages or max_items is not None:
+                search = self.collect_search(
+                    endpoint,
+                    json_body,
+                    sort=sort,
+                    page_size=limit,
+                    max_items=max_items,
+                    cursor=cursor,
+                )
+            else:
+                search = self.make_request("POST", endpoint, json=json_body, params=params)
+            try:
+                return entity, await asyncio.wait_for(search, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Search of {entity} timed out after {timeout}s")
+                return entity, {"error": f"Timed out after {timeout}s", "timed_out": True}
+            except Exception as e:
+                logger.warning(f"Search of {entity} failed: {e}")
+                return entity, {"error": str(e)}
+
+        outcomes = await asyncio.gather(*(run(e, ep) for e, ep in searches.items()))
+        results = dict(outcomes)
+        return {
+            "results": results,
+            "errors": {e: r["error"] for e, r in results.items() if "error" in r},
+        }
@@ -0,0 +1,132 @@
+"""
+Request hedging support for the DCT API client.
+
+Idempotent reads whose first attempt has not returned by a configured latency
+percentile get a duplicate request; whichever finishes first wins.
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgingConfig:
+    """Configuration constants for request hedging."""
+
+    WINDOW_SIZE = 256  # Latency samples kept per endpoint
+    MIN_SAMPLES = 20  # Samples required before hedging an endpoint
+    MIN_DELAY = 0.05  # Never hedge earlier than this many seconds
+    MAX_BURST = 10.0  # Upper bound on accumulated hedge tokens
+
+
+class LatencyTracker:
+    """Keeps a sliding window of observed latencies per endpoint."""
+
+    def __init__(self, window_size: int = HedgingConfig.WINDOW_SIZE):
+        self._window_size = window_size
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """Record one observed latency for an endpoint."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._window_size)
+        samples.append(seconds)
+
+    def percentile(self, key: str, percentile: float) -> Optional[float]:
+        """Return the given latency percentile, or None without enough samples."""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < HedgingConfig.MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        rank = math.ceil(percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+
+class HedgeBudget:
+    """Token bucket capping hedged requests to a fraction of eligible requests.
+
+    Every eligible request deposits ``max_rate`` tokens and every hedge spends
+    one, so over time at most ``max_rate`` of requests are duplicated.
+    """
+
+    def __init__(self, max_rate: float):
+        self.max_rate = max_rate
+        self._tokens = 0.0
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.max_rate, HedgingConfig.MAX_BURST)
+
+    def try_acquire(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+async def _cancel(task: asyncio.Task) -> None:
+    """Cancel a task and wait for it to unwind."""
+    if not task.done():
+        task.cancel()
+    try:
+        await task
+    except BaseException:
+        pass
+
+
+async def run_hedged(
+    request: Callable[[], Awaitable[T]],
+    delay: float,
+    budget: HedgeBudget,
+    accept: Optional[Callable[[T], bool]] = None,
+) -> Tuple[T, float, bool]:
+    """Run ``request`` and hedge it with a duplicate after ``delay`` seconds.
+
+    Returns the first successful result, the latency of the winning attempt
+    and whether a hedge was issued. The losing attempt is cancelled. A result
+    that ``accept`` rejects counts as a failed attempt, so the other attempt
+    is still awaited; when every attempt fails, the first rejected result is
+    returned, or the first error raised if there is none.
+    """
+    loop = asyncio.get_running_loop()
+    started = {}
+
+    def launch() -> asyncio.Task:
+        task = asyncio.ensure_future(request())
+        started[task] = loop.time()
+        return task
+
+    primary = launch()
+    pending = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if not done and budget.try_acquire():
+            logger.debug(f"Hedging request after {delay:.3f}s")
+            pending.add(launch())
+
+        first_error: Optional[BaseException] = None
+        rejected: Optional[Tuple[Any, float]] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is not None:
+                    first_error = first_error or task.exception()
+                elif accept is None or accept(task.result()):
+                    return task.result(), loop.time() - started[task], len(started) > 1
+                elif rejected is None:
+                    rejected = task.result(), loop.time() - started[task]
+        if rejected is not None:
+            return rejected[0], rejected[1], len(started) > 1
+        raise first_error
+    finally:
+        for task in started:
+            await _cancel(task)
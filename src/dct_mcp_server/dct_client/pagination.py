@@ -0,0 +1,230 @@
+"""
+Pagination helpers for DCT search endpoints.
+
+DCT search responses carry their items under ``items`` and the cursor for the
+next page under ``response_metadata.next_cursor``.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PaginationConfig:
+    """Configuration constants for search pagination."""
+
+    DEFAULT_PAGE_SIZE = 100
+    STATE_FILE = "page_sizes.json"
+    SMOOTHING = 0.3  # Weight of the newest observation in moving averages
+    MAX_STEP = 2  # Page size changes by at most this factor per observation
+    MIN_CHANGE = 0.1  # Ignore proposed changes smaller than this fraction
+
+
+class SearchPage:
+    """One page of a DCT search response."""
+
+    __slots__ = ("items", "next_cursor", "total", "nbytes", "elapsed")
+
+    def __init__(
+        self,
+        items: List[Dict[str, Any]],
+        next_cursor: Optional[str],
+        total: Optional[int],
+        nbytes: int,
+        elapsed: float,
+    ):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+        self.nbytes = nbytes
+        self.elapsed = elapsed
+
+    @classmethod
+    def from_response(
+        cls, payload: Dict[str, Any], nbytes: int, elapsed: float
+    ) -> "SearchPage":
+        """Build a page from a decoded search response."""
+        metadata = payload.get("response_metadata") or {}
+        return cls(
+            items=payload.get("items") or [],
+            next_cursor=metadata.get("next_cursor"),
+            total=metadata.get("total"),
+            nbytes=nbytes,
+            elapsed=elapsed,
+        )
+
+
+class PageCollector:
+    """Aggregates search pages under an item cap and a byte cap.
+
+    Item sizes are estimated from the raw response size of their page, so the
+    byte cap bounds what is shipped back without re-serializing every item.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.items: List[Dict[str, Any]] = []
+        self.nbytes = 0
+        self.pages = 0
+        self.total: Optional[int] = None
+        self.truncated_reason: Optional[str] = None
+        self.resume_cursor: Optional[str] = None
+
+    @property
+    def remaining_items(self) -> int:
+        return max(self.max_items - len(self.items), 0)
+
+    @property
+    def full(self) -> bool:
+        return self.truncated_reason is not None or self.remaining_items == 0
+
+    def add(self, page: SearchPage, cursor: Optional[str]) -> None:
+        """Add a page fetched with ``cursor`` to the aggregate."""
+        self.pages += 1
+        if page.total is not None:
+            self.total = page.total
+        item_bytes = page.nbytes / len(page.items) if page.items else 0
+
+        for item in page.items:
+            if len(self.items) >= self.max_items:
+                self._truncate("max_items", cursor)
+                return
+            if self.nbytes + item_bytes > self.max_bytes:
+                self._truncate("max_bytes", cursor)
+                return
+            self.items.append(item)
+            self.nbytes += item_bytes
+
+        if page.next_cursor and len(self.items) >= self.max_items:
+            self._truncate("max_items", page.next_cursor)
+
+    def _truncate(self, reason: str, resume_cursor: Optional[str]) -> None:
+        self.truncated_reason = reason
+        self.resume_cursor = resume_cursor
+
+    def result(self) -> Dict[str, Any]:
+        """Return the aggregate in DCT search response shape."""
+        return {
+            "items": self.items,
+            "response_metadata": {
+                "total": self.total,
+                "returned": len(self.items),
+                "pages": self.pages,
+                "truncated": self.truncated_reason is not None,
+                "truncated_reason": self.truncated_reason,
+                # Cursor of the first page not fully returned; resuming from
+                # it may repeat items of a partially returned page.
+                "next_cursor": self.resume_cursor,
+            },
+        }
+
+
+class PageSizeTuner:
+    """Tunes the search page size per endpoint from observed responses.
+
+    Keeps moving averages of bytes and seconds per item for each endpoint and
+    picks the largest page that stays within both the target page size and
+    the target page time. Chosen sizes are persisted so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        target_seconds: float,
+        target_bytes: int,
+        min_size: int,
+        max_size: int,
+        state_file: Optional[Path] = None,
+    ):
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.min_size = min_size
+        self.max_size = max_size
+        self._state_file = state_file
+        self._stats: Dict[str, Dict[str, float]] = self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PageSizeTuner":
+        return cls(
+            target_seconds=config["page_target_seconds"],
+            target_bytes=config["page_target_bytes"],
+            min_size=config["page_size_min"],
+            max_size=config["page_size_max"],
+            state_file=Path(config["cache_dir"]) / PaginationConfig.STATE_FILE,
+        )
+
+    def page_size(self, endpoint: str) -> int:
+        """Return the current page size for an endpoint."""
+        size = self._stats.get(endpoint, {}).get(
+            "page_size", PaginationConfig.DEFAULT_PAGE_SIZE
+        )
+        return self._clamp(size)
+
+    def observe(self, endpoint: str, page: SearchPage, limit: int) -> None:
+        """Update the endpoint statistics from a page fetched with ``limit``."""
+        count = len(page.items)
+        if not count:
+            return
+
+        stats = self._stats.setdefault(endpoint, {})
+        self._update_average(stats, "bytes_per_item", page.nbytes / count)
+        # Short pages are dominated by per-request overhead, so only full
+        # pages say anything useful about time per item.
+        if count >= limit:
+            self._update_average(stats, "seconds_per_item", page.elapsed / count)
+
+        candidates = [self.target_bytes / max(stats["bytes_per_item"], 1.0)]
+        if stats.get("seconds_per_item"):
+            candidates.append(self.target_seconds / stats["seconds_per_item"])
+
+        current = self.page_size(endpoint)
+        proposed = int(min(candidates))
+        proposed = min(proposed, current * PaginationConfig.MAX_STEP)
+        proposed = max(proposed, current // PaginationConfig.MAX_STEP)
+        proposed = self._clamp(proposed)
+        if abs(proposed - current) < current * PaginationConfig.MIN_CHANGE:
+            proposed = current
+
+        stats["page_size"] = proposed
+        if proposed != current:
+            logger.debug(f"Page size for {endpoint}: {current} -> {proposed}")
+            self._save()
+
+    def _clamp(self, size: float) -> int:
+        return int(min(max(size, self.min_size), self.max_size))
+
+    @staticmethod
+    def _update_average(stats: Dict[str, float], key: str, value: float) -> None:
+        previous = stats.get(key)
+        if previous is None:
+            stats[key] = value
+        else:
+            alpha = PaginationConfig.SMOOTHING
+            stats[key] = alpha * value + (1 - alpha) * previous
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        if self._state_file is None or not self._state_file.exists():
+            return {}
+        try:
+            with open(self._state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable page size state {self._state_file}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if self._state_file is None:
+            return
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self._state_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f)
+            os.replace(tmp_file, self._state_file)
+        except OSError as e:
+            logger.warning(f"Failed to persist page sizes to {self._state_file}: {e}")
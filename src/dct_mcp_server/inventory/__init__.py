@@ -0,0 +1,33 @@
+from .engines import EngineLookup, register_path_templates
+from .index import (
+    Inventory,
+    InventoryRecord,
+    get_inventory,
+    start_inventory,
+    stop_inventory,
+)
+from .relations import search_joined
+from .resolver import NameResolutionError, get_resolver, start_resolver, stop_resolver
+from .retention import RetentionConfig, sweep_candidates, sweep_plan, sweep_result
+from .store import InventoryStore, StoreConfig
+
+__all__ = [
+    "EngineLookup",
+    "Inventory",
+    "InventoryRecord",
+    "InventoryStore",
+    "NameResolutionError",
+    "RetentionConfig",
+    "StoreConfig",
+    "get_inventory",
+    "get_resolver",
+    "register_path_templates",
+    "search_joined",
+    "start_inventory",
+    "start_resolver",
+    "stop_inventory",
+    "stop_resolver",
+    "sweep_candidates",
+    "sweep_plan",
+    "sweep_result",
+]
@@ -0,0 +1,166 @@
+"""
+Engine lookup for the targets of DCT requests.
+
+Maps a request to the engine that will run its job: the engine of the
+object in the request path or, for calls that create objects, of the
+engine, environment, dataset, snapshot or source named in the body. The
+object in the path is found through the endpoint templates the tools
+register, by the path parameter naming it. An object practically never
+moves between engines, so the inventory is used at any age and every
+lookup is remembered, including objects that were not found.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.inventory.index import INVENTORY_COLLECTIONS, get_inventory
+
+logger = get_logger(__name__)
+
+
+class EngineLookupConfig:
+    """Configuration constants for engine lookups."""
+
+    MAX_CACHED = 10000  # Objects whose engine is remembered
+    # Path parameters naming the engine or an object on it
+    PATH_REFERENCES: Dict[str, Tuple[str, ...]] = {
+        "engineId": (),
+        "vdbId": ("vdbs",),
+        "dsourceId": ("dsources",),
+        "environmentId": ("environments",),
+        "snapshotId": ("snapshots",),
+        "sourceId": ("sources",),
+    }
+    # Body fields naming the engine or an object on it, checked in order
+    BODY_REFERENCES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ("engine_id", ()),
+        ("vdb_id", ("vdbs",)),
+        ("dsource_id", ("dsources",)),
+        ("environment_id", ("environments",)),
+        ("source_data_id", ("vdbs", "dsources")),
+        ("snapshot_id", ("snapshots",)),
+        ("source_id", ("sources",)),
+    )
+
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+# Registered endpoint templates by (method, template), as (pattern, collections);
+# collections is None for templates without an object reference
+_path_templates: Dict[Tuple[str, str], Tuple[Pattern, Optional[Tuple[str, ...]]]] = {}
+
+
+def register_path_templates(operations: Iterable[Tuple[str, str]]) -> None:
+    """Register the (endpoint template, method) pairs of a tool's operations.
+
+    Templates such as "/dsources/oracle/{dsourceId}/attachSource" tell
+    which path segment is the object a request acts on; templates without
+    a path parameter of ``PATH_REFERENCES``, such as
+    "/dsources/oracle/staging-push", tell that no segment is.
+    """
+    for template, method in operations:
+        key = (method.upper(), template)
+        if key in _path_templates:
+            continue
+        params = _PATH_PARAM.findall(template)
+        reference = next((p for p in params if p in EngineLookupConfig.PATH_REFERENCES), None)
+        pattern = ""
+        for part in template.strip("/").split("/"):
+            match = _PATH_PARAM.fullmatch(part)
+            if match is None:
+                pattern += "/" + re.escape(part)
+            else:
+                pattern += "/(?P<ref>[^/]+)" if match.group(1) == reference else "/[^/]+"
+        _path_templates[key] = (
+            re.compile(pattern),
+            EngineLookupConfig.PATH_REFERENCES[reference] if reference is not None else None,
+        )
+
+
+def _path_reference(method: str, endpoint: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Return the object ID in a request path with the collections it may be in.
+
+    Of the templates matching the path, the one with the fewest parameters
+    wins, so "/dsources/oracle/staging-push" is not read as
+    "/dsources/oracle/{dsourceId}".
+    """
+    path = "/" + endpoint.strip("/")
+    matches: List[Tuple[int, Optional[str], Optional[Tuple[str, ...]]]] = []
+    for (template_method, template), (pattern, collections) in _path_templates.items():
+        if template_method != method.upper():
+            continue
+        match = pattern.fullmatch(path)
+        if match is not None:
+            object_id = match.group("ref") if collections is not None else None
+            matches.append((template.count("{"), object_id, collections))
+    if not matches:
+        return None
+    _, object_id, collections = min(matches, key=lambda m: m[0])
+    return (object_id, collections) if collections is not None else None
+
+
+class EngineLookup:
+    """Finds and remembers the engines of DCT objects."""
+
+    def __init__(self, client):
+        self._client = client
+        self._engines: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+
+    async def engine_of(self, collection: str, object_id: str) -> Optional[str]:
+        """Return the engine of an object, or None if it is not known or does not exist."""
+        key = (collection, object_id)
+        if key in self._engines:
+            self._engines.move_to_end(key)
+            return self._engines[key]
+        engine_id = None
+        inventory = get_inventory()
+        record = (
+            inventory.get(collection, object_id, float("inf"))
+            if inventory is not None and collection in INVENTORY_COLLECTIONS
+            else None
+        )
+        if record is not None:
+            engine_id = record.get("engine_id")
+        else:
+            try:
+                found = await self._client.search_by_ids(collection, [object_id])
+            except Exception as e:
+                logger.debug(f"Engine lookup of {collection} {object_id} failed: {e}")
+                return None
+            if object_id in found:
+                engine_id = found[object_id].get("engine_id")
+        self._engines[key] = engine_id
+        while len(self._engines) > EngineLookupConfig.MAX_CACHED:
+            self._engines.popitem(last=False)
+        return engine_id
+
+    async def engine_for(
+        self, method: str, endpoint: str, json_body: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Return the engine a request acts on, or None if it cannot be told."""
+        reference = _path_reference(method, endpoint)
+        if reference is not None:
+            return await self._engine_of_any(*reference)
+        body = json_body or {}
+        for field, collections in EngineLookupConfig.BODY_REFERENCES:
+            value = body.get(field)
+            if isinstance(value, str):
+                engine_id = await self._engine_of_any(value, collections)
+                if engine_id is not None:
+                    return engine_id
+        return None
+
+    async def _engine_of_any(self, object_id: str, collections: Tuple[str, ...]) -> Optional[str]:
+        """Return the engine of an object in the first of ``collections`` holding it.
+
+        No collections means the ID is an engine ID.
+        """
+        if not collections:
+            return object_id
+        for collection in collections:
+            engine_id = await self.engine_of(collection, object_id)
+            if engine_id is not None:
+                return engine_id
+        return None
@@ -0,0 +1,531 @@
+"""
+In-memory inventory of DCT objects.
+
+Keeps VDBs, dSources, environments, engines, VDB groups and bookmarks in
+compact records indexed by id, name, engine and environment, refreshed in
+the background through paginated search. ``get`` and ``search`` requests can
+be answered from the index when it is fresher than a caller-supplied bound.
+
+With an ``InventoryStore`` the index is also persisted in SQLite: it is warmed
+from disk at startup and shared by every server process on the host. Refreshes
+are full resyncs unless the full sync interval is raised above the refresh
+interval, in which case the refreshes in between only fetch new objects.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dct_mcp_server.core.filters import FilterSyntaxError
+from dct_mcp_server.core.filters import compile_filter as compile_filter_expression
+from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.dct_client.pagination import PaginationConfig
+from dct_mcp_server.inventory.store import InventoryStore
+
+logger = get_logger(__name__)
+
+# Inventory collections and the DCT collection path each one mirrors
+INVENTORY_COLLECTIONS = {
+    "vdbs": "/vdbs",
+    "dsources": "/dsources",
+    "environments": "/environments",
+    "engines": "/management/engines",
+    "vdb_groups": "/vdb-groups",
+    "bookmarks": "/bookmarks",
+}
+
+# Timestamp fields that only grow for new objects. Collections listed here
+# are synced incrementally between full resyncs by fetching objects at or past
+# the last seen value; the others are small and always fully resynced. An
+# incremental sync misses changes to existing objects, so the freshness of a
+# collection is counted from its last full sync.
+INCREMENTAL_SYNC_FIELDS = {
+    "vdbs": "creation_date",
+    "dsources": "creation_date",
+    "bookmarks": "creation_date",
+}
+
+INVENTORY_CURSOR_PREFIX = "inventory:"
+
+_MISSING = object()
+
+
+def sort_records(records: List["InventoryRecord"], sort: str) -> List["InventoryRecord"]:
+    """Sort records by a DCT sort expression ("field" or "-field").
+
+    Records without the field sort last; mixed value types fall back to
+    string comparison.
+    """
+    field = sort.lstrip("-")
+    reverse = sort.startswith("-")
+    try:
+        return sorted(
+            records,
+            key=lambda r: (r.get(field) is None, r.get(field)),
+            reverse=reverse,
+        )
+    except TypeError:
+        return sorted(
+            records,
+            key=lambda r: (r.get(field) is None, str(r.get(field))),
+            reverse=reverse,
+        )
+
+
+class FieldSchema:
+    """Field names shared by all records of a collection snapshot.
+
+    Records store their values in a tuple aligned with this schema, so field
+    names are kept once per collection instead of once per object.
+    """
+
+    __slots__ = ("names", "positions")
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.positions: Dict[str, int] = {}
+
+    def encode(self, item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Return the values of ``item`` aligned with the schema."""
+        for key in item:
+            if key not in self.positions:
+                self.positions[key] = len(self.names)
+                self.names.append(key)
+        return tuple(item.get(name, _MISSING) for name in self.names)
+
+
+class InventoryRecord:
+    """Compact representation of one DCT object."""
+
+    __slots__ = ("id", "name", "engine_id", "environment_id", "schema", "values")
+
+    def __init__(self, item: Dict[str, Any], schema: FieldSchema, collection: str):
+        self.id = item.get("id")
+        self.name = item.get("name")
+        self.engine_id = self.id if collection == "engines" else item.get("engine_id")
+        self.environment_id = (
+            self.id if collection == "environments" else item.get("environment_id")
+        )
+        self.schema = schema
+        self.values = schema.encode(item)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Return a top-level field value."""
+        position = self.schema.positions.get(field)
+        if position is None or position >= len(self.values):
+            return default
+        value = self.values[position]
+        return default if value is _MISSING else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the original object."""
+        return {
+            name: value
+            for name, value in zip(self.schema.names, self.values)
+            if value is not _MISSING
+        }
+
+
+class InventoryCollection:
+    """Records of one DCT collection with their secondary indexes."""
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self.search_endpoint = f"{path}/search"
+        self.refreshed_at: Optional[float] = None
+        self.synced_at: Optional[float] = None  # Wall clock time of the stored sync
+        self.full_synced_at: Optional[float] = None  # Wall clock time of the stored full sync
+        self.records: List[InventoryRecord] = []
+        self.by_id: Dict[str, InventoryRecord] = {}
+        self.by_name: Dict[str, List[InventoryRecord]] = {}
+        self.by_engine: Dict[str, List[InventoryRecord]] = {}
+        self.by_environment: Dict[str, List[InventoryRecord]] = {}
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last refresh, or None if never loaded."""
+        if self.refreshed_at is None:
+            return None
+        return time.monotonic() - self.refreshed_at
+
+    def is_fresh(self, max_staleness: float) -> bool:
+        age = self.age()
+        return age is not None and age <= max_staleness
+
+    def replace(
+        self,
+        items: Iterable[Dict[str, Any]],
+        synced_at: Optional[float] = None,
+        full_synced_at: Optional[float] = None,
+    ) -> None:
+        """Rebuild the collection from a full listing and swap it in.
+
+        ``synced_at`` is the wall clock time the listing was last synced from
+        DCT when it comes from the persistent store, and ``full_synced_at``
+        the time of the last full sync, which the age is counted from; both
+        default to now.
+        """
+        schema = FieldSchema()
+        records = [InventoryRecord(item, schema, self.name) for item in items]
+        by_id: Dict[str, InventoryRecord] = {}
+        by_name: Dict[str, List[InventoryRecord]] = {}
+        by_engine: Dict[str, List[InventoryRecord]] = {}
+        by_environment: Dict[str, List[InventoryRecord]] = {}
+        for record in records:
+            by_id[record.id] = record
+            if record.name is not None:
+                by_name.setdefault(record.name, []).append(record)
+            if record.engine_id is not None:
+                by_engine.setdefault(record.engine_id, []).append(record)
+            if record.environment_id is not None:
+                by_environment.setdefault(record.environment_id, []).append(record)
+
+        # Swap everything at once so readers never see a partial rebuild
+        (
+            self.records,
+            self.by_id,
+            self.by_name,
+            self.by_engine,
+            self.by_environment,
+        ) = (records, by_id, by_name, by_engine, by_environment)
+        fresh_at = full_synced_at if full_synced_at is not None else synced_at
+        age = 0.0 if fresh_at is None else max(time.time() - fresh_at, 0.0)
+        self.refreshed_at = time.monotonic() - age
+        self.synced_at = synced_at
+        self.full_synced_at = full_synced_at
+
+
+class Inventory:
+    """Background-synchronized inventory of DCT objects."""
+
+    def __init__(
+        self,
+        client,
+        refresh_interval: float,
+        store: Optional[InventoryStore] = None,
+        full_sync_interval: Optional[float] = None,
+    ):
+        self._client = client
+        self.refresh_interval = refresh_interval
+        # By default every refresh is a full resync
+        self.full_sync_interval = (
+            full_sync_interval if full_sync_interval is not None else refresh_interval
+        )
+        self._store = store
+        self.collections: Dict[str, InventoryCollection] = {
+            name: InventoryCollection(name, path)
+            for name, path in INVENTORY_COLLECTIONS.items()
+        }
+        self._paths = {c.path.lstrip("/"): c for c in self.collections.values()}
+        self._refresh_task: Optional[asyncio.Future] = None
+        self._sync_task: Optional[asyncio.Task] = None
+
+    # Synchronization
+
+    def start(self) -> None:
+        """Warm the index from the persistent store and start the background refresh."""
+        if self._store is not None:
+            for collection in self.collections.values():
+                try:
+                    state = self._store.sync_state(collection.name)
+                    if state.synced_at is not None:
+                        collection.replace(
+                            self._store.load(collection.name), state.synced_at, state.full_synced_at
+                        )
+                except Exception as e:
+                    logger.warning(f"Failed to load stored inventory {collection.name}: {e}")
+        if self._sync_task is None:
+            self._sync_task = asyncio.ensure_future(self._sync_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        for task in (self._sync_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._sync_task = self._refresh_task = None
+
+    async def _sync_loop(self) -> None:
+        # A warm start only needs a refresh once the stored data comes due
+        ages = [c.age() for c in self.collections.values()]
+        if all(age is not None for age in ages):
+            await asyncio.sleep(max(self.refresh_interval - max(ages), 0))
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Inventory refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self) -> None:
+        """Refresh every collection; concurrent callers share one refresh."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh_all())
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh_all(self) -> None:
+        started = time.monotonic()
+        outcomes = await asyncio.gather(
+            *(self._refresh_collection(c) for c in self.collections.values()),
+            return_exceptions=True,
+        )
+        for collection, outcome in zip(self.collections.values(), outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Inventory refresh of {collection.name} failed: {outcome}")
+        logger.info(
+            f"Inventory refreshed in {time.monotonic() - started:.2f}s: "
+            + ", ".join(f"{c.name}={len(c.records)}" for c in self.collections.values())
+        )
+
+    async def _refresh_collection(self, collection: InventoryCollection) -> None:
+        if self._store is None:
+            items = [
+                item async for item in self._client.iter_search(collection.search_endpoint)
+            ]
+            collection.replace(items)
+            return
+
+        # Only one process syncs a collection at a time; the others pick up
+        # its result from the store.
+        if await asyncio.to_thread(self._store.acquire_lease, collection.name):
+            try:
+                await self._sync_to_store(collection)
+            finally:
+                await asyncio.to_thread(self._store.release_lease, collection.name)
+        state = await asyncio.to_thread(self._store.sync_state, collection.name)
+        if state.synced_at is not None and state.synced_at != collection.synced_at:
+            items = await asyncio.to_thread(self._store.load, collection.name)
+            collection.replace(items, state.synced_at, state.full_synced_at)
+
+    async def _sync_to_store(self, collection: InventoryCollection) -> None:
+        """Bring the stored copy of a collection up to date with DCT."""
+        state = await asyncio.to_thread(self._store.sync_state, collection.name)
+        now = time.time()
+        if state.synced_at is not None and now - state.synced_at < self.refresh_interval / 2:
+            return  # Another process synced it recently
+        field = INCREMENTAL_SYNC_FIELDS.get(collection.name)
+
+        if (
+            field is not None
+            and state.high_water is not None
+            and state.full_synced_at is not None
+            and now - state.full_synced_at < self.full_sync_interval
+        ):
+            # Objects are fetched in field order, so the high water mark can
+            # be committed page by page and an interrupted sync resumes there.
+            high_water = state.high_water
+            json_body = {"filter_expression": f"{field} GE '{high_water}'"}
+            async for page in self._client.iter_pages(
+                collection.search_endpoint, json_body=json_body, sort=field
+            ):
+                high_water = _high_water(page.items, field, high_water)
+                await asyncio.to_thread(
+                    self._store.upsert, collection.name, page.items, high_water
+                )
+            # Record the sync even when nothing changed
+            await asyncio.to_thread(self._store.upsert, collection.name, [], high_water)
+            return
+
+        # Full resyncs also pick up deletions and changes to existing objects
+        items = [item async for item in self._client.iter_search(collection.search_endpoint)]
+        high_water = _high_water(items, field, None) if field else None
+        await asyncio.to_thread(self._store.replace, collection.name, items, high_water)
+
+    # Lookups
+
+    def get(
+        self, collection: str, object_id: str, max_staleness: float
+    ) -> Optional[InventoryRecord]:
+        """Return a record by id if the collection is fresh enough."""
+        entries = self.collections[collection]
+        if not entries.is_fresh(max_staleness):
+            return None
+        return entries.by_id.get(object_id)
+
+    def search(
+        self,
+        collection: str,
+        max_staleness: float,
+        predicate: Optional[Callable[[InventoryRecord], bool]] = None,
+        sort: Optional[str] = None,
+    ) -> Optional[List[InventoryRecord]]:
+        """Return matching records if the collection is fresh enough.
+
+        ``sort`` follows DCT syntax: a field name, prefixed with ``-`` for
+        descending order.
+        """
+        entries = self.collections[collection]
+        if not entries.is_fresh(max_staleness):
+            return None
+        records = entries.records
+        if predicate is not None:
+            records = [r for r in records if predicate(r)]
+        if sort:
+            records = sort_records(records, sort)
+        return records
+
+    def records_for_engine(self, collection: str, engine_id: str) -> List[InventoryRecord]:
+        return self.collections[collection].by_engine.get(engine_id, [])
+
+    def records_for_environment(
+        self, collection: str, environment_id: str
+    ) -> List[InventoryRecord]:
+        return self.collections[collection].by_environment.get(environment_id, [])
+
+    def records_named(self, collection: str, name: str) -> List[InventoryRecord]:
+        return self.collections[collection].by_name.get(name, [])
+
+    # Tool integration
+
+    def answer(
+        self,
+        method: str,
+        endpoint: str,
+        json_body: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        max_staleness: float,
+        all_pages: bool = False,
+        max_items: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Answer a get or search request locally, or return None.
+
+        None means the request is not covered by the inventory or the data
+        is too stale, and the caller should go to DCT instead. Searches honor
+        ``limit``, ``sort`` and inventory cursors, and the auto-pagination
+        caps when ``all_pages`` or ``max_items`` is given. Raises ValueError
+        for a malformed inventory cursor, which DCT could not resume either.
+        """
+        path = endpoint.strip("/")
+        if method == "GET":
+            base, _, object_id = path.rpartition("/")
+            collection = self._paths.get(base)
+            if collection is None:
+                return None
+            record = self.get(collection.name, object_id, max_staleness)
+            return record.to_dict() if record is not None else None
+
+        if method != "POST":
+            return None
+        params = params or {}
+        cursor = params.get("cursor")
+        if cursor is not None and not str(cursor).startswith(INVENTORY_CURSOR_PREFIX):
+            return None
+        offset = _cursor_offset(cursor) if cursor else 0
+        records = self.matching(endpoint, json_body, max_staleness, sort=params.get("sort"))
+        if records is None:
+            return None
+        collection = self._paths[path[: -len("/search")]]
+        if all_pages or max_items is not None:
+            cap = self._client.config["paginate_max_items"]
+            limit = min(max_items, cap) if max_items is not None else cap
+        else:
+            limit = int(params.get("limit") or PaginationConfig.DEFAULT_PAGE_SIZE)
+        page = records[offset : offset + limit]
+        next_offset = offset + len(page)
+        return {
+            "items": [record.to_dict() for record in page],
+            "response_metadata": {
+                "total": len(records),
+                "next_cursor": f"{INVENTORY_CURSOR_PREFIX}{next_offset}"
+                if next_offset < len(records)
+                else None,
+                "source": "inventory",
+                "age_seconds": round(collection.age(), 3),
+            },
+        }
+
+    def matching(
+        self,
+        endpoint: str,
+        json_body: Optional[Dict[str, Any]],
+        max_staleness: float,
+        sort: Optional[str] = None,
+    ) -> Optional[List[InventoryRecord]]:
+        """Return the records matching a search request, or None.
+
+        None means the search is not covered by the inventory or the data is
+        too stale.
+        """
+        path = endpoint.strip("/")
+        if not path.endswith("/search"):
+            return None
+        collection = self._paths.get(path[: -len("/search")])
+        body = json_body or {}
+        if collection is None or set(body) - {"filter_expression"}:
+            return None
+        predicate = self.compile_filter(body.get("filter_expression"))
+        if predicate is False:
+            return None
+        return self.search(collection.name, max_staleness, predicate=predicate, sort=sort)
+
+    def compile_filter(self, filter_expression: Optional[str]):
+        """Return a record predicate, None for no filter, or False if unsupported."""
+        if not filter_expression:
+            return None
+        try:
+            return compile_filter_expression(filter_expression)
+        except FilterSyntaxError:
+            return False  # Let DCT report the error
+
+
+def _high_water(
+    items: List[Dict[str, Any]], field: str, current: Optional[str]
+) -> Optional[str]:
+    """Return the largest value of ``field`` among items and ``current``."""
+    values = [str(item[field]) for item in items if item.get(field) is not None]
+    if current is not None:
+        values.append(current)
+    return max(values) if values else None
+
+
+def _cursor_offset(cursor: Any) -> int:
+    """Return the record offset an inventory cursor points at."""
+    offset = str(cursor)[len(INVENTORY_CURSOR_PREFIX):]
+    if not offset.isdigit():
+        raise ValueError(
+            f"Invalid cursor '{cursor}': inventory cursors are the next_cursor of "
+            f"an earlier inventory page, e.g. '{INVENTORY_CURSOR_PREFIX}100'."
+        )
+    return int(offset)
+
+
+# Global instance
+_inventory: Optional[Inventory] = None
+
+
+# Public API
+def start_inventory(
+    client,
+    refresh_interval: float,
+    store_path: Optional[Path] = None,
+    full_sync_interval: Optional[float] = None,
+) -> Inventory:
+    """Create the global inventory and start its background refresh
+
+    With ``store_path`` the inventory is persisted in that SQLite database;
+    if the database cannot be opened the inventory runs in memory only.
+    """
+    global _inventory
+    if _inventory is None:
+        store = None
+        if store_path is not None:
+            try:
+                store = InventoryStore(store_path, client.base_url)
+            except Exception as e:
+                logger.warning(f"Inventory persistence disabled, cannot open {store_path}: {e}")
+        _inventory = Inventory(client, refresh_interval, store, full_sync_interval)
+        _inventory.start()
+    return _inventory
+
+
+async def stop_inventory() -> None:
+    """Stop the global inventory"""
+    global _inventory
+    if _inventory is not None:
+        await _inventory.stop()
+        _inventory = None
+
+
+def get_inventory() -> Optional[Inventory]:
+    """Get the global inventory (returns None if not started)"""
+    return _inventory
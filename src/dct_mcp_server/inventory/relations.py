@@ -0,0 +1,228 @@
+"""
+Relationship joins over DCT search results.
+
+Expands related objects (a VDB's parent dSource, environment, engine, latest
+snapshot, ...) into every item of a search, fetching each relation once for
+all items with batched lookups. Expansion is bounded by a depth limit and a
+budget on the number of related objects fetched.
+"""
+
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from dct_mcp_server.core.filters import format_literal
+from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.core.projection import entity_name
+from dct_mcp_server.dct_client.pagination import PaginationConfig
+from dct_mcp_server.inventory.index import get_inventory
+
+logger = get_logger(__name__)
+
+
+class JoinConfig:
+    """Configuration constants for relationship joins."""
+
+    MAX_DEPTH = 2  # Longest relation path, e.g. "parent_dsource.latest_snapshot"
+    MAX_LOOKUPS = 500  # Related objects fetched per join
+
+
+class Relation(NamedTuple):
+    """A relation from an entity to objects of another collection.
+
+    With ``field`` set, the relation is to-one: ``field`` on the source
+    object holds the ID of the related object. With ``reference`` set, the
+    relation is the first object of ``collection`` whose ``reference`` field
+    holds the source object's ID, in ``sort`` order.
+    """
+
+    collection: str
+    field: Optional[str] = None
+    reference: Optional[str] = None
+    sort: Optional[str] = None
+
+
+# Relations available per entity type
+RELATIONS: Dict[str, Dict[str, Relation]] = {
+    "vdbs": {
+        "parent_dsource": Relation("/dsources", field="parent_dsource_id"),
+        "environment": Relation("/environments", field="environment_id"),
+        "engine": Relation("/management/engines", field="engine_id"),
+        "latest_snapshot": Relation("/snapshots", reference="dataset_id", sort="-timestamp"),
+    },
+    "dsources": {
+        "source": Relation("/sources", field="source_id"),
+        "engine": Relation("/management/engines", field="engine_id"),
+        "latest_snapshot": Relation("/snapshots", reference="dataset_id", sort="-timestamp"),
+    },
+    "snapshots": {
+        "timeflow": Relation("/timeflows", field="timeflow_id"),
+        "engine": Relation("/management/engines", field="engine_id"),
+    },
+    "environments": {
+        "engine": Relation("/management/engines", field="engine_id"),
+    },
+    "sources": {
+        "environment": Relation("/environments", field="environment_id"),
+    },
+}
+
+
+def parse_relations(entity: str, relations: Optional[List[str]]) -> Dict[str, Any]:
+    """Build a relation tree from dotted relation paths.
+
+    Defaults to every direct relation of the entity. Raises ValueError for
+    unknown relations or paths deeper than ``JoinConfig.MAX_DEPTH``.
+    """
+    if entity not in RELATIONS:
+        raise ValueError(f"No relations are defined for {entity}.")
+    if not relations:
+        return {name: {} for name in RELATIONS[entity]}
+
+    tree: Dict[str, Any] = {}
+    for path in relations:
+        parts = path.split(".")
+        if len(parts) > JoinConfig.MAX_DEPTH:
+            raise ValueError(
+                f"Relation '{path}' is deeper than the limit of {JoinConfig.MAX_DEPTH}."
+            )
+        node, current = tree, entity
+        for part in parts:
+            available = RELATIONS.get(current, {})
+            if part not in available:
+                raise ValueError(
+                    f"Unknown relation '{part}' for {current}. "
+                    f"Available: {', '.join(sorted(available)) or 'none'}."
+                )
+            node = node.setdefault(part, {})
+            current = entity_name(available[part].collection)
+    return tree
+
+
+class _Budget:
+    """Caps the number of related objects fetched by one join."""
+
+    def __init__(self, limit: int):
+        self.remaining = limit
+        self.exhausted = False
+
+    def take(self, wanted: int) -> int:
+        granted = min(wanted, self.remaining)
+        self.remaining -= granted
+        if granted < wanted:
+            self.exhausted = True
+        return granted
+
+
+class _Join:
+    def __init__(self, client, max_staleness: Optional[float], budget: _Budget):
+        self._client = client
+        self._max_staleness = max_staleness
+        self._budget = budget
+        self.lookups = 0
+
+    async def expand(self, entity: str, objects: List[Dict[str, Any]], tree: Dict[str, Any]) -> None:
+        """Embed the relations in ``tree`` into ``objects``, in place."""
+        await asyncio.gather(
+            *(
+                self._expand_relation(entity, objects, name, subtree)
+                for name, subtree in tree.items()
+            )
+        )
+
+    async def _expand_relation(
+        self, entity: str, objects: List[Dict[str, Any]], name: str, subtree: Dict[str, Any]
+    ) -> None:
+        relation = RELATIONS[entity][name]
+        if relation.field is not None:
+            keys = list(dict.fromkeys(o[relation.field] for o in objects if o.get(relation.field)))
+            related = await self._fetch_by_ids(relation.collection, keys)
+            for obj in objects:
+                obj[name] = related.get(obj.get(relation.field))
+        else:
+            keys = list(dict.fromkeys(o["id"] for o in objects if o.get("id")))
+            related = await self._fetch_first_referencing(relation, keys)
+            for obj in objects:
+                obj[name] = related.get(obj.get("id"))
+
+        if subtree and related:
+            # Related objects are shared between items, so each is expanded once
+            await self.expand(entity_name(relation.collection), list(related.values()), subtree)
+
+    async def _fetch_by_ids(self, collection: str, ids: List[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        inventory = get_inventory()
+        inventory_name = entity_name(collection)
+        if (
+            self._max_staleness is not None
+            and inventory is not None
+            and inventory_name in inventory.collections
+        ):
+            for object_id in ids:
+                record = inventory.get(inventory_name, object_id, self._max_staleness)
+                if record is not None:
+                    found[object_id] = record.to_dict()
+        missing = [object_id for object_id in ids if object_id not in found]
+        missing = missing[: self._budget.take(len(missing))]
+        if missing:
+            self.lookups += len(missing)
+            found.update(await self._client.search_by_ids(collection, missing))
+        return found
+
+    async def _fetch_first_referencing(
+        self, relation: Relation, ids: List[str]
+    ) -> Dict[str, Any]:
+        ids = ids[: self._budget.take(len(ids))]
+        self.lookups += len(ids)
+
+        async def first(object_id: str) -> Optional[Dict[str, Any]]:
+            result = await self._client.make_request(
+                "POST",
+                f"{relation.collection}/search",
+                json={"filter_expression": f"{relation.reference} EQ {format_literal(object_id)}"},
+                params={"limit": 1, "sort": relation.sort},
+            )
+            items = result.get("items") or []
+            return items[0] if items else None
+
+        results = await asyncio.gather(*(first(object_id) for object_id in ids))
+        return {object_id: item for object_id, item in zip(ids, results) if item is not None}
+
+
+async def search_joined(
+    client,
+    endpoint: str,
+    relations: Optional[List[str]] = None,
+    json_body: Optional[Dict[str, Any]] = None,
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    max_items: Optional[int] = None,
+    max_staleness: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run a search and embed the requested relations into every item.
+
+    Each item gets one key per relation holding the related object, or None
+    if it has none. With ``max_staleness``, to-one relations are served from
+    the inventory when it is fresh enough.
+    """
+    entity = entity_name(endpoint)
+    tree = parse_relations(entity, relations)
+    if max_items is None:
+        max_items = limit or PaginationConfig.DEFAULT_PAGE_SIZE
+    result = await client.collect_search(
+        endpoint, json_body=json_body, sort=sort, page_size=limit, max_items=max_items
+    )
+
+    budget = _Budget(JoinConfig.MAX_LOOKUPS)
+    join = _Join(client, max_staleness, budget)
+    await join.expand(entity, result["items"], tree)
+    if budget.exhausted:
+        logger.warning(f"Join on {endpoint} stopped at {JoinConfig.MAX_LOOKUPS} lookups")
+
+    result["response_metadata"].update(
+        {
+            "relations": relations or list(tree),
+            "lookups": join.lookups,
+            "relations_truncated": budget.exhausted,
+        }
+    )
+    return result
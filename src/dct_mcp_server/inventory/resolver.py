@@ -0,0 +1,242 @@
+"""
+Name-to-ID resolution for tool path parameters.
+
+Lets ``vdbId``, ``dsourceId``, ``environmentId`` and ``snapshotId`` be given
+as either an ID or an object name. Names are resolved from the inventory when
+it is fresh enough, then from a TTL cache, and otherwise with one batched
+search per collection.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from dct_mcp_server.core.filters import format_literal
+from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.inventory.index import get_inventory
+
+logger = get_logger(__name__)
+
+
+class ResolverConfig:
+    """Configuration constants for name resolution."""
+
+    MAX_ENTRIES = 4096  # Cached names kept before the oldest are evicted
+    MAX_CASE_INSENSITIVE_MATCHES = 200  # Items scanned for case-insensitive matches
+
+
+# Path parameters that accept names, with the inventory collection and DCT
+# collection path each one refers to
+RESOLVABLE_PARAMS = {
+    "vdbId": ("vdbs", "/vdbs"),
+    "dsourceId": ("dsources", "/dsources"),
+    "environmentId": ("environments", "/environments"),
+    "snapshotId": ("snapshots", "/snapshots"),
+}
+
+# DCT object IDs look like "1-ORACLE_DB_CONTAINER-3" or are UUIDs; such
+# values are used as-is without a lookup.
+_ID_PATTERN = re.compile(
+    r"^\d+-[A-Z][A-Z0-9_]*-\d+$"
+    r"|^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
+class NameResolutionError(ValueError):
+    """Raised when a name matches no object or more than one object."""
+
+    def __init__(self, param: str, value: str, candidates: List[Dict[str, Any]]):
+        if candidates:
+            listed = ", ".join(f"{c['id']} ({c['name']})" for c in candidates)
+            message = f"{param} '{value}' is ambiguous; it matches: {listed}. Pass an ID instead."
+        else:
+            message = f"{param} '{value}' matches no object by ID or name."
+        super().__init__(message)
+        self.param = param
+        self.value = value
+        self.candidates = candidates
+
+
+def _candidate(item: Any) -> Dict[str, Any]:
+    return {"id": item.get("id"), "name": item.get("name"), "engine_id": item.get("engine_id")}
+
+
+def _pick(value: str, items: List[Any]) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Match a value against items by ID, exact name, then case-insensitive name.
+
+    Returns the resolved ID, or None with the ambiguous candidates (empty if
+    nothing matched).
+    """
+    for item in items:
+        if item.get("id") == value:
+            return value, []
+    for matches in (
+        [item for item in items if item.get("name") == value],
+        [item for item in items if str(item.get("name", "")).lower() == value.lower()],
+    ):
+        if len(matches) == 1:
+            return matches[0].get("id"), []
+        if matches:
+            return None, [_candidate(item) for item in matches]
+    return None, []
+
+
+class NameResolver:
+    """Resolves object names given for ID path parameters."""
+
+    def __init__(self, client, ttl: float):
+        self._client = client
+        self.ttl = ttl
+        # (param, value) -> (expires_at, resolved ID or ambiguous candidates)
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+    async def resolve(
+        self, endpoint: str, path_params: Dict[str, Optional[str]]
+    ) -> Dict[str, Optional[str]]:
+        """Return ``path_params`` with names replaced by IDs.
+
+        Only parameters used by ``endpoint`` are resolved. Raises
+        NameResolutionError for unknown or ambiguous names.
+        """
+        pending: Dict[str, str] = {
+            param: value
+            for param, value in path_params.items()
+            if value is not None
+            and param in RESOLVABLE_PARAMS
+            and f"{{{param}}}" in endpoint
+            and not _ID_PATTERN.match(value)
+        }
+        if not pending:
+            return path_params
+        resolved = await asyncio.gather(
+            *(self.resolve_values(param, [value]) for param, value in pending.items())
+        )
+        updated = dict(path_params)
+        for (param, value), ids in zip(pending.items(), resolved):
+            updated[param] = ids[value]
+        return updated
+
+    async def resolve_values(self, param: str, values: List[str]) -> Dict[str, str]:
+        """Resolve several values of one parameter, looking up misses in one search."""
+        ids: Dict[str, str] = {}
+        misses = []
+        for value in dict.fromkeys(values):
+            outcome = self._lookup_cache(param, value)
+            if outcome is None:
+                outcome = self._lookup_inventory(param, value)
+            if outcome is None:
+                misses.append(value)
+            elif isinstance(outcome, str):
+                ids[value] = outcome
+            else:
+                raise NameResolutionError(param, value, outcome)
+
+        if misses:
+            for value, outcome in (await self._search(param, misses)).items():
+                if not isinstance(outcome, str):
+                    raise NameResolutionError(param, value, outcome)
+                ids[value] = outcome
+        return ids
+
+    def _lookup_cache(self, param: str, value: str) -> Any:
+        entry = self._cache.get((param, value))
+        if entry is None:
+            return None
+        expires_at, outcome = entry
+        if expires_at < time.monotonic():
+            del self._cache[(param, value)]
+            return None
+        return outcome
+
+    def _store(self, param: str, value: str, outcome: Any) -> None:
+        if len(self._cache) >= ResolverConfig.MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[(param, value)] = (time.monotonic() + self.ttl, outcome)
+
+    def _lookup_inventory(self, param: str, value: str) -> Any:
+        """Resolve from the inventory if it is fresher than the TTL; None on a miss."""
+        inventory = get_inventory()
+        collection = RESOLVABLE_PARAMS[param][0]
+        if inventory is None or collection not in inventory.collections:
+            return None
+        entries = inventory.collections[collection]
+        if not entries.is_fresh(self.ttl):
+            return None
+        if value in entries.by_id:
+            return value
+        exact = entries.by_name.get(value, [])
+        if len(exact) == 1:
+            return exact[0].id
+        if exact:
+            return [_candidate(record) for record in exact]
+        lowered = value.lower()
+        similar = [r for r in entries.records if str(r.name or "").lower() == lowered]
+        if len(similar) == 1:
+            return similar[0].id
+        # A miss may be an object created since the last refresh
+        return [_candidate(record) for record in similar] or None
+
+    async def _search(self, param: str, values: List[str]) -> Dict[str, Any]:
+        """Resolve values with batched searches: exact ID or name, then case-insensitive name."""
+        search_endpoint = f"{RESOLVABLE_PARAMS[param][1]}/search"
+        literals = ", ".join(format_literal(value) for value in values)
+        filter_expression = f"id IN ({literals}) OR name IN ({literals})"
+        items = [
+            item
+            async for item in self._client.iter_search(
+                search_endpoint, filter_expression=filter_expression
+            )
+        ]
+        outcomes = {}
+        unmatched = []
+        for value in values:
+            resolved, candidates = _pick(value, items)
+            if resolved is None and not candidates:
+                unmatched.append(value)
+            else:
+                outcomes[value] = resolved or candidates
+
+        if unmatched:
+            filter_expression = " OR ".join(
+                f"name CONTAINS {format_literal(value)}" for value in unmatched
+            )
+            result = await self._client.collect_search(
+                search_endpoint,
+                json_body={"filter_expression": filter_expression},
+                max_items=ResolverConfig.MAX_CASE_INSENSITIVE_MATCHES,
+            )
+            for value in unmatched:
+                resolved, candidates = _pick(value, result["items"])
+                outcomes[value] = resolved or candidates
+
+        for value, outcome in outcomes.items():
+            if outcome:
+                self._store(param, value, outcome)
+        logger.debug(f"Resolved {param} values {values} with DCT searches")
+        return outcomes
+
+
+# Global instance
+_resolver: Optional[NameResolver] = None
+
+
+# Public API
+def start_resolver(client, ttl: float) -> NameResolver:
+    """Create the global name resolver"""
+    global _resolver
+    if _resolver is None:
+        _resolver = NameResolver(client, ttl)
+    return _resolver
+
+
+def stop_resolver() -> None:
+    """Drop the global name resolver"""
+    global _resolver
+    _resolver = None
+
+
+def get_resolver() -> Optional[NameResolver]:
+    """Get the global name resolver (returns None if not started)"""
+    return _resolver
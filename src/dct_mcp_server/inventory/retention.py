@@ -0,0 +1,277 @@
+"""
+Retention sweeps over DCT snapshots.
+
+Snapshots are streamed oldest first and become candidates when their
+expiration has passed, when the dataset they belong to no longer exists, or
+when they are older than a given age. Datasets are listed before the scan,
+so the datasets of orphaned candidates are looked up again afterwards in
+case they were created in between. Snapshots kept forever and snapshots
+that may still back something are never swept: the newest snapshot of every
+dataset, for every child VDB the snapshot of its parent it was provisioned
+from, and for every bookmark the snapshots it names or was taken from.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from dct_mcp_server.core.bulk import BulkConfig
+from dct_mcp_server.core.filters import format_literal
+from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.jobs.poller import parse_timestamp
+
+logger = get_logger(__name__)
+
+
+class RetentionConfig:
+    """Configuration constants for snapshot retention sweeps."""
+
+    DELETE_ENDPOINT = "/snapshots/{snapshotId}/delete"
+    SNAPSHOT_FIELDS = ("id", "name", "dataset_id", "engine_id", "timestamp", "expiration", "size")
+    SIZE_FIELD = "size"  # Bytes freed when a snapshot is deleted
+    MAX_CANDIDATES = BulkConfig.MAX_TARGETS  # Snapshots one sweep may delete
+    LOOKUP_CONCURRENCY = 8  # Concurrent searches for the snapshots that back VDBs and bookmarks
+
+
+def _taken_at(snapshot: Dict[str, Any]) -> Optional[float]:
+    return parse_timestamp(snapshot.get("timestamp") or snapshot.get("creation_time"))
+
+
+def _reason(
+    snapshot: Dict[str, Any], now: float, cutoff: Optional[float], datasets: Set[str]
+) -> Optional[str]:
+    """Return why a snapshot may be swept, or None if retention keeps it."""
+    expiration = parse_timestamp(snapshot.get("effective_expiration") or snapshot.get("expiration"))
+    if expiration is not None and expiration <= now:
+        return "expired"
+    if snapshot.get("dataset_id") not in datasets:
+        return "orphaned"
+    taken = _taken_at(snapshot)
+    if cutoff is not None and taken is not None and taken < cutoff:
+        return "age"
+    return None
+
+
+class _References:
+    """Datasets that exist and the points in time VDBs and bookmarks depend on."""
+
+    def __init__(self):
+        self.datasets: Set[str] = set()
+        self.pinned: Dict[str, str] = {}  # Snapshot ID -> kind of the object naming it
+        self.points: Dict[str, List[Tuple[str, Optional[str]]]] = {}  # Dataset -> (kind, timestamp)
+
+    def add_vdbs(self, vdbs: List[Dict[str, Any]]) -> None:
+        for vdb in vdbs:
+            self.datasets.add(vdb.get("id"))
+            if vdb.get("parent_id"):
+                self.points.setdefault(vdb["parent_id"], []).append(
+                    ("vdb", vdb.get("parent_timeflow_timestamp"))
+                )
+
+    def add_dsources(self, dsources: List[Dict[str, Any]]) -> None:
+        self.datasets.update(dsource.get("id") for dsource in dsources)
+
+    def add_bookmarks(self, bookmarks: List[Dict[str, Any]]) -> None:
+        for bookmark in bookmarks:
+            for snapshot_id in bookmark.get("snapshot_ids") or [bookmark.get("snapshot_id")]:
+                if snapshot_id:
+                    self.pinned[snapshot_id] = "bookmark"
+            for vdb_id in bookmark.get("vdb_ids") or []:
+                self.points.setdefault(vdb_id, []).append(("bookmark", bookmark.get("timestamp")))
+
+
+async def _collect_references(client) -> _References:
+    references = _References()
+    await asyncio.gather(
+        client.scan_search("/vdbs/search", references.add_vdbs),
+        client.scan_search("/dsources/search", references.add_dsources),
+        client.scan_search("/bookmarks/search", references.add_bookmarks),
+    )
+    return references
+
+
+async def _protected(
+    client, candidates: List[Dict[str, Any]], references: _References
+) -> Dict[str, str]:
+    """Map the candidates that may still back something to the kind of dependent."""
+    protected = {
+        snapshot["id"]: references.pinned[snapshot["id"]]
+        for snapshot in candidates
+        if snapshot["id"] in references.pinned
+    }
+    lookups: Dict[Tuple[str, Optional[str]], str] = {}
+    for dataset_id in dict.fromkeys(snapshot["dataset_id"] for snapshot in candidates):
+        if dataset_id in references.datasets:
+            lookups[(dataset_id, None)] = "latest"
+        for kind, timestamp in references.points.get(dataset_id, []):
+            if timestamp is None:
+                # Without the point in time, every snapshot of the parent may be the one
+                protected.update(
+                    (snapshot["id"], kind)
+                    for snapshot in candidates
+                    if snapshot["dataset_id"] == dataset_id
+                )
+            else:
+                lookups.setdefault((dataset_id, timestamp), kind)
+
+    semaphore = asyncio.Semaphore(RetentionConfig.LOOKUP_CONCURRENCY)
+
+    async def newest(dataset_id: str, timestamp: Optional[str]) -> Optional[str]:
+        expression = f"dataset_id EQ {format_literal(dataset_id)}"
+        if timestamp is not None:
+            expression += f" AND timestamp LE {format_literal(timestamp)}"
+        async with semaphore:
+            page = await client.fetch_page(
+                "/snapshots/search", {"filter_expression": expression}, limit=1, sort="-timestamp"
+            )
+        return page.items[0].get("id") if page.items else None
+
+    found = await asyncio.gather(*(newest(*point) for point in lookups))
+    for snapshot_id, kind in zip(found, lookups.values()):
+        if snapshot_id is not None:
+            protected.setdefault(snapshot_id, kind)
+    return protected
+
+
+async def _recheck_orphans(
+    client,
+    candidates: List[Dict[str, Any]],
+    references: _References,
+    now: float,
+    cutoff: Optional[float],
+) -> List[Dict[str, Any]]:
+    """Reconsider orphaned candidates whose dataset was created during the scan."""
+    missing = list(
+        dict.fromkeys(
+            snapshot["dataset_id"]
+            for snapshot in candidates
+            if snapshot["reason"] == "orphaned" and snapshot["dataset_id"]
+        )
+    )
+    if not missing:
+        return candidates
+    vdbs, dsources = await asyncio.gather(
+        client.search_by_ids("vdbs", missing), client.search_by_ids("dsources", missing)
+    )
+    if not vdbs and not dsources:
+        return candidates
+    logger.info(f"Retention sweep found {len(vdbs) + len(dsources)} datasets created during the scan")
+    references.add_vdbs(list(vdbs.values()))
+    references.add_dsources(list(dsources.values()))
+    rechecked = []
+    for snapshot in candidates:
+        if snapshot["reason"] == "orphaned" and snapshot["dataset_id"] in references.datasets:
+            reason = _reason(snapshot, now, cutoff, references.datasets)
+            if reason is None:
+                continue
+            snapshot = {**snapshot, "reason": reason}
+        rechecked.append(snapshot)
+    return rechecked
+
+
+def _totals(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    by_engine: Dict[str, Dict[str, Any]] = {}
+    total = unknown = 0
+    for snapshot in snapshots:
+        engine = by_engine.setdefault(snapshot.get("engine_id"), {"snapshots": 0, "bytes": 0})
+        engine["snapshots"] += 1
+        size = snapshot.get(RetentionConfig.SIZE_FIELD)
+        if isinstance(size, (int, float)):
+            total += size
+            engine["bytes"] += size
+        else:
+            unknown += 1
+    return {"bytes": total, "unknown_size": unknown, "by_engine": by_engine}
+
+
+async def sweep_candidates(
+    client,
+    older_than_days: Optional[float] = None,
+    filter_expression: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Find the snapshots a retention sweep would delete, oldest first.
+
+    ``filter_expression`` narrows the snapshots considered. At most
+    ``RetentionConfig.MAX_CANDIDATES`` are returned; ``truncated`` tells
+    whether another sweep would find more. Raises ValueError for a negative
+    age.
+    """
+    if older_than_days is not None and older_than_days < 0:
+        raise ValueError("older_than_days must not be negative.")
+    now = time.time()
+    cutoff = now - older_than_days * 86400 if older_than_days is not None else None
+    references = await _collect_references(client)
+
+    candidates: List[Dict[str, Any]] = []
+    kept = {"retain_forever": 0, "bookmark": 0}
+    scanned = 0
+    truncated = False
+    async for snapshot in client.iter_search(
+        "/snapshots/search", filter_expression=filter_expression, sort="timestamp"
+    ):
+        scanned += 1
+        if snapshot.get("effective_retain_forever") or snapshot.get("retain_forever"):
+            kept["retain_forever"] += 1
+            continue
+        reason = _reason(snapshot, now, cutoff, references.datasets)
+        if reason is None:
+            continue
+        if snapshot.get("id") in references.pinned:
+            kept["bookmark"] += 1
+            continue
+        if len(candidates) == RetentionConfig.MAX_CANDIDATES:
+            truncated = True
+            break
+        candidates.append(
+            {
+                **{field: snapshot.get(field) for field in RetentionConfig.SNAPSHOT_FIELDS},
+                "reason": reason,
+            }
+        )
+
+    candidates = await _recheck_orphans(client, candidates, references, now, cutoff)
+    protected = await _protected(client, candidates, references)
+    for kind in protected.values():
+        kept[kind] = kept.get(kind, 0) + 1
+    candidates = [snapshot for snapshot in candidates if snapshot["id"] not in protected]
+    totals = _totals(candidates)
+    reasons: Dict[str, int] = {}
+    for snapshot in candidates:
+        reasons[snapshot["reason"]] = reasons.get(snapshot["reason"], 0) + 1
+    logger.info(
+        f"Retention sweep found {len(candidates)} of {scanned} snapshots, "
+        f"{totals['bytes']} bytes reclaimable"
+    )
+    return {
+        "operation": "sweep",
+        "candidates": candidates,
+        "candidate_count": len(candidates),
+        "by_reason": reasons,
+        "reclaimable_bytes": totals["bytes"],
+        "unknown_size": totals["unknown_size"],
+        "by_engine": totals["by_engine"],
+        "kept": kept,
+        "scanned": scanned,
+        "truncated": truncated,
+    }
+
+
+def sweep_plan(report: Dict[str, Any], token: str, expires_in: float) -> Dict[str, Any]:
+    """Describe a retention sweep awaiting confirmation with ``token``."""
+    return {
+        "requires_confirmation": True,
+        **report,
+        "confirmation_token": token,
+        "expires_in_seconds": expires_in,
+        "message": (
+            f"This operation 'sweep' is destructive and would delete {report['candidate_count']} "
+            f"snapshots, reclaiming {report['reclaimable_bytes']} bytes. Please review the "
+            "candidates and call again with confirmation_token to delete exactly these snapshots."
+        ),
+    }
+
+
+def sweep_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the space the started deletions free once their jobs finish to a bulk result."""
+    deleted = [item for item in result["items"] if item["status"] == "succeeded"]
+    return {**result, "reclaimable_bytes": _totals(deleted)["bytes"]}
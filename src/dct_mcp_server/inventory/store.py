@@ -0,0 +1,204 @@
+"""
+Persistent SQLite store for the DCT inventory.
+
+The store lets the inventory survive restarts and be shared by several server
+processes on the same machine. It uses WAL mode so readers never block the
+writer, and a per-collection lease so only one process at a time syncs a
+collection from DCT while the others read the result.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class StoreConfig:
+    """Configuration constants for the inventory store."""
+
+    DB_FILE = "inventory.sqlite3"
+    BUSY_TIMEOUT_MS = 5000
+    LEASE_SECONDS = 300  # A crashed syncer releases its lease after this
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    dct_url TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (dct_url, collection, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    dct_url TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    high_water TEXT,
+    synced_at REAL,
+    full_synced_at REAL,
+    lease_owner TEXT,
+    lease_until REAL,
+    PRIMARY KEY (dct_url, collection)
+);
+"""
+
+
+class SyncState:
+    """Sync bookkeeping of one collection."""
+
+    __slots__ = ("high_water", "synced_at", "full_synced_at")
+
+    def __init__(
+        self,
+        high_water: Optional[str] = None,
+        synced_at: Optional[float] = None,
+        full_synced_at: Optional[float] = None,
+    ):
+        self.high_water = high_water
+        self.synced_at = synced_at
+        self.full_synced_at = full_synced_at
+
+
+class InventoryStore:
+    """SQLite-backed copy of the inventory for one DCT instance.
+
+    All methods are blocking and open their own connection, so they can be
+    run in worker threads with ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: Path, dct_url: str):
+        self.path = Path(path)
+        self.dct_url = dct_url
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path, timeout=StoreConfig.BUSY_TIMEOUT_MS / 1000, isolation_level=None
+        )
+        conn.execute(f"PRAGMA busy_timeout={StoreConfig.BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # Leases
+
+    def acquire_lease(self, collection: str) -> bool:
+        """Claim the right to sync a collection; False if another process holds it."""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT lease_owner, lease_until FROM sync_state "
+                    "WHERE dct_url = ? AND collection = ?",
+                    (self.dct_url, collection),
+                ).fetchone()
+                if row and row[0] not in (None, self.owner) and (row[1] or 0) > now:
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute(
+                    "INSERT INTO sync_state (dct_url, collection, lease_owner, lease_until) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (dct_url, collection) DO UPDATE "
+                    "SET lease_owner = excluded.lease_owner, lease_until = excluded.lease_until",
+                    (self.dct_url, collection, self.owner, now + StoreConfig.LEASE_SECONDS),
+                )
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def release_lease(self, collection: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE sync_state SET lease_owner = NULL, lease_until = NULL "
+                "WHERE dct_url = ? AND collection = ? AND lease_owner = ?",
+                (self.dct_url, collection, self.owner),
+            )
+
+    # Reads
+
+    def sync_state(self, collection: str) -> SyncState:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT high_water, synced_at, full_synced_at FROM sync_state "
+                "WHERE dct_url = ? AND collection = ?",
+                (self.dct_url, collection),
+            ).fetchone()
+        return SyncState(*row) if row else SyncState()
+
+    def load(self, collection: str) -> List[Dict[str, Any]]:
+        """Return every stored object of a collection."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT payload FROM objects WHERE dct_url = ? AND collection = ?",
+                (self.dct_url, collection),
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    # Writes
+
+    def replace(
+        self, collection: str, items: Iterable[Dict[str, Any]], high_water: Optional[str]
+    ) -> None:
+        """Replace a collection with a full listing."""
+        now = time.time()
+        rows = [self._row(collection, item) for item in items]
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "DELETE FROM objects WHERE dct_url = ? AND collection = ?",
+                    (self.dct_url, collection),
+                )
+                conn.executemany("INSERT INTO objects VALUES (?, ?, ?, ?)", rows)
+                self._update_state(conn, collection, high_water, now, full=True)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def upsert(
+        self, collection: str, items: Iterable[Dict[str, Any]], high_water: Optional[str]
+    ) -> None:
+        """Insert or update objects from an incremental sync page."""
+        rows = [self._row(collection, item) for item in items]
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO objects VALUES (?, ?, ?, ?) ON CONFLICT "
+                    "(dct_url, collection, id) DO UPDATE SET payload = excluded.payload",
+                    rows,
+                )
+                self._update_state(conn, collection, high_water, time.time(), full=False)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _row(self, collection: str, item: Dict[str, Any]):
+        return (self.dct_url, collection, item["id"], json.dumps(item, separators=(",", ":")))
+
+    def _update_state(
+        self,
+        conn: sqlite3.Connection,
+        collection: str,
+        high_water: Optional[str],
+        now: float,
+        full: bool,
+    ) -> None:
+        conn.execute(
+            "INSERT INTO sync_state (dct_url, collection, high_water, synced_at, full_synced_at) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (dct_url, collection) DO UPDATE SET "
+            "high_water = COALESCE(excluded.high_water, sync_state.high_water), "
+            "synced_at = excluded.synced_at, "
+            "full_synced_at = COALESCE(excluded.full_synced_at, sync_state.full_synced_at)",
+            (self.dct_url, collection, high_water, now, now if full else None),
+        )
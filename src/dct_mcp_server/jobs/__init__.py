@@ -0,0 +1,43 @@
+from .analytics import JobDurations, duration_window
+from .orchestration import GroupRefresh, refresh_plan, select_group_members
+from .poller import (
+    TERMINAL_STATES,
+    JobPoller,
+    get_job_poller,
+    start_job_poller,
+    stop_job_poller,
+)
+from .progress import job_progress, report_job_progress, report_progress
+from .scheduler import (
+    EngineQueueTimeout,
+    EngineScheduler,
+    get_engine_scheduler,
+    start_engine_scheduler,
+    stop_engine_scheduler,
+)
+from .tracker import JobTracker, get_job_tracker, start_job_tracker, stop_job_tracker
+
+__all__ = [
+    "TERMINAL_STATES",
+    "EngineQueueTimeout",
+    "EngineScheduler",
+    "GroupRefresh",
+    "JobDurations",
+    "JobPoller",
+    "JobTracker",
+    "duration_window",
+    "get_engine_scheduler",
+    "get_job_poller",
+    "get_job_tracker",
+    "job_progress",
+    "refresh_plan",
+    "report_job_progress",
+    "report_progress",
+    "select_group_members",
+    "start_engine_scheduler",
+    "start_job_poller",
+    "start_job_tracker",
+    "stop_engine_scheduler",
+    "stop_job_poller",
+    "stop_job_tracker",
+]
@@ -0,0 +1,85 @@
+"""
+Duration analytics over DCT job history.
+
+Jobs of a time window are streamed from ``/jobs/search`` into per-group
+quantile sketches, so p50/p95/p99 run times per job type, engine or target
+can be computed over any number of jobs in constant memory.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from dct_mcp_server.core.aggregation import QuantileAggregator
+from dct_mcp_server.core.filters import format_literal
+
+from .poller import TERMINAL_STATES, parse_timestamp
+
+
+class AnalyticsConfig:
+    """Configuration constants for job analytics."""
+
+    DEFAULT_WINDOW_DAYS = 7  # Window analyzed when no start is given
+    DEFAULT_GROUP_BY = ("type",)
+
+
+def job_duration(job: Dict[str, Any]) -> Optional[float]:
+    """Return the seconds a finished job ran, or None if it has not finished."""
+    if job.get("status") not in TERMINAL_STATES:
+        return None
+    started = parse_timestamp(job.get("start_time"))
+    # A finished job is last updated when it ends
+    ended = parse_timestamp(job.get("end_time") or job.get("update_time"))
+    if started is None or ended is None:
+        return None
+    return max(0.0, ended - started)
+
+
+def _window_bound(name: str, value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    timestamp = parse_timestamp(value)
+    if timestamp is None:
+        raise ValueError(f"{name} must be an ISO 8601 timestamp, e.g. '2024-05-01T00:00:00Z'.")
+    return _format(datetime.fromtimestamp(timestamp, timezone.utc))
+
+
+def _format(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def duration_window(
+    since: Optional[str], until: Optional[str], filter_expression: Optional[str] = None
+) -> Tuple[Dict[str, Optional[str]], str]:
+    """Return the analyzed window and the filter selecting the jobs started in it.
+
+    ``since`` defaults to seven days ago and ``until`` to now. A given
+    ``filter_expression`` further narrows the jobs and is passed to DCT as
+    is. Raises ValueError for invalid timestamps.
+    """
+    start = _window_bound("since", since) or _format(
+        datetime.now(timezone.utc) - timedelta(days=AnalyticsConfig.DEFAULT_WINDOW_DAYS)
+    )
+    end = _window_bound("until", until)
+    if end is not None and end <= start:
+        raise ValueError("until must be later than since.")
+    clauses = [f"start_time GE {format_literal(start)}"]
+    if end is not None:
+        clauses.append(f"start_time LT {format_literal(end)}")
+    if filter_expression:
+        clauses.append(f"({filter_expression})")
+    return {"since": start, "until": end}, " AND ".join(clauses)
+
+
+class JobDurations(QuantileAggregator):
+    """Per-group quantiles of the run time in seconds of finished jobs.
+
+    ``spec`` takes ``group_by`` (default ``["type"]``) and ``quantiles``
+    (default p50, p95 and p99). Jobs that have not finished are skipped.
+    """
+
+    def __init__(self, spec: Optional[Dict[str, Any]] = None):
+        if spec is not None and not isinstance(spec, dict):
+            raise ValueError("aggregate must be an object with group_by and quantiles.")
+        super().__init__(
+            {"group_by": list(AnalyticsConfig.DEFAULT_GROUP_BY), **(spec or {})}, job_duration
+        )
@@ -0,0 +1,273 @@
+"""
+Dependency-aware refresh of a set of VDBs.
+
+A VDB provisioned from another VDB of the set must be refreshed after its
+parent, or it would pick up the parent's stale data. The parent links form
+a forest; every VDB is refreshed as soon as its parent's refresh job has
+completed, so independent branches run side by side instead of level by
+level, bounded overall and per engine like bulk operations.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dct_mcp_server.core.bulk import select_targets
+from dct_mcp_server.core.filters import format_literal
+from dct_mcp_server.core.logging import get_logger
+
+from .poller import TERMINAL_STATES, JobPoller
+
+logger = get_logger(__name__)
+
+
+class OrchestrationConfig:
+    """Configuration constants for group refreshes."""
+
+    REFRESH_ENDPOINT = "/vdbs/{vdbId}/refresh_by_timestamp"  # Without a timestamp: latest parent data
+    MEMBER_FIELDS = ("id", "name", "engine_id", "parent_id")
+
+
+def _member(vdb: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: vdb.get(field) for field in OrchestrationConfig.MEMBER_FIELDS}
+
+
+async def select_group_members(
+    client,
+    vdb_group: Optional[str] = None,
+    ids: Optional[List[str]] = None,
+    filter_expression: Optional[str] = None,
+    resolve: Optional[Callable[[str, Dict[str, str]], Awaitable[Dict[str, str]]]] = None,
+) -> List[Dict[str, Any]]:
+    """Return the VDBs of a VDB group (ID or name), or those selected by ids or a filter.
+
+    Filter matches are streamed by ``select_targets``, so no page or byte
+    cap cuts the set short. Raises ValueError for unknown groups or VDBs and
+    for filters matching more than ``BulkConfig.MAX_TARGETS`` VDBs, so a
+    refresh never runs on a partial set.
+    """
+    if vdb_group:
+        group = (await client.search_by_ids("vdb-groups", [vdb_group])).get(vdb_group)
+        if group is None:
+            response = await client.make_request(
+                "POST",
+                "/vdb-groups/search",
+                json={"filter_expression": f"name EQ {format_literal(vdb_group)}"},
+            )
+            matches = response.get("items") or []
+            if len(matches) != 1:
+                raise ValueError(
+                    f"VDB group '{vdb_group}' was not found."
+                    if not matches
+                    else f"VDB group name '{vdb_group}' is ambiguous: "
+                    f"{', '.join(match.get('id', '') for match in matches)}."
+                )
+            group = matches[0]
+        member_ids = list(group.get("vdb_ids") or [])
+    else:
+        targets = await select_targets(
+            client,
+            OrchestrationConfig.REFRESH_ENDPOINT,
+            ids=ids,
+            filter_expression=filter_expression,
+            resolve=resolve,
+        )
+        unresolved = [target["error"] for target in targets if "error" in target]
+        if unresolved:
+            raise ValueError(" ".join(unresolved))
+        member_ids = [target["id"] for target in targets]
+    if not member_ids:
+        raise ValueError("No VDBs to refresh.")
+    found = await client.search_by_ids("vdbs", member_ids)
+    missing = [vdb_id for vdb_id in member_ids if vdb_id not in found]
+    if missing:
+        raise ValueError(f"VDBs not found: {', '.join(missing)}.")
+    return [_member(found[vdb_id]) for vdb_id in dict.fromkeys(member_ids)]
+
+
+def _parents(vdbs: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Map each VDB to its parent if the parent is one of the VDBs too."""
+    ids = {vdb["id"] for vdb in vdbs}
+    return {
+        vdb["id"]: vdb.get("parent_id") if vdb.get("parent_id") in ids - {vdb["id"]} else None
+        for vdb in vdbs
+    }
+
+
+def dependency_levels(vdbs: List[Dict[str, Any]]) -> List[List[str]]:
+    """Group VDB IDs by depth: roots first, then the VDBs provisioned from them.
+
+    Raises ValueError if the parent links form a cycle.
+    """
+    parents = _parents(vdbs)
+    children: Dict[str, List[str]] = {}
+    for vdb_id, parent in parents.items():
+        if parent is not None:
+            children.setdefault(parent, []).append(vdb_id)
+    levels: List[List[str]] = []
+    current = [vdb_id for vdb_id, parent in parents.items() if parent is None]
+    while current:
+        levels.append(current)
+        current = [child for vdb_id in current for child in children.get(vdb_id, [])]
+    if sum(len(level) for level in levels) != len(parents):
+        raise ValueError("The parent links of the VDBs form a cycle.")
+    return levels
+
+
+def refresh_plan(vdbs: List[Dict[str, Any]], token: str, expires_in: float) -> Dict[str, Any]:
+    """Describe a group refresh awaiting confirmation with ``token``."""
+    names = {vdb["id"]: vdb.get("name") for vdb in vdbs}
+    return {
+        "requires_confirmation": True,
+        "operation": "refresh_group",
+        "levels": [
+            [{"id": vdb_id, "name": names[vdb_id]} for vdb_id in level]
+            for level in dependency_levels(vdbs)
+        ],
+        "target_count": len(vdbs),
+        "confirmation_token": token,
+        "expires_in_seconds": expires_in,
+        "message": (
+            f"This operation 'refresh_group' is destructive and would refresh {len(vdbs)} VDBs, "
+            "each after its parent. Please review the levels and call again with "
+            "confirmation_token to proceed."
+        ),
+    }
+
+
+class GroupRefresh:
+    """Refreshes VDBs in dependency order and waits on each refresh job.
+
+    At most ``concurrency`` refresh jobs run at once and at most
+    ``engine_concurrency`` per engine; a slot is held until the job ends.
+    ``schedule``, called as ``schedule(method, endpoint, json_body, call)``,
+    runs each refresh request, e.g. through the per-engine job scheduler.
+    VDBs whose parent refresh did not complete are skipped. The run returns
+    after ``timeout`` seconds at most: jobs still running then are reported
+    as pending, and VDBs not started yet as skipped.
+    """
+
+    def __init__(
+        self,
+        client,
+        poller: JobPoller,
+        concurrency: int,
+        engine_concurrency: int,
+        follow_timeout: float,
+        schedule: Optional[Callable[..., Awaitable[Any]]] = None,
+        timeout: Optional[float] = None,
+    ):
+        self._client = client
+        self._schedule = schedule
+        self._poller = poller
+        self.concurrency = concurrency
+        self.engine_concurrency = engine_concurrency
+        self.follow_timeout = follow_timeout
+        self.timeout = timeout
+
+    async def _refresh(self, vdb_id: str, json_body: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        endpoint = OrchestrationConfig.REFRESH_ENDPOINT.replace("{vdbId}", vdb_id)
+
+        def call() -> Awaitable[Any]:
+            return self._client.make_request("POST", endpoint, json=json_body or {})
+
+        if self._schedule is None:
+            response = await call()
+        else:
+            response = await self._schedule("POST", endpoint, json_body, call)
+        if isinstance(response, dict) and response.get("started") is False:
+            raise ValueError(response["message"])
+        job = response.get("job") if isinstance(response, dict) else None
+        if not isinstance(job, dict) or not job.get("id"):
+            raise ValueError(f"Refreshing {vdb_id} did not start a job.")
+        return job
+
+    async def _wait(self, job_id: str, deadline: float) -> Dict[str, Any]:
+        """Return the job once terminal, or its latest state at ``deadline``."""
+        while True:
+            remaining = deadline - time.monotonic()
+            result = await self._poller.wait(job_id, max(min(self.follow_timeout, remaining), 0.0))
+            if result["terminal"] or time.monotonic() >= deadline:
+                return result["job"] or {"id": job_id}
+
+    async def run(
+        self,
+        vdbs: List[Dict[str, Any]],
+        json_body: Optional[Dict[str, Any]] = None,
+        on_started: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_progress: Optional[Callable[[int, int, str], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """Refresh every VDB after its parent and return each one's outcome."""
+        levels = dependency_levels(vdbs)
+        parents = _parents(vdbs)
+        finished = {vdb["id"]: asyncio.Event() for vdb in vdbs}
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        overall = asyncio.Semaphore(self.concurrency)
+        engines: Dict[Any, asyncio.Semaphore] = {}
+        started_at = time.monotonic()
+        deadline = started_at + self.timeout if self.timeout is not None else float("inf")
+
+        async def refresh(vdb: Dict[str, Any]) -> None:
+            vdb_id = vdb["id"]
+            outcome = outcomes[vdb_id] = dict(vdb)
+            try:
+                parent = parents[vdb_id]
+                if parent is not None:
+                    await finished[parent].wait()
+                    if outcomes[parent]["status"] != "succeeded":
+                        outcome.update(status="skipped", error=f"Parent {parent} was not refreshed.")
+                        return
+                engine_id = vdb.get("engine_id")
+                per_engine = (
+                    engines.setdefault(engine_id, asyncio.Semaphore(self.engine_concurrency))
+                    if engine_id is not None
+                    else contextlib.nullcontext()
+                )
+                async with per_engine, overall:
+                    if time.monotonic() >= deadline:
+                        outcome.update(status="skipped", error="The group refresh timed out before it started.")
+                        return
+                    began = time.monotonic()
+                    job = await self._refresh(vdb_id, json_body)
+                    outcome["job_id"] = job["id"]
+                    if on_started is not None:
+                        on_started(job)
+                    job = await self._wait(job["id"], deadline)
+                    outcome["job_status"] = job.get("status")
+                    outcome["seconds"] = round(time.monotonic() - began, 3)
+                    if job.get("status") not in TERMINAL_STATES:
+                        outcome["status"] = "pending"
+                    else:
+                        outcome["status"] = "succeeded" if job.get("status") == "COMPLETED" else "failed"
+            except Exception as e:
+                logger.warning(f"Group refresh of {vdb_id} failed: {e}")
+                outcome.update(status="failed", error=str(e))
+            finally:
+                finished[vdb_id].set()
+                if on_progress is not None:
+                    done = sum(event.is_set() for event in finished.values())
+                    await on_progress(
+                        done,
+                        len(vdbs),
+                        f"{done}/{len(vdbs)} VDBs done; {vdb.get('name') or vdb_id}: "
+                        f"{outcome.get('status', 'failed')}",
+                    )
+
+        await asyncio.gather(*(refresh(vdb) for vdb in vdbs))
+        items = [outcomes[vdb_id] for level in levels for vdb_id in level]
+        counts = {
+            status: sum(item["status"] == status for item in items)
+            for status in ("succeeded", "failed", "skipped", "pending")
+        }
+        return {
+            "operation": "refresh_group",
+            "levels": levels,
+            "items": items,
+            "total": len(items),
+            **counts,
+            "partial_failure": 0 < counts["succeeded"] < len(items),
+            "timed_out": time.monotonic() >= deadline and counts["succeeded"] < len(items),
+            "job_ids": [item["job_id"] for item in items if item.get("job_id")],
+            "elapsed_seconds": round(time.monotonic() - started_at, 3),
+        }
@@ -0,0 +1,247 @@
+"""
+Shared, batched polling of DCT jobs.
+
+Every caller waiting on a job is multiplexed onto one background task that
+fetches all watched jobs with a single ``id IN (...)`` search per tick and
+wakes the waiters through futures once their job reaches a terminal state.
+The interval between ticks grows with the age of the youngest watched job,
+so fresh jobs are checked often and long-running ones cheaply.
+"""
+
+import asyncio
+import contextlib
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Job states after which a job no longer changes
+TERMINAL_STATES = frozenset({"COMPLETED", "FAILED", "CANCELED", "ABANDONED", "TIMEDOUT"})
+
+
+class PollerConfig:
+    """Configuration constants for the job poller."""
+
+    AGE_FACTOR = 0.1  # Poll interval as a fraction of the youngest job's age
+    MAX_MISSES = 3  # Polls a job may be absent from the results before waiters fail
+
+
+def _consume(future: asyncio.Future) -> None:
+    # Mark exceptions as retrieved when every waiter has gone away
+    if not future.cancelled():
+        future.exception()
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Return a DCT timestamp as a Unix timestamp, or None if it is not one."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _started_at(job: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Return a job's start time as a Unix timestamp, if it has one."""
+    return parse_timestamp((job or {}).get("start_time"))
+
+
+def _new_future() -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    future.add_done_callback(_consume)
+    return future
+
+
+class _Watch:
+    """A watched job with the futures and counters of its waiters.
+
+    ``future`` resolves once the job is terminal; ``update`` resolves on
+    every change of the job and is then replaced by a fresh future.
+    """
+
+    __slots__ = ("future", "update", "job", "waiters", "misses", "watched_at")
+
+    def __init__(self):
+        self.future = _new_future()
+        self.update = _new_future()
+        self.job: Optional[Dict[str, Any]] = None
+        self.waiters = 0
+        self.misses = 0
+        self.watched_at = time.time()
+
+    def age(self) -> float:
+        started = _started_at(self.job)
+        return time.time() - (started if started is not None else self.watched_at)
+
+    def changed(self, job: Dict[str, Any]) -> None:
+        if job == self.job:
+            return
+        self.job = job
+        update, self.update = self.update, _new_future()
+        update.set_result(job)
+
+
+class JobPoller:
+    """Polls watched jobs in batches until they reach a terminal state."""
+
+    def __init__(self, client, min_interval: float, max_interval: float):
+        self._client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._watches: Dict[str, _Watch] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.polls = 0
+
+    async def wait(
+        self,
+        job_id: str,
+        timeout: float,
+        on_update: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """Wait until a job reaches a terminal state or ``timeout`` passes.
+
+        ``on_update`` is awaited with the job every time a poll finds it
+        changed, the terminal job included. Returns the latest job object with whether it is terminal
+        and whether the wait timed out. Raises ValueError if the job does
+        not exist.
+        """
+        watch = self._watch(job_id)
+        watch.waiters += 1
+        started = time.monotonic()
+        deadline = started + timeout
+        timed_out = False
+        try:
+            while True:
+                wanted = watch.future if on_update is None else watch.update
+                try:
+                    job = await asyncio.wait_for(
+                        asyncio.shield(wanted), max(0.0, deadline - time.monotonic())
+                    )
+                except asyncio.TimeoutError:
+                    job, timed_out = watch.job, True
+                    break
+                if watch.future.done():
+                    job = watch.future.result()
+                    if on_update is not None:
+                        await on_update(job)
+                    break
+                await on_update(job)
+        finally:
+            watch.waiters -= 1
+            self._release(job_id, watch)
+        status = (job or {}).get("status")
+        return {
+            "job": job,
+            "status": status,
+            "terminal": status in TERMINAL_STATES,
+            "timed_out": timed_out,
+            "waited_seconds": round(time.monotonic() - started, 3),
+        }
+
+    def _watch(self, job_id: str) -> _Watch:
+        watch = self._watches.get(job_id)
+        if watch is None:
+            watch = self._watches[job_id] = _Watch()
+            # Poll the new job right away instead of at the next tick
+            self._wakeup.set()
+            if self._task is None:
+                self._task = asyncio.ensure_future(self._run())
+        return watch
+
+    def _release(self, job_id: str, watch: _Watch) -> None:
+        if watch.waiters == 0 and self._watches.get(job_id) is watch:
+            del self._watches[job_id]
+
+    def _finish(self, job_id: str, watch: _Watch, job: Any = None, error: Exception = None) -> None:
+        self._watches.pop(job_id, None)
+        for future in (watch.future, watch.update):
+            if not future.done():
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(job)
+
+    def _interval(self) -> float:
+        youngest = min((watch.age() for watch in self._watches.values()), default=0.0)
+        return min(self.max_interval, max(self.min_interval, youngest * PollerConfig.AGE_FACTOR))
+
+    async def _run(self) -> None:
+        try:
+            while self._watches:
+                self._wakeup.clear()
+                await self._poll()
+                if not self._watches:
+                    break
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self._interval())
+        finally:
+            self._task = None
+
+    async def _poll(self) -> None:
+        job_ids = list(self._watches)
+        try:
+            found = await self._client.search_by_ids("jobs", job_ids)
+        except Exception as e:
+            logger.warning(f"Polling {len(job_ids)} jobs failed, retrying next tick: {e}")
+            return
+        self.polls += 1
+        for job_id in job_ids:
+            watch = self._watches.get(job_id)
+            if watch is None:
+                continue
+            job = found.get(job_id)
+            if job is None:
+                watch.misses += 1
+                if watch.misses >= PollerConfig.MAX_MISSES:
+                    self._finish(job_id, watch, error=ValueError(f"Job '{job_id}' was not found."))
+                continue
+            watch.misses = 0
+            watch.changed(job)
+            if job.get("status") in TERMINAL_STATES:
+                self._finish(job_id, watch, job)
+
+    async def stop(self) -> None:
+        """Stop polling and cancel every pending wait."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for watch in self._watches.values():
+            watch.future.cancel()
+            watch.update.cancel()
+        self._watches.clear()
+
+
+# Global instance
+_job_poller: Optional[JobPoller] = None
+
+
+# Public API
+def start_job_poller(client, min_interval: float, max_interval: float) -> JobPoller:
+    """Create the global job poller"""
+    global _job_poller
+    if _job_poller is None:
+        _job_poller = JobPoller(client, min_interval, max_interval)
+    return _job_poller
+
+
+async def stop_job_poller() -> None:
+    """Stop the global job poller"""
+    global _job_poller
+    if _job_poller is not None:
+        await _job_poller.stop()
+        _job_poller = None
+
+
+def get_job_poller() -> Optional[JobPoller]:
+    """Get the global job poller (returns None if not started)"""
+    return _job_poller
@@ -0,0 +1,55 @@
+"""
+MCP progress notifications for DCT jobs.
+
+Turns job snapshots from the job poller into progress notifications, so a
+client that passed a progress token sees a long-running job advance without
+spending tool calls on polling.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from dct_mcp_server.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def current_step(job: Dict[str, Any]) -> Optional[str]:
+    """Return the title of the job's running task, or of its latest task."""
+    tasks = [task for task in job.get("virtualization_tasks") or [] if isinstance(task, dict)]
+    running = [task for task in tasks if task.get("status") in ("RUNNING", "STARTED")]
+    for task in reversed(running or tasks):
+        if task.get("title"):
+            return task["title"]
+    return None
+
+
+def job_progress(job: Dict[str, Any]) -> Tuple[float, str]:
+    """Return a job's percent complete and a one-line status message."""
+    try:
+        percent = float(job.get("percent_complete") or 0)
+    except (TypeError, ValueError):
+        percent = 0.0
+    label = job.get("localized_type") or job.get("type") or "Job"
+    message = f"{label} {job.get('id')}: {job.get('status', 'UNKNOWN')}"
+    step = current_step(job)
+    if step:
+        message += f" - {step}"
+    return percent, message
+
+
+async def report_progress(ctx, progress: float, total: float, message: str) -> None:
+    """Send a progress notification if there is a context; failures are only logged."""
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(progress, total, message)
+    except Exception as e:
+        logger.debug(f"Could not report progress ({message}): {e}")
+
+
+async def report_job_progress(ctx, job: Dict[str, Any]) -> None:
+    """Send a progress notification for a job; failures are only logged."""
+    if not job:
+        return
+    percent, message = job_progress(job)
+    await report_progress(ctx, percent, 100, message)
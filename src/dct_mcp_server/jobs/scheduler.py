@@ -0,0 +1,278 @@
+"""
+Per-engine scheduling of job-starting requests.
+
+DCT hands every job to one of the engines it manages, and the engine, not
+DCT, limits how many provision, refresh or link jobs finish in time. The
+scheduler admits at most ``limit`` jobs started through this server per
+engine; a slot is held from the request until its job finishes, followed on
+the shared job poller. Further requests for a busy engine queue in arrival
+order, and a freed slot goes to the oldest waiter, so no caller overtakes
+the queue. A request that waits longer than the queue timeout is given up
+without being sent.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from dct_mcp_server.core.logging import get_logger
+from dct_mcp_server.core.sketch import DDSketch
+
+from .poller import TERMINAL_STATES, JobPoller
+
+logger = get_logger(__name__)
+
+
+class SchedulerConfig:
+    """Configuration constants for the engine scheduler."""
+
+    COLLECTIONS = ("vdbs", "dsources", "environments")  # Requests scheduled per engine
+    WAIT_QUANTILES = (0.5, 0.95)
+
+
+class EngineQueueTimeout(Exception):
+    """Raised when a request waited too long for a slot on its engine and was not sent."""
+
+    def __init__(self, engine_id: str, waited: float, queued_behind: int):
+        super().__init__(
+            f"Engine {engine_id} stayed busy for {waited:.1f}s with {queued_behind} requests "
+            "queued ahead; the request was not sent. Retry once its jobs finish."
+        )
+        self.engine_id = engine_id
+        self.waited = waited
+        self.queued_behind = queued_behind
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the request that was given up as a tool result."""
+        return {
+            "started": False,
+            "message": str(self),
+            "engine_queue": {
+                "engine_id": self.engine_id,
+                "waited_seconds": round(self.waited, 3),
+                "queued_behind": self.queued_behind,
+                "timed_out": True,
+            },
+        }
+
+
+class _EngineQueue:
+    """Slots, waiters and wait statistics of one engine."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.timed_out = 0
+        self.peak_depth = 0
+        self.waits = DDSketch()
+
+    def to_dict(self, limit: int) -> Dict[str, Any]:
+        waits = self.waits
+
+        def seconds(value: Optional[float]) -> Optional[float]:
+            return round(value, 3) if value is not None else None
+
+        return {
+            "limit": limit,
+            "in_flight": self.in_flight,
+            "queue_depth": len(self.waiters),
+            "peak_queue_depth": self.peak_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "timed_out": self.timed_out,
+            "wait_seconds": {
+                **{
+                    f"p{round(q * 100)}": seconds(waits.quantile(q))
+                    for q in SchedulerConfig.WAIT_QUANTILES
+                },
+                "max": seconds(waits.max) if waits.count else None,
+                "mean": seconds(waits.sum / waits.count) if waits.count else None,
+            },
+        }
+
+
+class EngineScheduler:
+    """Bounds the jobs started through this server per engine.
+
+    ``locate`` maps a request (method, endpoint, body) to its engine; requests
+    it cannot place run unscheduled. ``follow_timeout`` bounds each wait on
+    the poller while a slot is held, and ``queue_timeout`` (None for no
+    bound) the wait of a request for a slot.
+    """
+
+    def __init__(
+        self,
+        poller: JobPoller,
+        limit: int,
+        follow_timeout: float,
+        locate: Callable[[str, str, Optional[Dict[str, Any]]], Awaitable[Optional[str]]],
+        queue_timeout: Optional[float] = None,
+    ):
+        self._poller = poller
+        self.limit = limit
+        self.follow_timeout = follow_timeout
+        self.queue_timeout = queue_timeout
+        self._locate = locate
+        self._engines: Dict[str, _EngineQueue] = {}
+        self._holds: Dict[str, asyncio.Task] = {}
+
+    async def acquire(self, engine_id: str) -> float:
+        """Wait for a slot on an engine and return the seconds waited.
+
+        Raises EngineQueueTimeout if no slot frees up within the queue timeout.
+        """
+        queue = self._engines.setdefault(engine_id, _EngineQueue())
+        started = time.monotonic()
+        if queue.in_flight < self.limit and not queue.waiters:
+            queue.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            queued_behind = len(queue.waiters)
+            queue.waiters.append(waiter)
+            queue.queued += 1
+            queue.peak_depth = max(queue.peak_depth, len(queue.waiters))
+            try:
+                # A slot handed over as the timeout fires is still taken
+                await asyncio.wait_for(waiter, self.queue_timeout)
+            except asyncio.TimeoutError:
+                with contextlib.suppress(ValueError):
+                    queue.waiters.remove(waiter)
+                queue.timed_out += 1
+                raise EngineQueueTimeout(engine_id, time.monotonic() - started, queued_behind)
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self.release(engine_id)  # The slot was handed over as the caller left
+                else:
+                    with contextlib.suppress(ValueError):  # Already skipped by release
+                        queue.waiters.remove(waiter)
+                raise
+        waited = time.monotonic() - started
+        queue.admitted += 1
+        queue.waits.add(waited)
+        return waited
+
+    def release(self, engine_id: str) -> None:
+        """Hand a slot to the oldest waiter of the engine, or free it."""
+        queue = self._engines[engine_id]
+        while queue.waiters:
+            waiter = queue.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        queue.in_flight -= 1
+
+    def hold(self, engine_id: str, job_id: str) -> None:
+        """Keep an engine slot until a job finishes."""
+
+        async def follow() -> None:
+            try:
+                while True:
+                    if (await self._poller.wait(job_id, self.follow_timeout))["terminal"]:
+                        break
+            except ValueError as e:
+                logger.warning(f"Releasing the {engine_id} slot of job {job_id}: {e}")
+            finally:
+                self._holds.pop(job_id, None)
+                self.release(engine_id)
+
+        self._holds[job_id] = asyncio.ensure_future(follow())
+
+    async def run(
+        self,
+        method: str,
+        endpoint: str,
+        json_body: Optional[Dict[str, Any]],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run a request once its engine has a free slot.
+
+        The slot stays taken until the job the request started finishes.
+        A response that had to queue carries an ``engine_queue`` summary.
+        Raises EngineQueueTimeout, without sending the request, if the engine
+        stays busy past the queue timeout.
+        """
+        if endpoint.strip("/").split("/")[0] not in SchedulerConfig.COLLECTIONS:
+            return await call()
+        engine_id = await self._locate(method, endpoint, json_body)
+        if engine_id is None:
+            return await call()
+        queue = self._engines.get(engine_id)
+        busy = queue is not None and (queue.in_flight >= self.limit or bool(queue.waiters))
+        depth = len(queue.waiters) if queue is not None else 0
+        waited = await self.acquire(engine_id)
+        try:
+            response = await call()
+        except BaseException:
+            self.release(engine_id)
+            raise
+        job = response.get("job") if isinstance(response, dict) else None
+        if isinstance(job, dict) and job.get("id") and job.get("status") not in TERMINAL_STATES:
+            self.hold(engine_id, job["id"])
+        else:
+            self.release(engine_id)
+        if busy and isinstance(response, dict):
+            response = {
+                **response,
+                "engine_queue": {
+                    "engine_id": engine_id,
+                    "waited_seconds": round(waited, 3),
+                    "queued_behind": depth,
+                },
+            }
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, in-flight jobs and wait times per engine."""
+        return {
+            "limit": self.limit,
+            "engines": {
+                engine_id: queue.to_dict(self.limit)
+                for engine_id, queue in sorted(self._engines.items())
+            },
+        }
+
+    async def stop(self) -> None:
+        """Stop following the jobs holding slots."""
+        tasks = list(self._holds.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._holds.clear()
+
+
+# Global instance
+_engine_scheduler: Optional[EngineScheduler] = None
+
+
+# Public API
+def start_engine_scheduler(
+    poller: JobPoller,
+    limit: int,
+    follow_timeout: float,
+    locate: Callable[[str, str, Optional[Dict[str, Any]]], Awaitable[Optional[str]]],
+    queue_timeout: Optional[float] = None,
+) -> EngineScheduler:
+    """Create the global engine scheduler"""
+    global _engine_scheduler
+    if _engine_scheduler is None:
+        _engine_scheduler = EngineScheduler(poller, limit, follow_timeout, locate, queue_timeout)
+    return _engine_scheduler
+
+
+async def stop_engine_scheduler() -> None:
+    """Stop the global engine scheduler"""
+    global _engine_scheduler
+    if _engine_scheduler is not None:
+        await _engine_scheduler.stop()
+        _engine_scheduler = None
+
+
+def get_engine_scheduler() -> Optional[EngineScheduler]:
+    """Get the global engine scheduler (returns None if not started)"""
+    return _engine_scheduler
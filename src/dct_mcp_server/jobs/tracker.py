@@ -0,0 +1,164 @@
+"""
+Tracking of the jobs started through this server.
+
+Every job returned by a mutating tool call is recorded here and followed on
+the shared job poller, so its state stays current without extra requests
+per job. Running jobs are kept until they finish; finished jobs never change
+again and are cached for good, the oldest evicted once ``max_completed`` is
+reached.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from dct_mcp_server.core.logging import get_logger
+
+from .poller import TERMINAL_STATES, JobPoller
+
+logger = get_logger(__name__)
+
+
+class TrackerConfig:
+    """Configuration constants for the job tracker."""
+
+    LIST_LIMIT = 100  # Jobs returned by list_my_jobs unless a limit is given
+
+
+class TrackedJob:
+    """The latest known state of a job and the call that started it."""
+
+    __slots__ = ("job", "started_by", "tracked_at", "updated_at")
+
+    def __init__(self, job: Dict[str, Any], started_by: str):
+        self.job = job
+        self.started_by = started_by
+        self.tracked_at = self.updated_at = time.time()
+
+    @property
+    def terminal(self) -> bool:
+        return self.job.get("status") in TERMINAL_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.job,
+            "started_by": self.started_by,
+            "tracked_at": self.tracked_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobTracker:
+    """Follows the jobs started through this server on the job poller.
+
+    ``follow_timeout`` bounds each wait on the poller; waits are renewed
+    until the job is terminal, so no job is dropped for running long.
+    """
+
+    def __init__(self, poller: JobPoller, max_completed: int, follow_timeout: float):
+        self._poller = poller
+        self.max_completed = max_completed
+        self.follow_timeout = follow_timeout
+        self._active: Dict[str, TrackedJob] = {}
+        self._completed: "OrderedDict[str, TrackedJob]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def track(self, job: Dict[str, Any], started_by: str) -> None:
+        """Record a job returned by a tool call and follow it until it finishes."""
+        job_id = job.get("id")
+        if not job_id or job_id in self._active or job_id in self._completed:
+            return
+        entry = TrackedJob(job, started_by)
+        if entry.terminal:
+            self._complete(job_id, entry)
+            return
+        self._active[job_id] = entry
+        self._tasks[job_id] = asyncio.ensure_future(self._follow(job_id, entry))
+        logger.debug(f"Tracking job {job_id} started by {started_by}")
+
+    async def _follow(self, job_id: str, entry: TrackedJob) -> None:
+        async def update(job: Dict[str, Any]) -> None:
+            entry.job = job
+            entry.updated_at = time.time()
+
+        try:
+            while not entry.terminal:
+                await self._poller.wait(job_id, self.follow_timeout, on_update=update)
+        except ValueError as e:
+            logger.warning(f"Stopped tracking job {job_id}: {e}")
+            self._active.pop(job_id, None)
+            return
+        finally:
+            self._tasks.pop(job_id, None)
+        self._complete(job_id, entry)
+
+    def _complete(self, job_id: str, entry: TrackedJob) -> None:
+        self._active.pop(job_id, None)
+        self._completed[job_id] = entry
+        while len(self._completed) > self.max_completed:
+            self._completed.popitem(last=False)
+
+    def completed(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a finished job from the cache, or None if it is not cached."""
+        entry = self._completed.get(job_id)
+        return entry.job if entry is not None else None
+
+    def list(
+        self, matches: Optional[Callable[[Any], bool]] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Return the tracked jobs, most recently started first, as a search result."""
+        entries: List[TrackedJob] = sorted(
+            [*self._active.values(), *self._completed.values()],
+            key=lambda entry: -entry.tracked_at,
+        )
+        items = [entry.to_dict() for entry in entries]
+        if matches is not None:
+            items = [item for item in items if matches(item)]
+        limit = limit if limit is not None else TrackerConfig.LIST_LIMIT
+        return {
+            "items": items[:limit],
+            "response_metadata": {
+                "total": len(items),
+                "truncated": len(items) > limit,
+                "active_count": len(self._active),
+                "completed_count": len(self._completed),
+            },
+        }
+
+    async def stop(self) -> None:
+        """Stop following the running jobs."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+
+
+# Global instance
+_job_tracker: Optional[JobTracker] = None
+
+
+# Public API
+def start_job_tracker(poller: JobPoller, max_completed: int, follow_timeout: float) -> JobTracker:
+    """Create the global job tracker"""
+    global _job_tracker
+    if _job_tracker is None:
+        _job_tracker = JobTracker(poller, max_completed, follow_timeout)
+    return _job_tracker
+
+
+async def stop_job_tracker() -> None:
+    """Stop the global job tracker"""
+    global _job_tracker
+    if _job_tracker is not None:
+        await _job_tracker.stop()
+        _job_tracker = None
+
+
+def get_job_tracker() -> Optional[JobTracker]:
+    """Get the global job tracker (returns None if not started)"""
+    return _job_tracker
@@ -11,12 +11,34 @@ import logging
 import signal
 import sys
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from dct_mcp_server.config import get_dct_config, print_config_help
 from dct_mcp_server.core import end_session, start_session
 from dct_mcp_server.core.exceptions import MCPError
 from dct_mcp_server.core.logging import get_logger, setup_logging
+from dct_mcp_server.core.result_store import (
+    ResultStoreConfig,
+    start_result_store,
+    stop_result_store,
+)
 from dct_mcp_server.dct_client import DCTAPIClient
+from dct_mcp_server.inventory import (
+    EngineLookup,
+    StoreConfig,
+    start_inventory,
+    start_resolver,
+    stop_inventory,
+    stop_resolver,
+)
+from dct_mcp_server.jobs import (
+    start_engine_scheduler,
+    start_job_poller,
+    start_job_tracker,
+    stop_engine_scheduler,
+    stop_job_poller,
+    stop_job_tracker,
+)
 from dct_mcp_server.toolsgenerator.driver import generate_tools_from_openapi
 from mcp.server.fastmcp import FastMCP
 
@@ -40,9 +62,55 @@ async def lifespan(app: FastMCP):
     else:
         logger.info("Telemetry disabled. Skipping session start.")
 
+    if config.get("inventory_enabled") and dct_client:
+        store_path = (
+            Path(config["cache_dir"]) / StoreConfig.DB_FILE
+            if config["inventory_persist"]
+            else None
+        )
+        start_inventory(
+            dct_client,
+            config["inventory_refresh_interval"],
+            store_path,
+            config["inventory_full_sync_interval"],
+        )
+        logger.info("Inventory background sync started.")
+
+    if config.get("name_resolution_enabled") and dct_client:
+        start_resolver(dct_client, config["name_cache_ttl"])
+
+    if dct_client:
+        poller = start_job_poller(
+            dct_client, config["job_poll_min_interval"], config["job_poll_max_interval"]
+        )
+        start_job_tracker(poller, config["job_tracker_size"], config["job_wait_timeout"])
+        if config["engine_max_jobs"]:
+            start_engine_scheduler(
+                poller,
+                config["engine_max_jobs"],
+                config["job_wait_timeout"],
+                EngineLookup(dct_client).engine_for,
+                config["engine_queue_timeout"],
+            )
+
+    if config.get("result_offload_bytes"):
+        start_result_store(
+            Path(config["cache_dir"]) / ResultStoreConfig.SPILL_DIR,
+            config["result_offload_bytes"],
+            int(config["result_store_memory_mb"] * 1024 * 1024),
+            int(config["result_store_disk_mb"] * 1024 * 1024),
+            config["result_ttl"],
+        )
+
     try:
         yield
     finally:
+        await stop_inventory()
+        stop_resolver()
+        stop_result_store()
+        await stop_engine_scheduler()
+        await stop_job_tracker()
+        await stop_job_poller()
         # Ensure client is closed when server exits
         if dct_client:
             logger.info("Closing DCT API client")
@@ -0,0 +1,158 @@
+import asyncio
+import importlib
+import inspect
+import logging
+import pkgutil
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.decorators import log_tool_execution
+
+logger = logging.getLogger(__name__)
+
+
+class BatchConfig:
+    """Configuration constants for the batch tool."""
+
+    MAX_REQUESTS = 20  # Calls one batch may run
+    # Operations outside the operation maps that only read
+    READ_OPERATIONS = ("search_all", "search_joined", "wait", "list_my_jobs", "analyze_durations", "engine_queues")
+    # Operations that read when the given argument is true
+    READ_WHEN = {"sweep": "dry_run"}
+
+
+# Tool name -> (tool function, operation map), filled on first use
+_tools: Optional[Dict[str, Tuple[Callable, Dict[str, Tuple[str, str]]]]] = None
+
+
+def _discover_tools() -> Dict[str, Tuple[Callable, Dict[str, Tuple[str, str]]]]:
+    global _tools
+    if _tools is None:
+        tools = {}
+        package = importlib.import_module(__package__)
+        for _, module_name, ispkg in pkgutil.iter_modules(package.__path__):
+            if ispkg or not module_name.endswith("_endpoints_tool"):
+                continue
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            stem = module_name[: -len("_tool")]
+            function = getattr(module, f"dct_manage_{stem}", None) or getattr(module, f"manage_{stem}", None)
+            operation_map = getattr(module, "OPERATION_MAP", None)
+            if function is None or operation_map is None:
+                continue
+            tools[f"dct_manage_{stem}"] = (function, operation_map)
+            tools[stem[: -len("_endpoints")]] = (function, operation_map)
+        _tools = tools
+    return _tools
+
+
+def _is_read(operation_map: Dict[str, Tuple[str, str]], operation_type: str, args: Dict[str, Any]) -> bool:
+    """Whether an operation only reads, following the tools' own destructive check."""
+    if operation_type in BatchConfig.READ_OPERATIONS:
+        return True
+    if operation_type in BatchConfig.READ_WHEN:
+        return bool(args.get(BatchConfig.READ_WHEN[operation_type]))
+    if operation_type not in operation_map:
+        return False
+    method = operation_map[operation_type][1]
+    is_search = operation_type.startswith("search")
+    return not (method in ["POST", "PUT", "DELETE"] and not is_search and operation_type not in ("get", "get_result"))
+
+
+def _prepare(index: int, entry: Any) -> Tuple[str, Callable, str, Dict[str, Any]]:
+    """Validate one batch entry and return its request ID, tool function, operation and arguments."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"Request {index} must be an object with tool, operation_type and args.")
+    request_id = str(entry.get("id", index))
+    tool = entry.get("tool")
+    tools = _discover_tools()
+    if tool not in tools:
+        raise ValueError(
+            f"Request '{request_id}': unknown tool '{tool}'. "
+            f"Use one of: {', '.join(sorted(name for name in tools if not name.startswith('dct_')))}."
+        )
+    function, operation_map = tools[tool]
+    operation_type = entry.get("operation_type")
+    allowed = inspect.get_annotations(function, eval_str=True)["operation_type"].__args__
+    if operation_type not in allowed:
+        raise ValueError(
+            f"Request '{request_id}': '{operation_type}' is not an operation of {tool}. "
+            f"Use one of: {', '.join(allowed)}."
+        )
+    args = entry.get("args") or {}
+    if not isinstance(args, dict):
+        raise ValueError(f"Request '{request_id}': args must be an object.")
+    parameters = set(inspect.signature(function).parameters) - {"operation_type", "ctx"}
+    unknown = sorted(set(args) - parameters)
+    if unknown:
+        raise ValueError(f"Request '{request_id}': unknown args for {tool}: {', '.join(unknown)}.")
+    if not _is_read(operation_map, operation_type, args) and not (
+        args.get("confirm") is True or args.get("confirmation_token")
+    ):
+        raise ValueError(
+            f"Request '{request_id}': '{operation_type}' changes data. Only reads run in a batch "
+            "unless the request is confirmed with confirm=true or a confirmation_token in args."
+        )
+    return request_id, function, operation_type, args
+
+
+@log_tool_execution
+async def dct_batch(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run several independent DCT tool calls concurrently in one call.
+
+    Use this tool to gather what is needed before acting (e.g. engines, a VDB,
+    its snapshots and recent jobs) in one round trip instead of one call each.
+
+    Each request is {"id": "...", "tool": "...", "operation_type": "...",
+    "args": {...}}:
+    - tool is a DCT tool name (e.g. "dct_manage_vdbs_endpoints") or its short
+      form ("vdbs", "snapshots", "job", "engine", ...).
+    - operation_type and args are what that tool takes; unknown operations
+      or arguments reject the whole batch before anything runs.
+    - id keys the result (default: the request's position, "0", "1", ...).
+
+    Only read operations (get, search*, wait, list_my_jobs, aggregations,
+    sweep with dry_run, ...) run unless a request is explicitly confirmed
+    with confirm=true or a confirmation_token in its args. At most 20
+    requests per batch; they share the server's DCT concurrency limit.
+
+    Returns results keyed by request ID, each with status "succeeded" and
+    the tool's result, or "failed" and the error; one failure never stops
+    the other requests.
+    """
+    if not isinstance(requests, list) or not requests:
+        raise ValueError("requests must be a non-empty list.")
+    if len(requests) > BatchConfig.MAX_REQUESTS:
+        raise ValueError(f"A batch accepts at most {BatchConfig.MAX_REQUESTS} requests.")
+    prepared = [_prepare(index, entry) for index, entry in enumerate(requests)]
+    request_ids = [request_id for request_id, *_ in prepared]
+    duplicates = sorted({request_id for request_id in request_ids if request_ids.count(request_id) > 1})
+    if duplicates:
+        raise ValueError(f"Request IDs must be unique: {', '.join(duplicates)}.")
+
+    async def run(function: Callable, operation_type: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = await function(operation_type, **args)
+            outcome = {"status": "succeeded", "result": result}
+        except Exception as e:
+            outcome = {"status": "failed", "error": str(e)}
+        return {"operation_type": operation_type, **outcome, "seconds": round(time.monotonic() - started, 3)}
+
+    started = time.monotonic()
+    outcomes = await asyncio.gather(*(run(function, operation_type, args) for _, function, operation_type, args in prepared))
+    failed = sum(outcome["status"] == "failed" for outcome in outcomes)
+    return {
+        "results": dict(zip(request_ids, outcomes)),
+        "total": len(outcomes),
+        "succeeded": len(outcomes) - failed,
+        "failed": failed,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+    }
+
+
+def register_tools(app, dct_client):
+    logger.info("Registering DCT tool: dct_batch")
+    try:
+        app.add_tool(dct_batch, name="dct_batch")
+    except Exception as e:
+        logger.error(f"Error registering dct_batch: {e}")
@@ -18,15 +18,24 @@ class Dsources_EndpointsOperation(Enum):
     LINK_ORACLE = "link_oracle"
     LINK_ORACLE_STAGING = "link_oracle_staging"
     SEARCH = "search"
+    SEARCH_JOINED = "search_joined"
     SNAPSHOT = "snapshot"
     UPDATE_APPDATA = "update_appdata"
     UPDATE_ASE = "update_ase"
     UPDATE_MSSQL = "update_mssql"
     UPDATE_ORACLE = "update_oracle"
-from mcp.server.fastmcp import FastMCP
-from typing import Dict,Any,Optional
+from mcp.server.fastmcp import Context, FastMCP
+from typing import Dict,Any,List,Optional
 from ..core.decorators import log_tool_execution
 from ..config.config import get_dct_config
+from ..core.aggregation import Aggregator, TopK
+from ..core.bulk import bulk_plan, path_param, run_bulk, select_targets
+from ..core.confirmation import start_confirmation_store
+from ..core.filters import compile_filter
+from ..core.projection import project_result, project_search_many
+from ..core.result_store import get_result_store
+from ..jobs import EngineQueueTimeout, GroupRefresh, JobDurations, duration_window, refresh_plan, report_job_progress, report_progress, select_group_members, start_engine_scheduler, start_job_poller, start_job_tracker
+from ..inventory import EngineLookup, RetentionConfig, get_inventory, get_resolver, register_path_templates, search_joined, sweep_candidates, sweep_plan, sweep_result
 import asyncio
 import logging
 import threading
@@ -63,17 +72,268 @@ def async_to_sync(async_func):
             return asyncio.run(async_func(*args, **kwargs))
     return wrapper
 
-async def make_api_request(method: str, endpoint: str, params: dict = None, json_body: dict = None):
+async def make_api_request(method: str, endpoint: str, params: dict = None, json_body: dict = None, fields: list = None):
     """Utility function to make API requests with consistent parameter handling."""
-    return await client.make_request(method, endpoint, params=params or {}, json=json_body)
+    result = await client.make_request(method, endpoint, params=params or {}, json=json_body)
+    if method != "GET" and not endpoint.endswith("/search"):
+        return result  # Job-starting responses keep their job for tracking and scheduling
+    return offload_result(project_result(result, fields, endpoint), endpoint)
+
+async def make_paginated_request(endpoint: str, json_body: dict = None, sort: str = None, page_size: int = None, max_items: int = None, cursor: str = None, fields: list = None):
+    """Utility function to follow search cursors and aggregate every page into one result."""
+    result = await client.collect_search(endpoint, json_body=json_body, sort=sort, page_size=page_size, max_items=max_items, cursor=cursor)
+    return offload_result(project_result(result, fields, endpoint), endpoint)
+
+async def make_multi_search_request(searches: dict, entities: list = None, json_body: dict = None, limit: int = None, sort: str = None, all_pages: bool = False, max_items: int = None, cursor: str = None, fields: list = None):
+    """Utility function to run several search endpoints concurrently, isolating failures per entity."""
+    result = await client.search_many(searches, entities=entities, json_body=json_body, limit=limit, sort=sort, all_pages=all_pages, max_items=max_items, cursor=cursor)
+    return offload_search_many(project_search_many(result, fields))
+
+async def make_join_request(endpoint: str, relations: list = None, json_body: dict = None, sort: str = None, limit: int = None, max_items: int = None, max_staleness: float = None, fields: list = None):
+    """Utility function to run a search and embed the requested related objects into every result."""
+    result = await search_joined(client, endpoint, relations=relations, json_body=json_body, sort=sort, limit=limit, max_items=max_items, max_staleness=max_staleness)
+    return offload_result(project_result(result, fields, endpoint), endpoint)
+
+def offload_result(result, endpoint: str):
+    """Utility function to replace an oversized search result with a summary and a resource handle."""
+    store = get_result_store()
+    return result if store is None else store.offload(result, endpoint)
+
+def offload_search_many(result: dict):
+    """Utility function to offload each oversized entity result of a multi-entity search."""
+    store = get_result_store()
+    return result if store is None else store.offload_search_many(result)
+
+async def stream_search(endpoint: str, consume, json_body: dict = None, page_size: int = None, max_items: int = None, max_staleness: float = None):
+    """Utility function to feed every matching object to consume, from the inventory when fresh enough; returns the scan metadata."""
+    inventory = get_inventory()
+    records = inventory.matching(endpoint, json_body, max_staleness) if inventory is not None and max_staleness is not None else None
+    if records is None:
+        return await client.scan_search(endpoint, consume, json_body=json_body, page_size=page_size, max_items=max_items)
+    records = records[:max_items] if max_items is not None else records
+    consume(records)
+    return {"scanned": len(records), "source": "inventory"}
+
+async def make_aggregate_request(endpoint: str, aggregate: dict, json_body: dict = None, page_size: int = None, max_items: int = None, max_staleness: float = None):
+    """Utility function to stream a search through an aggregator and return only the aggregate."""
+    aggregator = Aggregator(aggregate)
+    metadata = await stream_search(endpoint, aggregator.add_many, json_body=json_body, page_size=page_size, max_items=max_items, max_staleness=max_staleness)
+    return aggregator.result(metadata)
+
+async def make_top_k_request(endpoint: str, top_k: dict, json_body: dict = None, page_size: int = None, max_items: int = None, max_staleness: float = None, fields: list = None):
+    """Utility function to stream a search through a bounded heap and return only the top k objects."""
+    selection = TopK(top_k)
+    metadata = await stream_search(endpoint, selection.add_many, json_body=json_body, page_size=page_size, max_items=max_items, max_staleness=max_staleness)
+    return offload_result(project_result(selection.result(metadata), fields, endpoint), endpoint)
+
+async def make_duration_request(aggregate: dict = None, since: str = None, until: str = None, filter_expression: str = None, page_size: int = None, max_items: int = None):
+    """Utility function to stream the jobs of a time window through per-group duration sketches and return only the quantiles."""
+    analytics = JobDurations(aggregate)
+    window, expression = duration_window(since, until, filter_expression)
+    metadata = await stream_search("/jobs/search", analytics.add_many, json_body={"filter_expression": expression}, page_size=page_size, max_items=max_items)
+    return analytics.result({**metadata, "window": window})
+
+def lookup_inventory(method: str, endpoint: str, json_body: dict = None, params: dict = None, max_staleness: float = None, all_pages: bool = False, max_items: int = None):
+    """Utility function to answer get/search requests from the in-memory inventory; returns None on a miss."""
+    inventory = get_inventory()
+    if inventory is None or max_staleness is None:
+        return None
+    return inventory.answer(method, endpoint, json_body, params, max_staleness, all_pages=all_pages, max_items=max_items)
+
+async def resolve_names(endpoint: str, path_params: dict):
+    """Utility function to replace object names given for ID path parameters with their IDs."""
+    resolver = get_resolver()
+    if resolver is None:
+        return path_params
+    return await resolver.resolve(endpoint, path_params)
+
+async def make_bulk_request(operation_type: str, endpoint: str, ids: list = None, filter_expression: str = None, json_body: dict = None, confirm: bool = False):
+    """Utility function to run one operation on many objects with bounded concurrency, reporting each object's outcome."""
+    targets = await select_targets(client, endpoint, ids=ids, filter_expression=filter_expression, resolve=resolve_names)
+    if get_dct_config()["require_confirmation"] and not confirm:
+        token, expires_in = confirmations().create(TOOL_NAME, operation_type, {"endpoint": endpoint, "targets": targets, "json_body": json_body})
+        return bulk_plan(operation_type, endpoint, targets, token, expires_in)
+    return await execute_bulk(operation_type, endpoint, targets, json_body=json_body)
+
+async def execute_bulk(operation_type: str, endpoint: str, targets: list, json_body: dict = None, rate: float = None):
+    """Utility function to run one operation on prepared targets with bounded concurrency."""
+    dct_config = get_dct_config()
+    param = "{" + path_param(endpoint) + "}"
+    started_by = endpoint.strip("/").split("/")[0] + " " + operation_type
+
+    async def run(target):
+        path = endpoint.replace(param, target["id"])
+        response = await schedule_on_engine("POST", path, json_body, lambda: client.make_request("POST", path, json=json_body or {}))
+        if isinstance(response, dict) and response.get("started") is False:
+            raise ValueError(response["message"])
+        track_job(response, started_by)
+        job = response.get("job") if isinstance(response, dict) else None
+        return {"job_id": job.get("id"), "job_status": job.get("status")} if isinstance(job, dict) else {}
+
+    return await run_bulk(operation_type, targets, run, dct_config["bulk_concurrency"], dct_config["bulk_engine_concurrency"], rate=rate)
+
+async def make_group_refresh_request(vdbGroupId: str = None, ids: list = None, filter_expression: str = None, json_body: dict = None, confirm: bool = False, ctx=None):
+    """Utility function to refresh a VDB group, or selected VDBs, each VDB after the parent it was provisioned from."""
+    vdbs = await select_group_members(client, vdb_group=vdbGroupId, ids=ids, filter_expression=filter_expression, resolve=resolve_names)
+    if get_dct_config()["require_confirmation"] and not confirm:
+        token, expires_in = confirmations().create(TOOL_NAME, "refresh_group", {"vdbs": vdbs, "json_body": json_body})
+        return refresh_plan(vdbs, token, expires_in)
+    return await execute_group_refresh(vdbs, json_body=json_body, ctx=ctx)
+
+async def execute_group_refresh(vdbs: list, json_body: dict = None, ctx=None):
+    """Utility function to run a group refresh in dependency order, reporting progress as VDBs finish."""
+    dct_config = get_dct_config()
+    orchestrator = GroupRefresh(client, job_poller(), dct_config["bulk_concurrency"], dct_config["bulk_engine_concurrency"], dct_config["job_wait_timeout"], schedule=schedule_on_engine, timeout=dct_config["group_refresh_timeout"])
+    return await orchestrator.run(vdbs, json_body=json_body, on_started=lambda job: track_job({"job": job}, "vdbs refresh_group"), on_progress=lambda done, total, message: report_progress(ctx, done, total, message))
+
+async def make_sweep_request(older_than_days: float = None, filter_expression: str = None, dry_run: bool = False, confirm: bool = False):
+    """Utility function to find the expired, orphaned or aged snapshots nothing depends on and delete them, or only report them."""
+    report = await sweep_candidates(client, older_than_days=older_than_days, filter_expression=filter_expression)
+    if dry_run:
+        return {**report, "dry_run": True}
+    if get_dct_config()["require_confirmation"] and not confirm:
+        token, expires_in = confirmations().create(TOOL_NAME, "sweep", {"snapshots": report["candidates"]})
+        return sweep_plan(report, token, expires_in)
+    return await execute_sweep(report["candidates"])
+
+async def execute_sweep(snapshots: list):
+    """Utility function to delete swept snapshots in parallel, paced to the sweep rate."""
+    return sweep_result(await execute_bulk("sweep", RetentionConfig.DELETE_ENDPOINT, snapshots, rate=get_dct_config()["sweep_rate"]))
+
+def confirmations():
+    """Utility function to return the store of plans awaiting confirmation, starting it on first use."""
+    return start_confirmation_store(get_dct_config()["confirmation_ttl"])
+
+def plan_request(operation_type: str, method: str, endpoint: str, parameters: dict, json_body: dict = None, fields: list = None):
+    """Utility function to store a prepared destructive request and return it for review with a confirmation token."""
+    started_by = endpoint.strip("/").split("/")[0] + " " + operation_type
+    token, expires_in = confirmations().create(TOOL_NAME, operation_type, {"method": method, "endpoint": endpoint, "json_body": json_body, "fields": fields, "started_by": started_by})
+    return {
+        "requires_confirmation": True,
+        "operation": operation_type,
+        "method": method,
+        "endpoint": endpoint,
+        "parameters": parameters,
+        "confirmation_token": token,
+        "expires_in_seconds": expires_in,
+        "message": f"This operation '{operation_type}' is destructive and requires confirmation. Please review the parameters and call again with confirmation_token to run exactly this request."
+    }
+
+async def commit_plan(token: str, operation_type: str, ctx=None):
+    """Utility function to run the requests a confirmation token was issued for, as they were prepared."""
+    prepared = confirmations().take(token, TOOL_NAME, operation_type)
+    if "snapshots" in prepared:
+        return await execute_sweep(prepared["snapshots"])
+    if "vdbs" in prepared:
+        return await execute_group_refresh(prepared["vdbs"], json_body=prepared["json_body"], ctx=ctx)
+    if "targets" in prepared:
+        return await execute_bulk(operation_type, prepared["endpoint"], prepared["targets"], json_body=prepared["json_body"])
+    method, endpoint = prepared["method"], prepared["endpoint"]
+    response = await schedule_on_engine(method, endpoint, prepared["json_body"], lambda: make_api_request(method, endpoint, json_body=prepared["json_body"], fields=prepared["fields"]))
+    track_job(response, prepared["started_by"])
+    return response
+
+def job_poller():
+    """Utility function to return the shared job poller, starting it on first use."""
+    dct_config = get_dct_config()
+    return start_job_poller(client, dct_config["job_poll_min_interval"], dct_config["job_poll_max_interval"])
+
+def job_tracker():
+    """Utility function to return the tracker of jobs started by this server, starting it on first use."""
+    dct_config = get_dct_config()
+    return start_job_tracker(job_poller(), dct_config["job_tracker_size"], dct_config["job_wait_timeout"])
+
+def engine_scheduler():
+    """Utility function to return the per-engine job scheduler, starting it on first use; None when disabled."""
+    dct_config = get_dct_config()
+    if not dct_config["engine_max_jobs"]:
+        return None
+    return start_engine_scheduler(job_poller(), dct_config["engine_max_jobs"], dct_config["job_wait_timeout"], EngineLookup(client).engine_for, dct_config["engine_queue_timeout"])
+
+async def schedule_on_engine(method: str, endpoint: str, json_body: dict, call):
+    """Utility function to run a job-starting call once the engine its job runs on has a free slot."""
+    scheduler = engine_scheduler()
+    if scheduler is None:
+        return await call()
+    try:
+        return await scheduler.run(method, endpoint, json_body, call)
+    except EngineQueueTimeout as e:
+        return e.to_dict()
+
+def engine_queue_stats():
+    """Utility function to report jobs in flight, queue depth and queue wait times per engine."""
+    scheduler = engine_scheduler()
+    if scheduler is None:
+        return {"enabled": False, "engines": {}}
+    return {"enabled": True, **scheduler.stats()}
+
+async def wait_for_job(job_id: str, timeout: float = None, fields: list = None, on_update=None):
+    """Utility function to block on the shared job poller until a job reaches a terminal state or the timeout passes."""
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive.")
+    # Finished jobs never change, so a cached one is returned without polling
+    cached = job_tracker().completed(job_id)
+    if cached is not None:
+        if on_update is not None:
+            await on_update(cached)
+        result = {"job": cached, "status": cached.get("status"), "terminal": True, "timed_out": False, "waited_seconds": 0.0}
+    else:
+        result = await job_poller().wait(job_id, timeout if timeout is not None else get_dct_config()["job_wait_timeout"], on_update=on_update)
+    return {**result, "job": project_result(result["job"], fields, "/jobs")}
+
+def track_job(result, started_by: str):
+    """Utility function to record the job a call started, so the job tracker follows it in the background."""
+    job = result.get("job") if isinstance(result, dict) else None
+    if isinstance(job, dict) and job.get("id"):
+        job_tracker().track(job, started_by)
+
+def list_my_jobs(filter_expression: str = None, limit: int = None, fields: list = None):
+    """Utility function to list the jobs started by this server from memory, most recent first."""
+    matches = compile_filter(filter_expression) if filter_expression else None
+    return project_result(job_tracker().list(matches, limit), fields, "/jobs")
+
+async def follow_job_progress(result, timeout: float = None, ctx=None):
+    """Utility function to stay attached to the job a call started, sending MCP progress notifications until it finishes."""
+    job = result.get("job") if isinstance(result, dict) else None
+    if not isinstance(job, dict) or not job.get("id"):
+        return result
+    waited = await wait_for_job(job["id"], timeout=timeout, on_update=lambda update: report_job_progress(ctx, update))
+    return {**result, "job": waited.pop("job") or job, "job_wait": waited}
 
 def build_params(**kwargs):
     """Build parameters dictionary excluding None values."""
     return {k: v for k, v in kwargs.items() if v is not None}
 
+# Name this tool is registered under
+TOOL_NAME = "dct_manage_dsources_endpoints"
+
+# DCT endpoint and HTTP method of each operation
+OPERATION_MAP = {
+    "attach_mssql": ("/dsources/mssql/{dsourceId}/attachSource", "POST"),
+    "attach_mssql_staging": ("/dsources/mssql/staging-push/{dsourceId}/attachSource", "POST"),
+    "attach_oracle": ("/dsources/oracle/{dsourceId}/attachSource", "POST"),
+    "delete": ("/dsources/delete", "POST"),
+    "detach_mssql": ("/dsources/mssql/{dsourceId}/detachSource", "POST"),
+    "detach_oracle": ("/dsources/oracle/{dsourceId}/detachSource", "POST"),
+    "disable": ("/dsources/{dsourceId}/disable", "POST"),
+    "enable": ("/dsources/{dsourceId}/enable", "POST"),
+    "link_appdata": ("/dsources/appdata", "POST"),
+    "link_ase": ("/dsources/ase", "POST"),
+    "link_mssql": ("/dsources/mssql", "POST"),
+    "link_mssql_staging": ("/dsources/mssql/staging-push", "POST"),
+    "link_oracle": ("/dsources/oracle", "POST"),
+    "link_oracle_staging": ("/dsources/oracle/staging-push", "POST"),
+    "search": ("/dsources/search", "POST"),
+    "snapshot": ("/dsources/{dsourceId}/snapshots", "POST"),
+    "update_appdata": ("/dsources/appdata/{dsourceId}", "GET"),
+    "update_ase": ("/dsources/ase/{dsourceId}", "GET"),
+    "update_mssql": ("/dsources/mssql/{dsourceId}", "GET"),
+    "update_oracle": ("/dsources/oracle/{dsourceId}", "GET"),
+}
+
 @log_tool_execution
 async def manage_dsources_endpoints(
-    operation_type: Literal["attach_mssql", "attach_mssql_staging", "attach_oracle", "delete", "detach_mssql", "detach_oracle", "disable", "enable", "link_appdata", "link_ase", "link_mssql", "link_mssql_staging", "link_oracle", "link_oracle_staging", "search", "snapshot", "update_appdata", "update_ase", "update_mssql", "update_oracle"],
+    operation_type: Literal["attach_mssql", "attach_mssql_staging", "attach_oracle", "delete", "detach_mssql", "detach_oracle", "disable", "enable", "link_appdata", "link_ase", "link_mssql", "link_mssql_staging", "link_oracle", "link_oracle_staging", "search", "search_joined", "snapshot", "update_appdata", "update_ase", "update_mssql", "update_oracle"],
     body: Optional[Dict[str, Any]] = None,
     vdbId: Optional[str] = None,
     snapshotId: Optional[str] = None,
@@ -85,7 +345,18 @@ async def manage_dsources_endpoints(
     cursor: Optional[str] = None,
     sort: Optional[str] = None,
     filter_expression: Optional[str] = None,
-    confirm: bool = False
+    relations: Optional[List[str]] = None,
+    timeout: Optional[float] = None,
+    follow_job: bool = False,
+    aggregate: Optional[Dict[str, Any]] = None,
+    top_k: Optional[Dict[str, Any]] = None,
+    all_pages: bool = False,
+    max_items: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    max_staleness: Optional[float] = None,
+    confirm: bool = False,
+    confirmation_token: Optional[str] = None,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """Manage dsources_endpoints operations.
 
@@ -108,34 +379,86 @@ async def manage_dsources_endpoints(
     - link_oracle: Link Oracle database as dSource.
     - link_oracle_staging: Link an Oracle staging push database as dSource.
     - search: Search for dSources.
+    - search_joined: Run the search and embed related objects (relations=[...]) into every result.
     - snapshot: Snapshot a dSource.
     - update_appdata
     - update_ase
     - update_mssql
     - update_oracle
+
+    Pagination (for search operations):
+    - all_pages=True follows next_cursor inside the server and returns every
+      page as one result; max_items caps the number of items returned.
+    - Results are bounded by a hard item and byte cap; response_metadata
+      reports truncated, truncated_reason and the next_cursor to resume from
+      (pass it as cursor with all_pages=True).
+    - Results too large to return inline come back as a summary (schema,
+      preview, total_items) with a resource_uri; read the items in slices
+      from dct://results/{handle}/{offset}/{limit}.
+
+    Aggregation (for search operations):
+    - aggregate={"group_by": [...], "sum": [...], "min": [...], "max": [...]}
+      scans every matching object page by page and returns only per-group
+      counts, sums, minimums and maximums, e.g. group_by=["engine_id",
+      "status"] for counts per engine and status. max_items caps the
+      number of objects scanned; with max_staleness the inventory is used.
+
+    Top-k selection (for search operations):
+    - top_k={"k": 10, "by": "-size"} scans every matching object and returns
+      only the k with the largest ("-" prefix) or smallest value of the
+      field, holding at most k objects in memory. max_items caps the number
+      of objects scanned; with max_staleness the inventory is used.
+
+    Field projection:
+    - fields=[...] returns only the given dotted paths of each result object
+      (e.g. "name", "hosts.hostname"), or a preset: "summary", "storage", "ids".
+      It applies to get and search results; responses of calls that start a
+      job are returned whole.
+
+    Inventory cache:
+    - max_staleness=<seconds> answers get and search on VDBs, dSources,
+      environments, engines, VDB groups and bookmarks from the server's
+      in-memory inventory if it was refreshed within that bound.
+      Searches with a filter_expression are evaluated locally too.
+
+    Name resolution:
+    - vdbId, dsourceId, environmentId and snapshotId accept an object name
+      instead of an ID (exact match first, then case-insensitive). Ambiguous
+      names are rejected with the matching IDs.
+
+    Relationship joins (search_joined):
+    - relations=[...] selects the related objects embedded in each result
+      (default all): source, engine, latest_snapshot.
+    - Nested relations use dots, e.g. "source.environment",
+      up to 2 levels deep.
+
+    Following jobs:
+    - follow_job=True keeps a call that starts a job attached to it until the
+      job finishes or timeout seconds pass (server default 300), sending MCP
+      progress notifications with the percent complete and current step.
+      The response then holds the final job and a job_wait summary.
+
+    Confirmation:
+    - With DCT_REQUIRE_CONFIRMATION=true a destructive call returns the
+      prepared request with a confirmation_token valid for
+      DCT_CONFIRMATION_TTL seconds (default 300). Calling this tool again
+      with the same operation_type and the confirmation_token runs exactly that
+      request, or every target of a bulk operation, without validating or
+      resolving names again. A token can be used once.
     """
-    operation_map = {
-        "attach_mssql": ("/dsources/mssql/{dsourceId}/attachSource", "POST"),
-        "attach_mssql_staging": ("/dsources/mssql/staging-push/{dsourceId}/attachSource", "POST"),
-        "attach_oracle": ("/dsources/oracle/{dsourceId}/attachSource", "POST"),
-        "delete": ("/dsources/delete", "POST"),
-        "detach_mssql": ("/dsources/mssql/{dsourceId}/detachSource", "POST"),
-        "detach_oracle": ("/dsources/oracle/{dsourceId}/detachSource", "POST"),
-        "disable": ("/dsources/{dsourceId}/disable", "POST"),
-        "enable": ("/dsources/{dsourceId}/enable", "POST"),
-        "link_appdata": ("/dsources/appdata", "POST"),
-        "link_ase": ("/dsources/ase", "POST"),
-        "link_mssql": ("/dsources/mssql", "POST"),
-        "link_mssql_staging": ("/dsources/mssql/staging-push", "POST"),
-        "link_oracle": ("/dsources/oracle", "POST"),
-        "link_oracle_staging": ("/dsources/oracle/staging-push", "POST"),
-        "search": ("/dsources/search", "POST"),
-        "snapshot": ("/dsources/{dsourceId}/snapshots", "POST"),
-        "update_appdata": ("/dsources/appdata/{dsourceId}", "GET"),
-        "update_ase": ("/dsources/ase/{dsourceId}", "GET"),
-        "update_mssql": ("/dsources/mssql/{dsourceId}", "GET"),
-        "update_oracle": ("/dsources/oracle/{dsourceId}", "GET"),
-    }
+    operation_map = OPERATION_MAP
+
+    # search_joined embeds related objects into each search result
+    if operation_type == "search_joined":
+        json_body = body if body is not None else {}
+        if filter_expression is not None:
+            json_body = {**json_body, "filter_expression": filter_expression}
+        return await make_join_request(operation_map["search"][0], relations=relations, json_body=json_body, sort=sort, limit=limit, max_items=max_items, max_staleness=max_staleness, fields=fields)
+
+    # Run the requests prepared when the confirmation token was issued
+    if confirmation_token is not None:
+        response = await commit_plan(confirmation_token, operation_type, ctx=ctx)
+        return await follow_job_progress(response, timeout=timeout, ctx=ctx) if follow_job else response
 
     # operation_type is already a string (Literal type)
     result = operation_map.get(operation_type)
@@ -152,6 +475,7 @@ async def manage_dsources_endpoints(
         "environmentId": environmentId,
         "jobId": jobId,
     }
+    path_params = await resolve_names(endpoint, path_params)
     for key, value in path_params.items():
         if value is not None:
             endpoint = endpoint.replace(f"{{{key}}}", value)
@@ -164,24 +488,47 @@ async def manage_dsources_endpoints(
     if is_search and filter_expression is not None:
         json_body = {**json_body, "filter_expression": filter_expression}
     
+    # Keep only the k best objects while the pages stream through a bounded heap
+    if is_search and top_k is not None:
+        if aggregate is not None:
+            raise ValueError("aggregate and top_k cannot be combined.")
+        return await make_top_k_request(endpoint, top_k, json_body=json_body, page_size=limit, max_items=max_items, max_staleness=max_staleness, fields=fields)
+    
+    # Stream every page through an accumulator and return only the aggregate
+    if is_search and aggregate is not None:
+        return await make_aggregate_request(endpoint, aggregate, json_body=json_body, page_size=limit, max_items=max_items, max_staleness=max_staleness)
+    
+    # Serve reads from the in-memory inventory when it is fresh enough
+    if max_staleness is not None and (is_search or method == "GET"):
+        cached = lookup_inventory(method, endpoint, json_body=json_body, params=params, max_staleness=max_staleness, all_pages=all_pages, max_items=max_items)
+        if cached is not None:
+            return offload_result(project_result(cached, fields, endpoint), endpoint)
+    
+    # Follow cursors inside the server when the full result set is requested
+    if is_search and (all_pages or max_items is not None):
+        return await make_paginated_request(endpoint, json_body=json_body, sort=sort, page_size=limit, max_items=max_items, cursor=cursor, fields=fields)
+    
     # Check if confirmation is required for destructive operations
     dct_config = get_dct_config()
     is_destructive = method in ["POST", "PUT", "DELETE"] and not is_search and operation_type != "get" and operation_type != "get_result"
     if is_destructive and dct_config["require_confirmation"] and not confirm:
-        return {
-            "requires_confirmation": True,
-            "operation": operation_type,
-            "method": method,
-            "endpoint": endpoint,
-            "parameters": {k: v for k, v in {"vdbId": vdbId, "snapshotId": snapshotId, "sourceId": sourceId, "dsourceId": dsourceId, "environmentId": environmentId, "jobId": jobId, "body": body}.items() if v is not None},
-            "message": f"This operation '{operation_type}' is destructive and requires confirmation. Please review the parameters and call again with confirm=True to proceed."
-        }
+        parameters = {k: v for k, v in {"vdbId": vdbId, "snapshotId": snapshotId, "sourceId": sourceId, "dsourceId": dsourceId, "environmentId": environmentId, "jobId": jobId, "body": body}.items() if v is not None}
+        return plan_request(operation_type, method, endpoint, parameters, json_body=json_body, fields=fields)
+    
+    if is_search or method == "GET":
+        return await make_api_request(method, endpoint, params=params, json_body=json_body, fields=fields)
     
-    return await make_api_request(method, endpoint, params=params, json_body=json_body)
+    # Start the job once its engine has a free slot and record it, optionally staying attached to report its progress
+    response = await schedule_on_engine(method, endpoint, json_body, lambda: make_api_request(method, endpoint, params=params, json_body=json_body, fields=fields))
+    track_job(response, f"dsources {operation_type}")
+    if follow_job:
+        return await follow_job_progress(response, timeout=timeout, ctx=ctx)
+    return response
 
 def register_tools(app, dct_client):
     global client
     client = dct_client
+    register_path_templates(OPERATION_MAP.values())
     logger.info(f"Registering DCT tool: dct_manage_dsources_endpoints")
     try:
         app.add_tool(manage_dsources_endpoints, name="dct_manage_dsources_endpoints")
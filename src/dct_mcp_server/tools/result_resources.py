@@ -0,0 +1,49 @@
+import json
+import logging
+
+from ..core.result_store import ResultStoreConfig, get_result_store
+
+logger = logging.getLogger(__name__)
+
+
+def _store():
+    store = get_result_store()
+    if store is None:
+        raise ValueError("Result offloading is disabled on this server.")
+    return store
+
+
+def read_result_info(handle: str) -> str:
+    """Describe an offloaded tool result: item count, size and remaining lifetime."""
+    try:
+        return json.dumps(_store().info(handle))
+    except KeyError as e:
+        raise ValueError(e.args[0]) from None
+
+
+def read_result_items(handle: str, offset: int, limit: int) -> str:
+    """Read a slice of the items of an offloaded tool result.
+
+    Returns the items from offset to offset + limit (at most 500 per read)
+    and next_offset to continue from, or null after the last item.
+    """
+    try:
+        return _store().read(handle, offset, limit)
+    except KeyError as e:
+        raise ValueError(e.args[0]) from None
+
+
+def register_tools(app, dct_client):
+    logger.info("Registering DCT result resources")
+    prefix = ResultStoreConfig.URI_PREFIX
+    try:
+        app.resource(
+            prefix + "{handle}", name="dct_result_info", mime_type="application/json"
+        )(read_result_info)
+        app.resource(
+            prefix + "{handle}/{offset}/{limit}",
+            name="dct_result_items",
+            mime_type="application/json",
+        )(read_result_items)
+    except Exception as e:
+        logger.error(f"Error registering DCT result resources: {e}")
@@ -16,7 +16,7 @@ Each generated function includes:
 """
 
 
-from textwrap import indent
+from textwrap import fill, indent
 
 import yaml
 import os
@@ -24,6 +24,9 @@ import requests
 import urllib3
 import logging
 from dct_mcp_server.config.config import get_dct_config
+from dct_mcp_server.core.projection import entity_name
+from dct_mcp_server.inventory.relations import RELATIONS, JoinConfig
+from dct_mcp_server.inventory.resolver import RESOLVABLE_PARAMS
 
 # Get the absolute path of the project root
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -86,6 +89,92 @@ def download_open_api_yaml(api_url: str, save_path: str):
         logger.info(f"Error downloading OpenAPI spec: {e}")
         raise
 
+# Operations implemented inside the server on top of one or more DCT
+# endpoints, with the summary used in the generated docstring.
+COMPOSITE_OPERATIONS = {
+    "refresh_group": "Refresh a VDB group (vdbGroupId, ID or name) or the VDBs selected by ids or filter_expression, each VDB after the parent it was provisioned from.",
+    "engine_queues": "Report per engine the jobs in flight from this server, the requests queued for a slot and their queue wait times.",
+    "search_all": "Run the selected entity searches (entities=[...], default all) concurrently; results are merged per entity type.",
+    "sweep": "Delete the snapshots that expired, lost their dataset or are older than older_than_days and that no VDB or bookmark depends on, oldest first; dry_run=True only reports them and the reclaimable space.",
+    "search_joined": "Run the search and embed related objects (relations=[...]) into every result.",
+    "analyze_durations": "Estimate p50/p95/p99 run times of finished jobs per group over a time window (since/until), streaming /jobs/search in constant memory.",
+    "list_my_jobs": "List the jobs started through this server, most recent first, from memory without calling DCT.",
+    "wait": "Block until the job (jobId) reaches a terminal state or timeout seconds pass; concurrent waits share one batched poller.",
+}
+
+
+def composite_operations_for(operations_dict):
+    """Returns the composite operations a tool supports, based on its DCT operations."""
+    composite_ops = []
+    if sum(op.startswith("search_") for op in operations_dict) > 1:
+        composite_ops.append("search_all")
+    if "search" in operations_dict and entity_name(operations_dict["search"][0]) in RELATIONS:
+        composite_ops.append("search_joined")
+    if "search" in operations_dict and entity_name(operations_dict["search"][0]) == "vdbs" and "refresh_timestamp" in operations_dict:
+        composite_ops.append("refresh_group")
+    if "search" in operations_dict and entity_name(operations_dict["search"][0]) == "snapshots" and "delete" in operations_dict:
+        composite_ops.append("sweep")
+    if "search" in operations_dict and entity_name(operations_dict["search"][0]) == "engines":
+        composite_ops.append("engine_queues")
+    if "search" in operations_dict and entity_name(operations_dict["search"][0]) == "jobs":
+        composite_ops.append("wait")
+        composite_ops.append("list_my_jobs")
+        composite_ops.append("analyze_durations")
+    return composite_ops
+
+
+# Operations that also run on many objects at once, selected by ids or a
+# filter_expression instead of their single path parameter.
+BULK_OPERATIONS = {
+    "vdbs": ("disable", "enable", "refresh_bookmark", "refresh_location", "refresh_snapshot", "refresh_timestamp", "snapshot", "start", "stop"),
+}
+
+
+def bulk_operations_for(operations_dict):
+    """Returns the operations of a tool that also run in bulk, with their path parameter."""
+    if "search" not in operations_dict:
+        return [], None
+    bulk_ops = [op for op in BULK_OPERATIONS.get(entity_name(operations_dict["search"][0]), ()) if op in operations_dict]
+    if not bulk_ops:
+        return [], None
+    return bulk_ops, operations_dict[bulk_ops[0]][0].split("{")[1].split("}")[0]
+
+
+def bulk_docstring(entity, bulk_ops, param):
+    """Returns the docstring section describing the bulk variants of a tool's operations."""
+    summary = (
+        f"{', '.join(bulk_ops[:-1])} and {bulk_ops[-1]} accept ids=[...] (IDs or names) or a "
+        f"filter_expression instead of {param} to act on up to 500 {entity} at once, at most "
+        "DCT_BULK_CONCURRENCY at a time and DCT_BULK_ENGINE_CONCURRENCY per engine. One "
+        "confirmation covers every target. The response lists each object's outcome and "
+        "job_id; a failure never stops the others."
+    )
+    return "\n    Bulk operations:\n" + fill(summary, width=76, initial_indent="    - ", subsequent_indent="      ") + "\n"
+
+
+def starts_jobs(operations_dict):
+    """Returns whether a tool has operations that start DCT jobs."""
+    if "search" in operations_dict and entity_name(operations_dict["search"][0]) == "jobs":
+        return False
+    return any(not op.startswith(("search", "get")) for op in operations_dict)
+
+
+def relations_docstring(entity):
+    """Returns the docstring section describing the relations of an entity."""
+    names = list(RELATIONS[entity])
+    text = '''
+    Relationship joins (search_joined):
+    - relations=[...] selects the related objects embedded in each result
+      (default all): ''' + ", ".join(names) + ".\n"
+    for name, relation in RELATIONS[entity].items():
+        nested = RELATIONS.get(entity_name(relation.collection))
+        if nested:
+            text += f'''    - Nested relations use dots, e.g. "{name}.{next(iter(nested))}",
+      up to {JoinConfig.MAX_DEPTH} levels deep.
+'''
+            break
+    return text
+
 translated_dict_for_types = {
     "integer": "int",
     "string": "str",
@@ -93,10 +182,26 @@ translated_dict_for_types = {
     "float": "float",
 }
 
-prefix = """from mcp.server.fastmcp import FastMCP
-from typing import Dict,Any,Optional
+# Search helper of tools whose entity has RELATIONS
+join_helper = """async def make_join_request(endpoint: str, relations: list = None, json_body: dict = None, sort: str = None, limit: int = None, max_items: int = None, max_staleness: float = None, fields: list = None):
+    \"\"\"Utility function to run a search and embed the requested related objects into every result.\"\"\"
+    result = await search_joined(client, endpoint, relations=relations, json_body=json_body, sort=sort, limit=limit, max_items=max_items, max_staleness=max_staleness)
+    return offload_result(project_result(result, fields, endpoint), endpoint)
+
+"""
+
+prefix = """from mcp.server.fastmcp import Context, FastMCP
+from typing import Dict,Any,List,Optional
 from ..core.decorators import log_tool_execution
 from ..config.config import get_dct_config
+from ..core.aggregation import Aggregator, TopK
+from ..core.bulk import bulk_plan, path_param, run_bulk, select_targets
+from ..core.confirmation import start_confirmation_store
+from ..core.filters import compile_filter
+from ..core.projection import project_result, project_search_many
+from ..core.result_store import get_result_store
+from ..jobs import EngineQueueTimeout, GroupRefresh, JobDurations, duration_window, refresh_plan, report_job_progress, report_progress, select_group_members, start_engine_scheduler, start_job_poller, start_job_tracker
+from ..inventory import EngineLookup, RetentionConfig, get_inventory, get_resolver, register_path_templates, search_joined, sweep_candidates, sweep_plan, sweep_result
 import asyncio
 import logging
 import threading
@@ -133,9 +238,228 @@ def async_to_sync(async_func):
             return asyncio.run(async_func(*args, **kwargs))
     return wrapper
 
-async def make_api_request(method: str, endpoint: str, params: dict = None, json_body: dict = None):
+async def make_api_request(method: str, endpoint: str, params: dict = None, json_body: dict = None, fields: list = None):
     \"\"\"Utility function to make API requests with consistent parameter handling.\"\"\"
-    return await client.make_request(method, endpoint, params=params or {}, json=json_body)
+    result = await client.make_request(method, endpoint, params=params or {}, json=json_body)
+    if method != "GET" and not endpoint.endswith("/search"):
+        return result  # Job-starting responses keep their job for tracking and scheduling
+    return offload_result(project_result(result, fields, endpoint), endpoint)
+
+async def make_paginated_request(endpoint: str, json_body: dict = None, sort: str = None, page_size: int = None, max_items: int = None, cursor: str = None, fields: list = None):
+    \"\"\"Utility function to follow search cursors and aggregate every page into one result.\"\"\"
+    result = await client.collect_search(endpoint, json_body=json_body, sort=sort, page_size=page_size, max_items=max_items, cursor=cursor)
+    return offload_result(project_result(result, fields, endpoint), endpoint)
+
+async def make_multi_search_request(searches: dict, entities: list = None, json_body: dict = None, limit: int = None, sort: str = None, all_pages: bool = False, max_items: int = None, cursor: str = None, fields: list = None):
+    \"\"\"Utility function to run several search endpoints concurrently, isolating failures per entity.\"\"\"
+    result = await client.search_many(searches, entities=entities, json_body=json_body, limit=limit, sort=sort, all_pages=all_pages, max_items=max_items, cursor=cursor)
+    return offload_search_many(project_search_many(result, fields))
+
+""" + join_helper + """def offload_result(result, endpoint: str):
+    \"\"\"Utility function to replace an oversized search result with a summary and a resource handle.\"\"\"
+    store = get_result_store()
+    return result if store is None else store.offload(result, endpoint)
+
+def offload_search_many(result: dict):
+    \"\"\"Utility function to offload each oversized entity result of a multi-entity search.\"\"\"
+    store = get_result_store()
+    return result if store is None else store.offload_search_many(result)
+
+async def stream_search(endpoint: str, consume, json_body: dict = None, page_size: int = None, max_items: int = None, max_staleness: float = None):
+    \"\"\"Utility function to feed every matching object to consume, from the inventory when fresh enough; returns the scan metadata.\"\"\"
+    inventory = get_inventory()
+    records = inventory.matching(endpoint, json_body, max_staleness) if inventory is not None and max_staleness is not None else None
+    if records is None:
+        return await client.scan_search(endpoint, consume, json_body=json_body, page_size=page_size, max_items=max_items)
+    records = records[:max_items] if max_items is not None else records
+    consume(records)
+    return {"scanned": len(records), "source": "inventory"}
+
+async def make_aggregate_request(endpoint: str, aggregate: dict, json_body: dict = None, page_size: int = None, max_items: int = None, max_staleness: float = None):
+    \"\"\"Utility function to stream a search through an aggregator and return only the aggregate.\"\"\"
+    aggregator = Aggregator(aggregate)
+    metadata = await stream_search(endpoint, aggregator.add_many, json_body=json_body, page_size=page_size, max_items=max_items, max_staleness=max_staleness)
+    return aggregator.result(metadata)
+
+async def make_top_k_request(endpoint: str, top_k: dict, json_body: dict = None, page_size: int = None, max_items: int = None, max_staleness: float = None, fields: list = None):
+    \"\"\"Utility function to stream a search through a bounded heap and return only the top k objects.\"\"\"
+    selection = TopK(top_k)
+    metadata = await stream_search(endpoint, selection.add_many, json_body=json_body, page_size=page_size, max_items=max_items, max_staleness=max_staleness)
+    return offload_result(project_result(selection.result(metadata), fields, endpoint), endpoint)
+
+async def make_duration_request(aggregate: dict = None, since: str = None, until: str = None, filter_expression: str = None, page_size: int = None, max_items: int = None):
+    \"\"\"Utility function to stream the jobs of a time window through per-group duration sketches and return only the quantiles.\"\"\"
+    analytics = JobDurations(aggregate)
+    window, expression = duration_window(since, until, filter_expression)
+    metadata = await stream_search("/jobs/search", analytics.add_many, json_body={"filter_expression": expression}, page_size=page_size, max_items=max_items)
+    return analytics.result({**metadata, "window": window})
+
+def lookup_inventory(method: str, endpoint: str, json_body: dict = None, params: dict = None, max_staleness: float = None, all_pages: bool = False, max_items: int = None):
+    \"\"\"Utility function to answer get/search requests from the in-memory inventory; returns None on a miss.\"\"\"
+    inventory = get_inventory()
+    if inventory is None or max_staleness is None:
+        return None
+    return inventory.answer(method, endpoint, json_body, params, max_staleness, all_pages=all_pages, max_items=max_items)
+
+async def resolve_names(endpoint: str, path_params: dict):
+    \"\"\"Utility function to replace object names given for ID path parameters with their IDs.\"\"\"
+    resolver = get_resolver()
+    if resolver is None:
+        return path_params
+    return await resolver.resolve(endpoint, path_params)
+
+async def make_bulk_request(operation_type: str, endpoint: str, ids: list = None, filter_expression: str = None, json_body: dict = None, confirm: bool = False):
+    \"\"\"Utility function to run one operation on many objects with bounded concurrency, reporting each object's outcome.\"\"\"
+    targets = await select_targets(client, endpoint, ids=ids, filter_expression=filter_expression, resolve=resolve_names)
+    if get_dct_config()["require_confirmation"] and not confirm:
+        token, expires_in = confirmations().create(TOOL_NAME, operation_type, {"endpoint": endpoint, "targets": targets, "json_body": json_body})
+        return bulk_plan(operation_type, endpoint, targets, token, expires_in)
+    return await execute_bulk(operation_type, endpoint, targets, json_body=json_body)
+
+async def execute_bulk(operation_type: str, endpoint: str, targets: list, json_body: dict = None, rate: float = None):
+    \"\"\"Utility function to run one operation on prepared targets with bounded concurrency.\"\"\"
+    dct_config = get_dct_config()
+    param = "{" + path_param(endpoint) + "}"
+    started_by = endpoint.strip("/").split("/")[0] + " " + operation_type
+
+    async def run(target):
+        path = endpoint.replace(param, target["id"])
+        response = await schedule_on_engine("POST", path, json_body, lambda: client.make_request("POST", path, json=json_body or {}))
+        if isinstance(response, dict) and response.get("started") is False:
+            raise ValueError(response["message"])
+        track_job(response, started_by)
+        job = response.get("job") if isinstance(response, dict) else None
+        return {"job_id": job.get("id"), "job_status": job.get("status")} if isinstance(job, dict) else {}
+
+    return await run_bulk(operation_type, targets, run, dct_config["bulk_concurrency"], dct_config["bulk_engine_concurrency"], rate=rate)
+
+async def make_group_refresh_request(vdbGroupId: str = None, ids: list = None, filter_expression: str = None, json_body: dict = None, confirm: bool = False, ctx=None):
+    \"\"\"Utility function to refresh a VDB group, or selected VDBs, each VDB after the parent it was provisioned from.\"\"\"
+    vdbs = await select_group_members(client, vdb_group=vdbGroupId, ids=ids, filter_expression=filter_expression, resolve=resolve_names)
+    if get_dct_config()["require_confirmation"] and not confirm:
+        token, expires_in = confirmations().create(TOOL_NAME, "refresh_group", {"vdbs": vdbs, "json_body": json_body})
+        return refresh_plan(vdbs, token, expires_in)
+    return await execute_group_refresh(vdbs, json_body=json_body, ctx=ctx)
+
+async def execute_group_refresh(vdbs: list, json_body: dict = None, ctx=None):
+    \"\"\"Utility function to run a group refresh in dependency order, reporting progress as VDBs finish.\"\"\"
+    dct_config = get_dct_config()
+    orchestrator = GroupRefresh(client, job_poller(), dct_config["bulk_concurrency"], dct_config["bulk_engine_concurrency"], dct_config["job_wait_timeout"], schedule=schedule_on_engine, timeout=dct_config["group_refresh_timeout"])
+    return await orchestrator.run(vdbs, json_body=json_body, on_started=lambda job: track_job({"job": job}, "vdbs refresh_group"), on_progress=lambda done, total, message: report_progress(ctx, done, total, message))
+
+async def make_sweep_request(older_than_days: float = None, filter_expression: str = None, dry_run: bool = False, confirm: bool = False):
+    \"\"\"Utility function to find the expired, orphaned or aged snapshots nothing depends on and delete them, or only report them.\"\"\"
+    report = await sweep_candidates(client, older_than_days=older_than_days, filter_expression=filter_expression)
+    if dry_run:
+        return {**report, "dry_run": True}
+    if get_dct_config()["require_confirmation"] and not confirm:
+        token, expires_in = confirmations().create(TOOL_NAME, "sweep", {"snapshots": report["candidates"]})
+        return sweep_plan(report, token, expires_in)
+    return await execute_sweep(report["candidates"])
+
+async def execute_sweep(snapshots: list):
+    \"\"\"Utility function to delete swept snapshots in parallel, paced to the sweep rate.\"\"\"
+    return sweep_result(await execute_bulk("sweep", RetentionConfig.DELETE_ENDPOINT, snapshots, rate=get_dct_config()["sweep_rate"]))
+
+def confirmations():
+    \"\"\"Utility function to return the store of plans awaiting confirmation, starting it on first use.\"\"\"
+    return start_confirmation_store(get_dct_config()["confirmation_ttl"])
+
+def plan_request(operation_type: str, method: str, endpoint: str, parameters: dict, json_body: dict = None, fields: list = None):
+    \"\"\"Utility function to store a prepared destructive request and return it for review with a confirmation token.\"\"\"
+    started_by = endpoint.strip("/").split("/")[0] + " " + operation_type
+    token, expires_in = confirmations().create(TOOL_NAME, operation_type, {"method": method, "endpoint": endpoint, "json_body": json_body, "fields": fields, "started_by": started_by})
+    return {
+        "requires_confirmation": True,
+        "operation": operation_type,
+        "method": method,
+        "endpoint": endpoint,
+        "parameters": parameters,
+        "confirmation_token": token,
+        "expires_in_seconds": expires_in,
+        "message": f"This operation '{operation_type}' is destructive and requires confirmation. Please review the parameters and call again with confirmation_token to run exactly this request."
+    }
+
+async def commit_plan(token: str, operation_type: str, ctx=None):
+    \"\"\"Utility function to run the requests a confirmation token was issued for, as they were prepared.\"\"\"
+    prepared = confirmations().take(token, TOOL_NAME, operation_type)
+    if "snapshots" in prepared:
+        return await execute_sweep(prepared["snapshots"])
+    if "vdbs" in prepared:
+        return await execute_group_refresh(prepared["vdbs"], json_body=prepared["json_body"], ctx=ctx)
+    if "targets" in prepared:
+        return await execute_bulk(operation_type, prepared["endpoint"], prepared["targets"], json_body=prepared["json_body"])
+    method, endpoint = prepared["method"], prepared["endpoint"]
+    response = await schedule_on_engine(method, endpoint, prepared["json_body"], lambda: make_api_request(method, endpoint, json_body=prepared["json_body"], fields=prepared["fields"]))
+    track_job(response, prepared["started_by"])
+    return response
+
+def job_poller():
+    \"\"\"Utility function to return the shared job poller, starting it on first use.\"\"\"
+    dct_config = get_dct_config()
+    return start_job_poller(client, dct_config["job_poll_min_interval"], dct_config["job_poll_max_interval"])
+
+def job_tracker():
+    \"\"\"Utility function to return the tracker of jobs started by this server, starting it on first use.\"\"\"
+    dct_config = get_dct_config()
+    return start_job_tracker(job_poller(), dct_config["job_tracker_size"], dct_config["job_wait_timeout"])
+
+def engine_scheduler():
+    \"\"\"Utility function to return the per-engine job scheduler, starting it on first use; None when disabled.\"\"\"
+    dct_config = get_dct_config()
+    if not dct_config["engine_max_jobs"]:
+        return None
+    return start_engine_scheduler(job_poller(), dct_config["engine_max_jobs"], dct_config["job_wait_timeout"], EngineLookup(client).engine_for, dct_config["engine_queue_timeout"])
+
+async def schedule_on_engine(method: str, endpoint: str, json_body: dict, call):
+    \"\"\"Utility function to run a job-starting call once the engine its job runs on has a free slot.\"\"\"
+    scheduler = engine_scheduler()
+    if scheduler is None:
+        return await call()
+    try:
+        return await scheduler.run(method, endpoint, json_body, call)
+    except EngineQueueTimeout as e:
+        return e.to_dict()
+
+def engine_queue_stats():
+    \"\"\"Utility function to report jobs in flight, queue depth and queue wait times per engine.\"\"\"
+    scheduler = engine_scheduler()
+    if scheduler is None:
+        return {"enabled": False, "engines": {}}
+    return {"enabled": True, **scheduler.stats()}
+
+async def wait_for_job(job_id: str, timeout: float = None, fields: list = None, on_update=None):
+    \"\"\"Utility function to block on the shared job poller until a job reaches a terminal state or the timeout passes.\"\"\"
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive.")
+    # Finished jobs never change, so a cached one is returned without polling
+    cached = job_tracker().completed(job_id)
+    if cached is not None:
+        if on_update is not None:
+            await on_update(cached)
+        result = {"job": cached, "status": cached.get("status"), "terminal": True, "timed_out": False, "waited_seconds": 0.0}
+    else:
+        result = await job_poller().wait(job_id, timeout if timeout is not None else get_dct_config()["job_wait_timeout"], on_update=on_update)
+    return {**result, "job": project_result(result["job"], fields, "/jobs")}
+
+def track_job(result, started_by: str):
+    \"\"\"Utility function to record the job a call started, so the job tracker follows it in the background.\"\"\"
+    job = result.get("job") if isinstance(result, dict) else None
+    if isinstance(job, dict) and job.get("id"):
+        job_tracker().track(job, started_by)
+
+def list_my_jobs(filter_expression: str = None, limit: int = None, fields: list = None):
+    \"\"\"Utility function to list the jobs started by this server from memory, most recent first.\"\"\"
+    matches = compile_filter(filter_expression) if filter_expression else None
+    return project_result(job_tracker().list(matches, limit), fields, "/jobs")
+
+async def follow_job_progress(result, timeout: float = None, ctx=None):
+    \"\"\"Utility function to stay attached to the job a call started, sending MCP progress notifications until it finishes.\"\"\"
+    job = result.get("job") if isinstance(result, dict) else None
+    if not isinstance(job, dict) or not job.get("id"):
+        return result
+    waited = await wait_for_job(job["id"], timeout=timeout, on_update=lambda update: report_job_progress(ctx, update))
+    return {**result, "job": waited.pop("job") or job, "job_wait": waited}
 
 def build_params(**kwargs):
     \"\"\"Build parameters dictionary excluding None values.\"\"\"
@@ -219,7 +543,8 @@ def generate_tools_from_openapi():
         enum_class_name = f"{tool_class}Operation"
         
         # Build list of operation names for Literal type
-        op_names = sorted(operations_dict.keys())
+        composite_ops = composite_operations_for(operations_dict)
+        op_names = sorted(list(operations_dict.keys()) + composite_ops)
         op_literals = ", ".join([f'"{op}"' for op in op_names])
         
         enum_code = f"from enum import Enum\nfrom typing import Literal\n\nclass {enum_class_name}(Enum):\n"
@@ -233,6 +558,8 @@ def generate_tools_from_openapi():
         tool_file_content = prefix
         tool_file_content = tool_file_content.replace("from enum import Enum", "")
         tool_file_content = tool_file_content.replace("from typing import Literal", "")
+        if "search_joined" not in composite_ops:
+            tool_file_content = tool_file_content.replace("search_joined, ", "").replace(join_helper, "")
         tool_file_content = enum_code + tool_file_content
         
         # Generate consolidated function signature with Literal type for MCP compatibility
@@ -251,7 +578,38 @@ def generate_tools_from_openapi():
         function_head += f"    cursor: Optional[str] = None,\n"
         function_head += f"    sort: Optional[str] = None,\n"
         function_head += f"    filter_expression: Optional[str] = None,\n"
-        function_head += f"    confirm: bool = False\n"
+        if "search_all" in composite_ops:
+            function_head += f"    entities: Optional[List[str]] = None,\n"
+        if "search_joined" in composite_ops:
+            function_head += f"    relations: Optional[List[str]] = None,\n"
+        if "wait" in composite_ops or starts_jobs(operations_dict):
+            function_head += f"    timeout: Optional[float] = None,\n"
+        if "analyze_durations" in composite_ops:
+            function_head += f"    since: Optional[str] = None,\n"
+            function_head += f"    until: Optional[str] = None,\n"
+        if starts_jobs(operations_dict):
+            function_head += f"    follow_job: bool = False,\n"
+        bulk_ops, bulk_param = bulk_operations_for(operations_dict)
+        if bulk_ops:
+            function_head += f"    ids: Optional[List[str]] = None,\n"
+        if "refresh_group" in composite_ops:
+            function_head += f"    vdbGroupId: Optional[str] = None,\n"
+        if "sweep" in composite_ops:
+            function_head += f"    older_than_days: Optional[float] = None,\n"
+            function_head += f"    dry_run: bool = False,\n"
+        if any('search' in op.lower() for op in operations_dict.keys()):
+            function_head += f"    aggregate: Optional[Dict[str, Any]] = None,\n"
+            function_head += f"    top_k: Optional[Dict[str, Any]] = None,\n"
+        function_head += f"    all_pages: bool = False,\n"
+        function_head += f"    max_items: Optional[int] = None,\n"
+        function_head += f"    fields: Optional[List[str]] = None,\n"
+        function_head += f"    max_staleness: Optional[float] = None,\n"
+        function_head += f"    confirm: bool = False,\n"
+        if starts_jobs(operations_dict):
+            function_head += f"    confirmation_token: Optional[str] = None,\n"
+            function_head += f"    ctx: Optional[Context] = None\n"
+        else:
+            function_head += f"    confirmation_token: Optional[str] = None\n"
         function_head += f") -> Dict[str, Any]:\n"
         
         # Build docstring with all supported operations
@@ -275,7 +633,10 @@ def generate_tools_from_openapi():
         docstring += f'    Resource: {resource_hint}.\n'
         docstring += f'    Use this tool only for {resource_hint} operations.\n\n'
         docstring += '    Supported operations:\n'
-        for op_name in sorted(operations_dict.keys()):
+        for op_name in op_names:
+            if op_name in composite_ops:
+                docstring += f'    - {op_name}: {COMPOSITE_OPERATIONS[op_name]}\n'
+                continue
             # Get first endpoint for this operation to look up its description
             endpoints = operations_dict[op_name]
             if endpoints:
@@ -301,11 +662,145 @@ def generate_tools_from_openapi():
     - Logical: name CONTAINS 'prod' AND status EQ 'RUNNING'
     
     Available operators: EQ, NE, CONTAINS, NOT_CONTAINS, LT, LE, GT, GE, IN, NOT_IN
+
+    Pagination (for search operations):
+    - all_pages=True follows next_cursor inside the server and returns every
+      page as one result; max_items caps the number of items returned.
+    - Results are bounded by a hard item and byte cap; response_metadata
+      reports truncated, truncated_reason and the next_cursor to resume from
+      (pass it as cursor with all_pages=True).
+    - Results too large to return inline come back as a summary (schema,
+      preview, total_items) with a resource_uri; read the items in slices
+      from dct://results/{handle}/{offset}/{limit}.
+
+    Aggregation (for search operations):
+    - aggregate={"group_by": [...], "sum": [...], "min": [...], "max": [...]}
+      scans every matching object page by page and returns only per-group
+      counts, sums, minimums and maximums, e.g. group_by=["engine_id",
+      "status"] for counts per engine and status. max_items caps the
+      number of objects scanned; with max_staleness the inventory is used.
+
+    Top-k selection (for search operations):
+    - top_k={"k": 10, "by": "-size"} scans every matching object and returns
+      only the k with the largest ("-" prefix) or smallest value of the
+      field, holding at most k objects in memory. max_items caps the number
+      of objects scanned; with max_staleness the inventory is used.
+'''
+        docstring += '''
+    Field projection:
+    - fields=[...] returns only the given dotted paths of each result object
+      (e.g. "name", "hosts.hostname"), or a preset: "summary", "storage", "ids".
+      It applies to get and search results; responses of calls that start a
+      job are returned whole.
+
+    Inventory cache:
+    - max_staleness=<seconds> answers get and search on VDBs, dSources,
+      environments, engines, VDB groups and bookmarks from the server's
+      in-memory inventory if it was refreshed within that bound.
+      Searches with a filter_expression are evaluated locally too.
+'''
+        if any(
+            f"{{{param}}}" in api
+            for endpoints in operations_dict.values()
+            for api in endpoints
+            for param in RESOLVABLE_PARAMS
+        ):
+            docstring += '''
+    Name resolution:
+    - vdbId, dsourceId, environmentId and snapshotId accept an object name
+      instead of an ID (exact match first, then case-insensitive). Ambiguous
+      names are rejected with the matching IDs.
+'''
+        if "search_joined" in composite_ops:
+            docstring += relations_docstring(entity_name(operations_dict["search"][0]))
+        if "wait" in composite_ops:
+            docstring += '''
+    Waiting on jobs (wait):
+    - wait blocks until jobId is COMPLETED, FAILED, CANCELED, ABANDONED or
+      TIMEDOUT, or until timeout seconds pass (server default 300), and
+      returns the job with terminal and timed_out flags. Prefer it over
+      calling get_result repeatedly.
+
+    Jobs started by this server (list_my_jobs):
+    - list_my_jobs returns the jobs started through this server's tools,
+      most recent first, with their latest state and the operation that
+      started them. It is served from memory; filter_expression (e.g.
+      "status EQ 'FAILED'") and limit (default 100) apply.
+'''
+        if "analyze_durations" in composite_ops:
+            docstring += '''
+    Job duration analytics (analyze_durations):
+    - analyze_durations streams the jobs started between since and until
+      (ISO 8601; default the last 7 days, narrowed by filter_expression)
+      and returns run-time quantiles in seconds per group, e.g.
+      aggregate={"group_by": ["type", "engine_ids"], "quantiles": [0.5,
+      0.95, 0.99]} (defaults: group by type, p50/p95/p99). Estimates are
+      within 1% of the exact value; unfinished jobs are skipped.
+'''
+        if starts_jobs(operations_dict):
+            docstring += '''
+    Following jobs:
+    - follow_job=True keeps a call that starts a job attached to it until the
+      job finishes or timeout seconds pass (server default 300), sending MCP
+      progress notifications with the percent complete and current step.
+      The response then holds the final job and a job_wait summary.
+'''
+        if bulk_ops:
+            docstring += bulk_docstring(entity_name(operations_dict["search"][0]), bulk_ops, bulk_param)
+        if "refresh_group" in composite_ops:
+            docstring += '''
+    Group refresh (refresh_group):
+    - refresh_group refreshes every VDB of vdbGroupId (or of ids or a
+      filter_expression) to the latest data of its parent. A VDB
+      provisioned from another VDB of the set starts as soon as its
+      parent's refresh job completed, so independent branches run side by
+      side; VDBs whose parent failed are skipped. Progress notifications
+      report the VDBs done, and the response lists every VDB's level,
+      job_id and outcome. After DCT_GROUP_REFRESH_TIMEOUT seconds (default
+      3600) the call returns; refreshes still running then are reported as
+      pending with their job_id.
+'''
+        if "engine_queues" in composite_ops:
+            docstring += '''
+    Engine job queues (engine_queues):
+    - Mutating VDB, dSource and environment calls start at most
+      DCT_ENGINE_MAX_JOBS jobs per engine from this server; a slot is
+      freed when the job finishes, and further calls for that engine wait
+      in arrival order (their response then carries engine_queue). A call
+      still queued after DCT_ENGINE_QUEUE_TIMEOUT seconds is not sent and
+      returns started=False.
+      engine_queues returns per engine the limit, in_flight, queue_depth,
+      peak_queue_depth, timed_out and wait_seconds (p50, p95, max, mean).
+'''
+        if "sweep" in composite_ops:
+            docstring += '''
+    Retention sweep (sweep):
+    - sweep streams snapshots oldest first (narrowed by filter_expression)
+      and selects those whose expiration passed, whose dataset no longer
+      exists, or, with older_than_days, that are older than that. Snapshots
+      retained forever, the newest snapshot of every dataset and snapshots
+      a VDB was provisioned from or a bookmark points at are kept.
+    - dry_run=True returns the candidates with reclaimable_bytes in total
+      and per engine without deleting anything. Otherwise the candidates
+      are deleted in parallel within the bulk limits, starting at most
+      DCT_SWEEP_RATE deletions per second; one sweep deletes at most 500.
+'''
+        docstring += '''
+    Confirmation:
+    - With DCT_REQUIRE_CONFIRMATION=true a destructive call returns the
+      prepared request with a confirmation_token valid for
+      DCT_CONFIRMATION_TTL seconds (default 300). Calling this tool again
+      with the same operation_type and the confirmation_token runs exactly that
+      request, or every target of a bulk operation, without validating or
+      resolving names again. A token can be used once.
 '''
         docstring += '    """\n'
         
         # Build operation routing logic
-        routing_logic = '    operation_map = {\n'
+        operation_map_code = '# Name this tool is registered under\n'
+        operation_map_code += f'TOOL_NAME = "dct_manage_{tool_name}"\n\n'
+        operation_map_code += '# DCT endpoint and HTTP method of each operation\n'
+        operation_map_code += 'OPERATION_MAP = {\n'
         for op_name, endpoints in sorted(operations_dict.items()):
             if not endpoints:
                 continue
@@ -315,15 +810,77 @@ def generate_tools_from_openapi():
             path_item = api_spec.get("paths", {}).get(api, {})
             http_method = "POST" if "post" in path_item else "GET"
             
-            routing_logic += f'        "{op_name}": ("{api}", "{http_method}"),\n'
+            operation_map_code += f'    "{op_name}": ("{api}", "{http_method}"),\n'
         
-        routing_logic += '    }\n\n'
+        operation_map_code += '}\n\n'
+        routing_logic = '    operation_map = OPERATION_MAP\n\n'
+        if "search_all" in composite_ops:
+            routing_logic += '    # search_all fans out this tool\'s entity searches concurrently\n'
+            routing_logic += '    if operation_type == "search_all":\n'
+            routing_logic += '        searches = {op[len("search_"):]: path for op, (path, _) in operation_map.items() if op.startswith("search_")}\n'
+            routing_logic += '        json_body = body if body is not None else {}\n'
+            routing_logic += '        if filter_expression is not None:\n'
+            routing_logic += '            json_body = {**json_body, "filter_expression": filter_expression}\n'
+            routing_logic += '        return await make_multi_search_request(searches, entities=entities, json_body=json_body, limit=limit, sort=sort, all_pages=all_pages, max_items=max_items, cursor=cursor, fields=fields)\n'
+            routing_logic += '\n'
+        if "search_joined" in composite_ops:
+            routing_logic += '    # search_joined embeds related objects into each search result\n'
+            routing_logic += '    if operation_type == "search_joined":\n'
+            routing_logic += '        json_body = body if body is not None else {}\n'
+            routing_logic += '        if filter_expression is not None:\n'
+            routing_logic += '            json_body = {**json_body, "filter_expression": filter_expression}\n'
+            routing_logic += '        return await make_join_request(operation_map["search"][0], relations=relations, json_body=json_body, sort=sort, limit=limit, max_items=max_items, max_staleness=max_staleness, fields=fields)\n'
+            routing_logic += '\n'
+        if "wait" in composite_ops:
+            routing_logic += '    # wait blocks on the shared job poller until the job finishes\n'
+            routing_logic += '    if operation_type == "wait":\n'
+            routing_logic += '        if jobId is None:\n'
+            routing_logic += '            raise ValueError("jobId is required for the wait operation.")\n'
+            routing_logic += '        return await wait_for_job(jobId, timeout=timeout, fields=fields)\n'
+            routing_logic += '\n'
+            routing_logic += '    # list_my_jobs is answered from the job tracker without calling DCT\n'
+            routing_logic += '    if operation_type == "list_my_jobs":\n'
+            routing_logic += '        return list_my_jobs(filter_expression=filter_expression, limit=limit, fields=fields)\n'
+            routing_logic += '\n'
+        if "analyze_durations" in composite_ops:
+            routing_logic += '    # analyze_durations streams the window\'s jobs through quantile sketches\n'
+            routing_logic += '    if operation_type == "analyze_durations":\n'
+            routing_logic += '        return await make_duration_request(aggregate, since=since, until=until, filter_expression=filter_expression, page_size=limit, max_items=max_items)\n'
+            routing_logic += '\n'
+        if "engine_queues" in composite_ops:
+            routing_logic += '    # engine_queues reports the per-engine job scheduler\n'
+            routing_logic += '    if operation_type == "engine_queues":\n'
+            routing_logic += '        return engine_queue_stats()\n'
+            routing_logic += '\n'
+        routing_logic += '    # Run the requests prepared when the confirmation token was issued\n'
+        routing_logic += '    if confirmation_token is not None:\n'
+        if starts_jobs(operations_dict):
+            routing_logic += '        response = await commit_plan(confirmation_token, operation_type, ctx=ctx)\n'
+            routing_logic += '        return await follow_job_progress(response, timeout=timeout, ctx=ctx) if follow_job else response\n'
+        else:
+            routing_logic += '        return await commit_plan(confirmation_token, operation_type)\n'
+        routing_logic += '\n'
+        if "refresh_group" in composite_ops:
+            routing_logic += '    # refresh_group refreshes each VDB after the parent it was provisioned from\n'
+            routing_logic += '    if operation_type == "refresh_group":\n'
+            routing_logic += '        return await make_group_refresh_request(vdbGroupId=vdbGroupId, ids=ids, filter_expression=filter_expression, json_body=body, confirm=confirm, ctx=ctx)\n'
+            routing_logic += '\n'
+        if "sweep" in composite_ops:
+            routing_logic += '    # sweep deletes the snapshots retention no longer keeps, or reports them with dry_run\n'
+            routing_logic += '    if operation_type == "sweep":\n'
+            routing_logic += '        return await make_sweep_request(older_than_days=older_than_days, filter_expression=filter_expression, dry_run=dry_run, confirm=confirm)\n'
+            routing_logic += '\n'
         routing_logic += '    # operation_type is already a string (Literal type)\n'
         routing_logic += '    result = operation_map.get(operation_type)\n'
         routing_logic += '    if not result:\n'
         routing_logic += f'        raise ValueError(f"Unknown operation: {{operation_type}}")\n'
         routing_logic += '    endpoint, method = result\n'
         routing_logic += '    \n'
+        if bulk_ops:
+            routing_logic += f'    # Act on many objects when ids or a filter_expression select them instead of {bulk_param}\n'
+            routing_logic += f'    if operation_type in {tuple(bulk_ops)!r} and {bulk_param} is None and (ids or filter_expression is not None):\n'
+            routing_logic += '        return await make_bulk_request(operation_type, endpoint, ids=ids, filter_expression=filter_expression, json_body=body, confirm=confirm)\n'
+            routing_logic += '    \n'
         routing_logic += '    # Substitute path parameters\n'
         routing_logic += '    path_params = {\n'
         routing_logic += '        "vdbId": vdbId,\n'
@@ -333,6 +890,7 @@ def generate_tools_from_openapi():
         routing_logic += '        "environmentId": environmentId,\n'
         routing_logic += '        "jobId": jobId,\n'
         routing_logic += '    }\n'
+        routing_logic += '    path_params = await resolve_names(endpoint, path_params)\n'
         routing_logic += '    for key, value in path_params.items():\n'
         routing_logic += '        if value is not None:\n'
         routing_logic += '            endpoint = endpoint.replace(f"{{{key}}}", value)\n'
@@ -345,27 +903,53 @@ def generate_tools_from_openapi():
         routing_logic += '    if is_search and filter_expression is not None:\n'
         routing_logic += '        json_body = {**json_body, "filter_expression": filter_expression}\n'
         routing_logic += '    \n'
+        routing_logic += '    # Keep only the k best objects while the pages stream through a bounded heap\n'
+        routing_logic += '    if is_search and top_k is not None:\n'
+        routing_logic += '        if aggregate is not None:\n'
+        routing_logic += '            raise ValueError("aggregate and top_k cannot be combined.")\n'
+        routing_logic += '        return await make_top_k_request(endpoint, top_k, json_body=json_body, page_size=limit, max_items=max_items, max_staleness=max_staleness, fields=fields)\n'
+        routing_logic += '    \n'
+        routing_logic += '    # Stream every page through an accumulator and return only the aggregate\n'
+        routing_logic += '    if is_search and aggregate is not None:\n'
+        routing_logic += '        return await make_aggregate_request(endpoint, aggregate, json_body=json_body, page_size=limit, max_items=max_items, max_staleness=max_staleness)\n'
+        routing_logic += '    \n'
+        routing_logic += '    # Serve reads from the in-memory inventory when it is fresh enough\n'
+        routing_logic += '    if max_staleness is not None and (is_search or method == "GET"):\n'
+        routing_logic += '        cached = lookup_inventory(method, endpoint, json_body=json_body, params=params, max_staleness=max_staleness, all_pages=all_pages, max_items=max_items)\n'
+        routing_logic += '        if cached is not None:\n'
+        routing_logic += '            return offload_result(project_result(cached, fields, endpoint), endpoint)\n'
+        routing_logic += '    \n'
+        routing_logic += '    # Follow cursors inside the server when the full result set is requested\n'
+        routing_logic += '    if is_search and (all_pages or max_items is not None):\n'
+        routing_logic += '        return await make_paginated_request(endpoint, json_body=json_body, sort=sort, page_size=limit, max_items=max_items, cursor=cursor, fields=fields)\n'
+        routing_logic += '    \n'
         routing_logic += '    # Check if confirmation is required for destructive operations\n'
         routing_logic += '    dct_config = get_dct_config()\n'
         routing_logic += '    is_destructive = method in ["POST", "PUT", "DELETE"] and not is_search and operation_type != "get" and operation_type != "get_result"\n'
         routing_logic += '    if is_destructive and dct_config["require_confirmation"] and not confirm:\n'
-        routing_logic += '        return {\n'
-        routing_logic += '            "requires_confirmation": True,\n'
-        routing_logic += '            "operation": operation_type,\n'
-        routing_logic += '            "method": method,\n'
-        routing_logic += '            "endpoint": endpoint,\n'
-        routing_logic += '            "parameters": {k: v for k, v in {"vdbId": vdbId, "snapshotId": snapshotId, "sourceId": sourceId, "dsourceId": dsourceId, "environmentId": environmentId, "jobId": jobId, "body": body}.items() if v is not None},\n'
-        routing_logic += '            "message": f"This operation \'{operation_type}\' is destructive and requires confirmation. Please review the parameters and call again with confirm=True to proceed."\n'
-        routing_logic += '        }\n'
+        routing_logic += '        parameters = {k: v for k, v in {"vdbId": vdbId, "snapshotId": snapshotId, "sourceId": sourceId, "dsourceId": dsourceId, "environmentId": environmentId, "jobId": jobId, "body": body}.items() if v is not None}\n'
+        routing_logic += '        return plan_request(operation_type, method, endpoint, parameters, json_body=json_body, fields=fields)\n'
         routing_logic += '    \n'
-        routing_logic += '    return await make_api_request(method, endpoint, params=params, json_body=json_body)\n'
+        if starts_jobs(operations_dict):
+            routing_logic += '    if is_search or method == "GET":\n'
+            routing_logic += '        return await make_api_request(method, endpoint, params=params, json_body=json_body, fields=fields)\n'
+            routing_logic += '    \n'
+            routing_logic += '    # Start the job once its engine has a free slot and record it, optionally staying attached to report its progress\n'
+            routing_logic += '    response = await schedule_on_engine(method, endpoint, json_body, lambda: make_api_request(method, endpoint, params=params, json_body=json_body, fields=fields))\n'
+            routing_logic += f'    track_job(response, f"{tool_name.replace("_endpoints", "")} {{operation_type}}")\n'
+            routing_logic += '    if follow_job:\n'
+            routing_logic += '        return await follow_job_progress(response, timeout=timeout, ctx=ctx)\n'
+            routing_logic += '    return response\n'
+        else:
+            routing_logic += '    return await make_api_request(method, endpoint, params=params, json_body=json_body, fields=fields)\n'
         
-        tool_file_content += function_head + docstring + routing_logic
+        tool_file_content += operation_map_code + function_head + docstring + routing_logic
         
         # Register the consolidated function
         tool_file_content += f"\ndef register_tools(app, dct_client):\n"
         tool_file_content += f'    global client\n'
         tool_file_content += f'    client = dct_client\n'
+        tool_file_content += f'    register_path_templates(OPERATION_MAP.values())\n'
         tool_file_content += f'    logger.info(f"Registering DCT tool: {func_name}")\n'
         tool_file_content += f'    try:\n'
         tool_file_content += f'        app.add_tool({func_name}, name="{func_name}")\n'
@@ -0,0 +1,28 @@
+from dct_mcp_server.core.aggregation import Aggregator, QuantileAggregator
+
+
+def test_groups_count_items_and_fold_metrics():
+    aggregator = Aggregator({"group_by": ["engine_id"], "sum": ["size"], "max": ["size"]})
+    aggregator.add_many([
+        {"engine_id": "e1", "size": 10},
+        {"engine_id": "e1", "size": 5},
+        {"engine_id": "e2", "size": 7},
+    ])
+    result = aggregator.result()
+    assert result["total_count"] == 3
+    assert result["groups"][0] == {"key": {"engine_id": "e1"}, "count": 2, "sum": {"size": 15}, "max": {"size": 10}}
+
+
+def test_equal_values_of_different_types_are_separate_groups():
+    aggregator = Aggregator({"group_by": ["value"]})
+    aggregator.add_many({"value": value} for value in (True, 1, 1.0, "1", [1], "[1]", 1))
+    counts = [(type(group["key"]["value"]), group["count"]) for group in aggregator.result()["groups"]]
+    assert len(counts) == 6
+    assert counts[0] == (int, 2)
+    assert (bool, 1) in counts and (float, 1) in counts and (list, 1) in counts
+
+
+def test_quantile_groups_keep_types_apart():
+    aggregator = QuantileAggregator({"group_by": ["value"]}, value=lambda item: 1.0)
+    aggregator.add_many({"value": value} for value in (True, 1, 1.0))
+    assert len(aggregator.result()["groups"]) == 3
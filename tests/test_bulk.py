@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from dct_mcp_server.core.bulk import BulkConfig, select_targets
+
+
+class FakeClient:
+    """Serves a search as pages of 100 items, like DCT's default page size."""
+
+    def __init__(self, count):
+        self.items = [{"id": f"vdb-{i}", "name": f"db-{i}", "engine_id": "e1", "blob": "x" * 3000} for i in range(count)]
+
+    async def scan_search(self, endpoint, consume, json_body=None, max_items=None):
+        items = self.items[:max_items]
+        for start in range(0, len(items), 100):
+            consume(items[start : start + 100])
+        return {"scanned": len(items), "truncated": len(items) < len(self.items)}
+
+
+def select(count):
+    return asyncio.run(select_targets(FakeClient(count), "/vdbs/{vdbId}/stop", filter_expression="name CONTAINS 'db'"))
+
+
+def test_filter_selects_every_match():
+    targets = select(450)
+    assert len(targets) == 450
+    assert targets[0] == {"id": "vdb-0", "name": "db-0", "engine_id": "e1"}
+
+
+def test_filter_may_select_up_to_the_cap():
+    assert len(select(BulkConfig.MAX_TARGETS)) == BulkConfig.MAX_TARGETS
+
+
+def test_filter_over_the_cap_is_rejected():
+    with pytest.raises(ValueError, match="narrow it down"):
+        select(BulkConfig.MAX_TARGETS + 1)
@@ -0,0 +1,33 @@
+import pytest
+
+from dct_mcp_server.core.confirmation import ConfirmationStore
+
+
+def test_token_commits_once():
+    store = ConfirmationStore(ttl=60)
+    token, _ = store.create("dct_manage_vdbs_endpoints", "delete", {"endpoint": "/vdbs/v1/delete"})
+    assert store.take(token, "dct_manage_vdbs_endpoints", "delete") == {"endpoint": "/vdbs/v1/delete"}
+    with pytest.raises(ValueError):
+        store.take(token, "dct_manage_vdbs_endpoints", "delete")
+
+
+def test_token_is_bound_to_its_tool():
+    store = ConfirmationStore(ttl=60)
+    token, _ = store.create("dct_manage_vdbs_endpoints", "delete", {"endpoint": "/vdbs/v1/delete"})
+    with pytest.raises(ValueError, match="dct_manage_vdbs_endpoints"):
+        store.take(token, "dct_manage_dsources_endpoints", "delete")
+    assert store.take(token, "dct_manage_vdbs_endpoints", "delete")
+
+
+def test_token_is_bound_to_its_operation():
+    store = ConfirmationStore(ttl=60)
+    token, _ = store.create("dct_manage_vdbs_endpoints", "delete", {})
+    with pytest.raises(ValueError, match="'delete'"):
+        store.take(token, "dct_manage_vdbs_endpoints", "stop")
+
+
+def test_expired_token_is_rejected():
+    store = ConfirmationStore(ttl=0)
+    token, _ = store.create("dct_manage_vdbs_endpoints", "delete", {})
+    with pytest.raises(ValueError):
+        store.take(token, "dct_manage_vdbs_endpoints", "delete")
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from dct_mcp_server.inventory.engines import EngineLookup, register_path_templates
+
+OPERATIONS = [
+    ("/vdbs/{vdbId}/stop", "POST"),
+    ("/vdbs/{vdbId}", "DELETE"),
+    ("/dsources/oracle/{dsourceId}", "PATCH"),
+    ("/dsources/oracle/{dsourceId}/attachSource", "POST"),
+    ("/dsources/mssql/staging-push/{dsourceId}/attachSource", "POST"),
+    ("/dsources/oracle/staging-push", "POST"),
+    ("/dsources/delete", "POST"),
+    ("/environments/{environmentId}/hosts/{hostId}", "DELETE"),
+]
+
+
+class FakeClient:
+    def __init__(self):
+        self.objects = {
+            "vdbs": {"vdb-1": {"engine_id": "eng-1"}},
+            "dsources": {"ds-1": {"engine_id": "eng-2"}},
+            "environments": {"env-1": {"engine_id": "eng-3"}},
+        }
+        self.searches = []
+
+    async def search_by_ids(self, collection, ids):
+        self.searches.append((collection, tuple(ids)))
+        objects = self.objects.get(collection, {})
+        return {object_id: objects[object_id] for object_id in ids if object_id in objects}
+
+
+@pytest.fixture
+def lookup():
+    register_path_templates(OPERATIONS)
+    return EngineLookup(FakeClient())
+
+
+def engine_for(lookup, method, endpoint, json_body=None):
+    return asyncio.run(lookup.engine_for(method, endpoint, json_body))
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, json_body, engine",
+    [
+        ("POST", "/vdbs/vdb-1/stop", None, "eng-1"),
+        ("DELETE", "/vdbs/vdb-1", None, "eng-1"),
+        ("POST", "/dsources/oracle/ds-1/attachSource", None, "eng-2"),
+        ("POST", "/dsources/mssql/staging-push/ds-1/attachSource", None, "eng-2"),
+        ("POST", "/dsources/oracle/staging-push", {"environment_id": "env-1"}, "eng-3"),
+        ("POST", "/dsources/delete", {"dsource_id": "ds-1"}, "eng-2"),
+        ("DELETE", "/environments/env-1/hosts/host-9", None, "eng-3"),
+        ("POST", "/vdbs/provision_by_snapshot", {"engine_id": "eng-7"}, "eng-7"),
+    ],
+)
+def test_engine_of_request_target(lookup, method, endpoint, json_body, engine):
+    assert engine_for(lookup, method, endpoint, json_body) == engine
+
+
+def test_literal_segments_are_not_looked_up(lookup):
+    engine_for(lookup, "POST", "/dsources/oracle/staging-push", {"environment_id": "env-1"})
+    assert lookup._client.searches == [("environments", ("env-1",))]
+
+
+def test_missing_objects_are_remembered(lookup):
+    assert engine_for(lookup, "POST", "/vdbs/nope/stop") is None
+    assert engine_for(lookup, "DELETE", "/vdbs/nope") is None
+    assert lookup._client.searches == [("vdbs", ("nope",))]
@@ -0,0 +1,197 @@
+import pytest
+
+from dct_mcp_server.core.filters import (
+    Comparison,
+    FilterSyntaxError,
+    Logical,
+    compile_filter,
+    format_literal,
+    normalize_filter,
+    parse_filter,
+)
+
+
+# Parsing
+
+
+def test_parse_comparison():
+    assert parse_filter("name EQ 'prod'") == Comparison("name", "EQ", "prod")
+
+
+def test_parse_literals():
+    assert parse_filter("size GT 10").value == 10
+    assert parse_filter("size GT -1.5").value == -1.5
+    assert parse_filter("size GT 1e3").value == 1000.0
+    assert parse_filter("enabled EQ TRUE").value is True
+    assert parse_filter("enabled EQ false").value is False
+    assert parse_filter("parent_id EQ null").value is None
+    assert parse_filter("name EQ 'it''s'").value == "it's"
+
+
+def test_parse_keywords_are_case_insensitive():
+    assert parse_filter("name eq 'a' and size gt 1") == parse_filter("name EQ 'a' AND size GT 1")
+
+
+def test_parse_list_operators():
+    assert parse_filter("status IN ('RUNNING', 'STOPPED')") == Comparison(
+        "status", "IN", ("RUNNING", "STOPPED")
+    )
+    assert parse_filter("engine_id NOT_IN ('e1')").operator == "NOT_IN"
+
+
+def test_parse_contains_stringifies_value():
+    assert parse_filter("name CONTAINS 12") == Comparison("name", "CONTAINS", "12")
+
+
+def test_and_binds_tighter_than_or():
+    node = parse_filter("a EQ 1 OR b EQ 2 AND c EQ 3")
+    assert node == Logical(
+        "OR",
+        (Comparison("a", "EQ", 1), Logical("AND", (Comparison("b", "EQ", 2), Comparison("c", "EQ", 3)))),
+    )
+
+
+def test_parentheses_group():
+    node = parse_filter("(a EQ 1 OR b EQ 2) AND c EQ 3")
+    assert node.operator == "AND"
+    assert node.operands[0].operator == "OR"
+
+
+def test_dotted_fields():
+    assert parse_filter("hosts.hostname EQ 'h1'").field == "hosts.hostname"
+
+
+@pytest.mark.parametrize(
+    "expression, position",
+    [
+        ("", 0),
+        ("name", 4),
+        ("name EQ", 7),
+        ("name EQ 'a' AND", 15),
+        ("(name EQ 'a'", 12),
+        ("name EQ 'a' )", 12),
+        ("name IN 'a'", 8),
+        ("name EQ 'a' # x", 12),
+        ("name SW 'prod'", 5),
+    ],
+)
+def test_syntax_errors_report_position(expression, position):
+    with pytest.raises(FilterSyntaxError) as raised:
+        parse_filter(expression)
+    assert raised.value.position == position
+    assert isinstance(raised.value, ValueError)
+
+
+# Canonical form
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ("name EQ 'a' AND size GT 1", "size gt 1 and name eq \"a\"".replace('"', "'")),
+        ("a EQ 1 AND (b EQ 2 AND c EQ 3)", "(a EQ 1 AND b EQ 2) AND c EQ 3"),
+        ("a EQ 1 OR a EQ 1", "a EQ 1"),
+        ("s IN ('b', 'a', 'b')", "s IN ('a', 'b')"),
+        ("s IN ('a')", "s EQ 'a'"),
+        ("s NOT_IN ('a')", "s NE 'a'"),
+        ("  name   EQ   'a'  ", "name EQ 'a'"),
+    ],
+)
+def test_equivalent_filters_normalize_alike(left, right):
+    assert normalize_filter(left) == normalize_filter(right)
+
+
+def test_normalize_keeps_different_filters_apart():
+    assert normalize_filter("a EQ 1 AND b EQ 2") != normalize_filter("a EQ 1 OR b EQ 2")
+    assert normalize_filter("a EQ 1") != normalize_filter("a EQ '1'")
+
+
+def test_normalized_filters_parse_back():
+    canonical = normalize_filter("(b EQ 'x''y' OR a IN (3, 1)) AND c CONTAINS 'z'")
+    assert normalize_filter(canonical) == canonical
+
+
+def test_format_literal():
+    assert format_literal("it's") == "'it''s'"
+    assert format_literal(True) == "true"
+    assert format_literal(None) == "null"
+    assert format_literal(1.5) == "1.5"
+
+
+def test_equivalent_filters_share_a_predicate():
+    assert compile_filter("a EQ 1 AND b EQ 2") is compile_filter("b EQ 2 and a EQ 1")
+
+
+# Evaluation
+
+VDB = {
+    "name": "prod-db",
+    "status": "RUNNING",
+    "size": 500,
+    "enabled": True,
+    "parent_id": None,
+    "tags": [{"key": "env", "value": "prod"}, {"key": "team", "value": "dba"}],
+    "hosts": [{"hostname": "h1"}, {"hostname": "h2"}],
+    "engine_ids": ["e1", "e2"],
+}
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("status EQ 'RUNNING'", True),
+        ("status EQ 'running'", False),
+        ("status NE 'FAILED'", True),
+        ("name CONTAINS 'PROD'", True),
+        ("name NOT_CONTAINS 'dev'", True),
+        ("size GT 100", True),
+        ("size LE 499", False),
+        ("size GE 500 AND size LT 501", True),
+        ("size EQ '500'", True),
+        ("enabled EQ true", True),
+        ("enabled EQ 'true'", True),
+        ("status IN ('STOPPED', 'RUNNING')", True),
+        ("status NOT_IN ('STOPPED', 'RUNNING')", False),
+        ("parent_id EQ null", True),
+        ("parent_id NE null", False),
+        ("missing EQ 'x'", False),
+        ("missing NE 'x'", True),
+        ("missing IN ('x', null)", True),
+        ("tags.value EQ 'dba'", True),
+        ("tags.key EQ 'owner'", False),
+        ("hosts.hostname IN ('h2', 'h3')", True),
+        ("engine_ids EQ 'e2'", True),
+        ("engine_ids NE 'e2'", False),
+        ("status EQ 'FAILED' OR size GT 100", True),
+        ("status EQ 'FAILED' AND size GT 100", False),
+        ("(status EQ 'FAILED' OR name CONTAINS 'prod') AND size GT 100", True),
+    ],
+)
+def test_evaluation(expression, expected):
+    assert compile_filter(expression)(VDB) is expected
+
+
+def test_ordering_against_incomparable_values_is_false():
+    assert compile_filter("size GT 'abc'")({"size": 5}) is False
+
+
+def test_string_fields_compare_as_strings():
+    predicate = compile_filter("creation_date GE '2024-06-01'")
+    assert predicate({"creation_date": "2024-07-01T00:00:00Z"})
+    assert not predicate({"creation_date": "2024-05-31T23:59:59Z"})
+
+
+def test_objects_only_need_get():
+    class Record:
+        def __init__(self, data):
+            self.data = data
+
+        def get(self, field, default=None):
+            return self.data.get(field, default)
+
+    assert compile_filter("name EQ 'a'")(Record({"name": "a"}))
+
+
+def test_invalid_filter_raises_on_compile():
+    with pytest.raises(FilterSyntaxError):
+        compile_filter("name EQ")
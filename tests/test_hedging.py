@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from dct_mcp_server.dct_client.hedging import HedgeBudget, run_hedged
+
+
+def funded_budget():
+    budget = HedgeBudget(max_rate=1.0)
+    budget.deposit()
+    return budget
+
+
+def scripted(*attempts):
+    """Return a request whose successive calls sleep and then return or raise."""
+    attempts = iter(attempts)
+
+    async def request():
+        seconds, outcome = next(attempts)
+        await asyncio.sleep(seconds)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return request
+
+
+def hedge(request, accept=None):
+    return asyncio.run(run_hedged(request, 0.01, funded_budget(), accept=accept))
+
+
+def test_fast_primary_is_not_hedged():
+    assert hedge(scripted((0, "ok"))) == ("ok", pytest.approx(0, abs=0.01), False)
+
+
+def test_hedge_wins_over_slow_primary():
+    result, _, hedged = hedge(scripted((0.2, "slow"), (0, "fast")))
+    assert (result, hedged) == ("fast", True)
+
+
+def test_failed_attempt_waits_for_the_other():
+    result, _, _ = hedge(scripted((0.05, "slow"), (0, RuntimeError("boom"))))
+    assert result == "slow"
+
+
+def test_rejected_result_waits_for_the_other():
+    accept = lambda result: result < 500
+    result, _, hedged = hedge(scripted((0.05, 200), (0, 503)), accept)
+    assert (result, hedged) == (200, True)
+
+
+def test_rejected_result_is_returned_when_every_attempt_fails():
+    accept = lambda result: result < 500
+    result, _, _ = hedge(scripted((0.05, RuntimeError("boom")), (0, 503)), accept)
+    assert result == 503
+
+
+def test_error_is_raised_when_every_attempt_raises():
+    with pytest.raises(RuntimeError, match="first"):
+        hedge(scripted((0.02, RuntimeError("first")), (0.05, RuntimeError("second"))))
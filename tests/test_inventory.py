@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from dct_mcp_server.inventory.index import INVENTORY_COLLECTIONS, Inventory
+from dct_mcp_server.inventory.store import InventoryStore
+
+
+def make_inventory(count=5):
+    inventory = Inventory(SimpleNamespace(config={"paginate_max_items": 1000}), refresh_interval=60)
+    inventory.collections["vdbs"].replace({"id": f"vdb-{i}", "name": f"db-{i}"} for i in range(count))
+    return inventory
+
+
+def search(inventory, **params):
+    return inventory.answer("POST", "/vdbs/search", None, params, max_staleness=60)
+
+
+def test_inventory_cursor_resumes_the_listing():
+    inventory = make_inventory()
+    first = search(inventory, limit=2)
+    assert [item["id"] for item in first["items"]] == ["vdb-0", "vdb-1"]
+    rest = search(inventory, limit=10, cursor=first["response_metadata"]["next_cursor"])
+    assert [item["id"] for item in rest["items"]] == ["vdb-2", "vdb-3", "vdb-4"]
+    assert rest["response_metadata"]["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["inventory:abc", "inventory:", "inventory:-2", "inventory:1.5"])
+def test_malformed_inventory_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        search(make_inventory(), cursor=cursor)
+
+
+def test_dct_cursors_go_to_dct():
+    assert search(make_inventory(), cursor="abc") is None
+
+
+class FakeClient:
+    """Serves every inventory collection from memory, one page per search."""
+
+    base_url = "https://dct.example"
+    config = {"paginate_max_items": 1000}
+
+    def __init__(self):
+        self.data = {name: [] for name in INVENTORY_COLLECTIONS}
+        self.data["vdbs"] = [
+            {"id": "vdb-1", "status": "RUNNING", "creation_date": "2024-01-01T00:00:00Z"},
+            {"id": "vdb-2", "status": "RUNNING", "creation_date": "2024-02-01T00:00:00Z"},
+        ]
+
+    def _items(self, endpoint):
+        return self.data[next(n for n, p in INVENTORY_COLLECTIONS.items() if f"{p}/search" == endpoint)]
+
+    async def iter_search(self, endpoint):
+        for item in list(self._items(endpoint)):
+            yield item
+
+    async def iter_pages(self, endpoint, json_body=None, sort=None):
+        since = json_body["filter_expression"].split("'")[1]
+        yield SimpleNamespace(items=[item for item in self._items(endpoint) if item["creation_date"] >= since])
+
+
+def refresh_twice(tmp_path, full_sync_interval=None):
+    """Refresh, change an existing VDB, refresh again and return the inventory."""
+    client = FakeClient()
+    store = InventoryStore(tmp_path / "inventory.sqlite3", client.base_url)
+    inventory = Inventory(client, 0.2, store, full_sync_interval)
+
+    async def run():
+        await inventory.refresh()
+        client.data["vdbs"][0]["status"] = "STOPPED"
+        await asyncio.sleep(0.25)
+        await inventory.refresh()
+
+    asyncio.run(run())
+    return inventory
+
+
+def test_persisted_inventory_fully_resyncs_every_refresh(tmp_path):
+    inventory = refresh_twice(tmp_path)
+    assert inventory.get("vdbs", "vdb-1", max_staleness=0.2).get("status") == "STOPPED"
+
+
+def test_longer_full_sync_interval_refreshes_incrementally(tmp_path):
+    inventory = refresh_twice(tmp_path, full_sync_interval=3600)
+    # The incremental refresh misses the change, so the VDBs count as stale
+    assert inventory.get("vdbs", "vdb-1", max_staleness=0.2) is None
+    assert inventory.get("vdbs", "vdb-1", max_staleness=60).get("status") == "RUNNING"
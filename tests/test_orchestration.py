@@ -0,0 +1,54 @@
+import asyncio
+
+from dct_mcp_server.jobs.orchestration import GroupRefresh
+
+
+class FakeClient:
+    async def make_request(self, method, endpoint, json=None):
+        vdb_id = endpoint.split("/")[2]
+        return {"job": {"id": f"job-{vdb_id}", "status": "RUNNING"}}
+
+
+class FakePoller:
+    """Completes every job immediately except the ones that hang."""
+
+    def __init__(self, hanging=()):
+        self.hanging = set(hanging)
+
+    async def wait(self, job_id, timeout):
+        if job_id in self.hanging:
+            await asyncio.sleep(timeout)
+            return {"job": {"id": job_id, "status": "RUNNING"}, "terminal": False}
+        return {"job": {"id": job_id, "status": "COMPLETED"}, "terminal": True}
+
+
+VDBS = [
+    {"id": "v1", "name": "parent", "engine_id": "e1", "parent_id": None},
+    {"id": "v2", "name": "child", "engine_id": "e1", "parent_id": "v1"},
+    {"id": "v3", "name": "other", "engine_id": "e2", "parent_id": None},
+]
+
+
+def refresh(poller, timeout=None):
+    orchestrator = GroupRefresh(FakeClient(), poller, 4, 2, follow_timeout=0.05, timeout=timeout)
+    return asyncio.run(orchestrator.run(VDBS))
+
+
+def statuses(result):
+    return {item["id"]: item["status"] for item in result["items"]}
+
+
+def test_refreshes_every_vdb_after_its_parent():
+    result = refresh(FakePoller())
+    assert result["levels"] == [["v1", "v3"], ["v2"]]
+    assert statuses(result) == {"v1": "succeeded", "v2": "succeeded", "v3": "succeeded"}
+    assert not result["timed_out"]
+
+
+def test_unfinished_job_is_reported_pending_after_the_timeout():
+    result = refresh(FakePoller(hanging={"job-v1"}), timeout=0.2)
+    assert statuses(result) == {"v1": "pending", "v2": "skipped", "v3": "succeeded"}
+    assert result["items"][0]["job_id"] == "job-v1"
+    assert result["pending"] == 1
+    assert result["timed_out"]
+    assert result["elapsed_seconds"] < 1
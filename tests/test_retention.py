@@ -0,0 +1,106 @@
+import asyncio
+from types import SimpleNamespace
+
+from dct_mcp_server.core.filters import compile_filter
+from dct_mcp_server.inventory.retention import sweep_candidates
+
+
+class FakeClient:
+    """Serves searches from in-memory collections; creates datasets while snapshots are listed."""
+
+    def __init__(self, collections, created_during_scan=None):
+        self.collections = collections
+        self.created_during_scan = created_during_scan or {}
+
+    def _search(self, endpoint, filter_expression=None):
+        items = self.collections.get(endpoint.strip("/").split("/")[0], [])
+        if filter_expression:
+            items = [item for item in items if compile_filter(filter_expression)(item)]
+        return items
+
+    async def scan_search(self, endpoint, consume, json_body=None):
+        consume(self._search(endpoint, (json_body or {}).get("filter_expression")))
+        return {}
+
+    async def iter_search(self, endpoint, filter_expression=None, sort=None):
+        for collection, items in self.created_during_scan.items():
+            self.collections.setdefault(collection, []).extend(items)
+        for item in sorted(self._search(endpoint, filter_expression), key=lambda s: s["timestamp"]):
+            yield item
+
+    async def fetch_page(self, endpoint, json_body, limit=None, sort=None):
+        items = sorted(
+            self._search(endpoint, json_body["filter_expression"]),
+            key=lambda s: s["timestamp"],
+            reverse=sort == "-timestamp",
+        )
+        return SimpleNamespace(items=items[:limit])
+
+    async def search_by_ids(self, collection, ids):
+        return {item["id"]: item for item in self.collections.get(collection, []) if item["id"] in ids}
+
+
+def snapshot(snapshot_id, dataset_id, timestamp, **fields):
+    return {"id": snapshot_id, "dataset_id": dataset_id, "timestamp": timestamp, "size": 10, **fields}
+
+
+def sweep(client, **kwargs):
+    report = asyncio.run(sweep_candidates(client, **kwargs))
+    return {s["id"]: s["reason"] for s in report["candidates"]}, report
+
+
+def test_sweep_keeps_latest_retained_and_bookmarked_snapshots():
+    client = FakeClient(
+        {
+            "dsources": [{"id": "ds-1"}],
+            "bookmarks": [{"id": "bm-1", "snapshot_ids": ["s2"]}],
+            "snapshots": [
+                snapshot("s1", "ds-1", "2020-01-01T00:00:00Z"),
+                snapshot("s2", "ds-1", "2020-01-02T00:00:00Z"),
+                snapshot("s3", "ds-1", "2020-01-03T00:00:00Z", retain_forever=True),
+                snapshot("s4", "ds-1", "2020-01-04T00:00:00Z"),
+                snapshot("s5", "gone", "2020-01-05T00:00:00Z"),
+            ],
+        }
+    )
+    candidates, report = sweep(client, older_than_days=30)
+    assert candidates == {"s1": "age", "s5": "orphaned"}
+    assert report["kept"] == {"retain_forever": 1, "bookmark": 1, "latest": 1}
+    assert report["reclaimable_bytes"] == 20
+
+
+def test_sweep_protects_the_snapshot_a_child_vdb_was_provisioned_from():
+    client = FakeClient(
+        {
+            "dsources": [{"id": "ds-1"}],
+            "vdbs": [{"id": "vdb-1", "parent_id": "ds-1", "parent_timeflow_timestamp": "2020-01-02T12:00:00Z"}],
+            "snapshots": [
+                snapshot("s1", "ds-1", "2020-01-01T00:00:00Z"),
+                snapshot("s2", "ds-1", "2020-01-02T00:00:00Z"),
+                snapshot("s3", "ds-1", "2020-01-03T00:00:00Z"),
+            ],
+        }
+    )
+    candidates, report = sweep(client, older_than_days=30)
+    assert candidates == {"s1": "age"}
+    assert report["kept"]["vdb"] == 1
+
+
+def test_datasets_created_during_the_scan_are_not_orphaned():
+    client = FakeClient(
+        {
+            "dsources": [{"id": "ds-1"}],
+            "snapshots": [
+                snapshot("s1", "vdb-new", "2020-01-01T00:00:00Z"),
+                snapshot("s2", "vdb-new", "2020-01-02T00:00:00Z"),
+                snapshot("s3", "gone", "2020-01-03T00:00:00Z"),
+            ],
+        },
+        created_during_scan={"vdbs": [{"id": "vdb-new"}]},
+    )
+    candidates, _ = sweep(client)
+    assert candidates == {"s3": "orphaned"}
+
+    candidates, report = sweep(client, older_than_days=30)
+    assert candidates == {"s1": "age", "s3": "orphaned"}
+    assert report["kept"]["latest"] == 1
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from dct_mcp_server.jobs.scheduler import EngineQueueTimeout, EngineScheduler
+
+
+class FakePoller:
+    """Job poller whose jobs finish when the test says so."""
+
+    def __init__(self):
+        self.finished = {}
+
+    def finish(self, job_id):
+        self.finished.setdefault(job_id, asyncio.Event()).set()
+
+    async def wait(self, job_id, timeout):
+        event = self.finished.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return {"terminal": False}
+        return {"terminal": True}
+
+
+async def locate(method, endpoint, json_body):
+    return "eng-1"
+
+
+def make_scheduler(limit=1, queue_timeout=None):
+    poller = FakePoller()
+    return poller, EngineScheduler(poller, limit, 10, locate, queue_timeout)
+
+
+def start_job(job_id):
+    async def call():
+        return {"job": {"id": job_id, "status": "RUNNING"}}
+
+    return call
+
+
+def test_calls_queue_in_arrival_order():
+    async def main():
+        poller, scheduler = make_scheduler(limit=1)
+        order = []
+
+        async def run(job_id):
+            response = await scheduler.run("POST", "/vdbs/v1/stop", None, start_job(job_id))
+            order.append(job_id)
+            return response
+
+        tasks = [asyncio.ensure_future(run(f"job-{i}")) for i in range(3)]
+        await asyncio.sleep(0.01)
+        assert order == ["job-0"]
+        for i in range(2):
+            poller.finish(f"job-{i}")
+            await asyncio.sleep(0.01)
+        responses = await asyncio.gather(*tasks)
+        assert order == ["job-0", "job-1", "job-2"]
+        assert "engine_queue" not in responses[0]
+        assert responses[2]["engine_queue"]["queued_behind"] == 1
+        stats = scheduler.stats()["engines"]["eng-1"]
+        assert (stats["admitted"], stats["queued"], stats["in_flight"]) == (3, 2, 1)
+        await scheduler.stop()
+
+    asyncio.run(main())
+
+
+def test_queue_timeout_gives_up_without_sending():
+    async def main():
+        poller, scheduler = make_scheduler(limit=1, queue_timeout=0.05)
+        await scheduler.run("POST", "/vdbs/v1/stop", None, start_job("job-0"))
+        sent = []
+
+        async def call():
+            sent.append(True)
+            return {}
+
+        with pytest.raises(EngineQueueTimeout) as raised:
+            await scheduler.run("POST", "/vdbs/v2/stop", None, call)
+        assert not sent
+        assert raised.value.to_dict()["started"] is False
+        stats = scheduler.stats()["engines"]["eng-1"]
+        assert (stats["timed_out"], stats["queue_depth"], stats["in_flight"]) == (1, 0, 1)
+
+        # The slot freed by the job still goes to the next caller
+        poller.finish("job-0")
+        await asyncio.sleep(0.01)
+        assert scheduler.stats()["engines"]["eng-1"]["in_flight"] == 0
+        await scheduler.run("POST", "/vdbs/v3/stop", None, start_job("job-1"))
+        assert scheduler.stats()["engines"]["eng-1"]["in_flight"] == 1
+        await scheduler.stop()
+
+    asyncio.run(main())
+
+
+def test_reads_and_unplaced_requests_are_not_scheduled():
+    async def main():
+        poller, scheduler = make_scheduler(limit=1, queue_timeout=0.01)
+
+        async def nowhere(method, endpoint, json_body):
+            return None
+
+        await scheduler.run("POST", "/vdbs/v1/stop", None, start_job("job-0"))
+        assert await scheduler.run("POST", "/snapshots/search", None, start_job("job-1"))
+        scheduler._locate = nowhere
+        assert await scheduler.run("POST", "/vdbs/v2/stop", None, start_job("job-2"))
+        await scheduler.stop()
+
+    asyncio.run(main())
+
+
+def test_failed_call_releases_its_slot():
+    async def main():
+        poller, scheduler = make_scheduler(limit=1, queue_timeout=0.05)
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await scheduler.run("POST", "/vdbs/v1/stop", None, fail)
+        assert scheduler.stats()["engines"]["eng-1"]["in_flight"] == 0
+        await scheduler.stop()
+
+    asyncio.run(main())